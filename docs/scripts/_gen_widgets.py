@@ -5,10 +5,10 @@ import mkdocs_gen_files
 import psygnal
 
 from magicgui import widgets
-from magicgui.backends import _ipynb, _qtpy
+from magicgui.backends import _ipynb, _null, _qtpy
 
 MAKE_IMAGES = True
-BACKENDS = {"qt": _qtpy.widgets, "ipynb": _ipynb.widgets}
+BACKENDS = {"qt": _qtpy.widgets, "ipynb": _ipynb.widgets, "null": _null.widgets}
 WIDGETS_PATH = Path("api/widgets")
 IMAGES_PATH = Path("images")
 WIDGET_PAGE = """
@@ -1,19 +1,39 @@
 """magicgui is a utility for generating a GUI from a python function."""
 
-from importlib.metadata import PackageNotFoundError, version
+from __future__ import annotations
 
-try:
-    __version__ = version("magicgui")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "uninstalled"
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .application import event_loop, use_app
+    from .type_map import register_type, type_registered
+    from .type_map._magicgui import magic_factory, magicgui
 
 __author__ = """Talley Lambert"""
 __email__ = "talley.lambert@gmail.com"
 
-
-from .application import event_loop, use_app
-from .type_map import register_type, type_registered
-from .type_map._magicgui import magic_factory, magicgui
+# public names are imported when first accessed (PEP 562), so that importing
+# magicgui (e.g. only to call `register_type`) does not import all widgets.
+_LAZY_ATTRS: dict[str, str] = {
+    "event_loop": "application",
+    "use_app": "application",
+    "register_type": "type_map",
+    "type_registered": "type_map",
+    "magic_factory": "type_map._magicgui",
+    "magicgui": "type_map._magicgui",
+}
+_SUBMODULES = {
+    "application",
+    "experimental",
+    "persistence",
+    "schema",
+    "signature",
+    "tqdm",
+    "type_map",
+    "types",
+    "widgets",
+}
 
 __all__ = [
     "event_loop",
@@ -23,3 +43,26 @@ __all__ = [
     "type_registered",
     "use_app",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names and submodules when they are first accessed."""
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value: Any = version("magicgui")
+        except PackageNotFoundError:  # pragma: no cover
+            value = "uninstalled"
+    elif name in _LAZY_ATTRS:
+        value = getattr(import_module(f"{__name__}.{_LAZY_ATTRS[name]}"), name)
+    elif name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), "__version__", *_LAZY_ATTRS, *_SUBMODULES]
@@ -1,5 +1,6 @@
 import types
 import typing
+from collections import OrderedDict
 from copy import copy
 from functools import lru_cache, partial
 from importlib import import_module
@@ -70,7 +71,7 @@ def resolve_types(
 
 def _resolve_forwards(v: Any) -> Any:
     if isinstance(v, typing.ForwardRef):
-        return _try_cached_resolve(v.__forward_arg__)
+        return resolve_single_type(v.__forward_arg__)
     if getattr(v, "__args__", ()):
         v = copy(v)
         v.__args__ = tuple(_resolve_forwards(a) for a in v.__args__)
@@ -85,20 +86,51 @@ def resolve_single_type(
 ) -> Any:
     """Resolve a single type hint.
 
-    See `resolve_types` for details on parameters.
+    See `resolve_types` for details on parameters.  Classes are returned as they
+    are, and (when no namespaces are given) other hints are resolved only once.
     """
     if hint is None:
         return None
+    if isinstance(hint, type) and not isinstance(hint, types.GenericAlias):
+        return hint
+    if globalns is None and localns is None:
+        key = (hint, do_imports)
+        try:
+            resolved = _RESOLVED[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable hint (e.g. Annotated with a dict)
+            return _resolve_single_type(hint, None, None, do_imports)
+        else:
+            _RESOLVED.move_to_end(key)
+            return resolved
+        resolved = _resolve_single_type(hint, None, None, do_imports)
+        # don't keep classes that are created on the fly alive
+        if not _refers_to_local_class(resolved):
+            _RESOLVED[key] = resolved
+            if len(_RESOLVED) > _RESOLVED_MAXSIZE:
+                _RESOLVED.popitem(last=False)
+        return resolved
+    return _resolve_single_type(hint, globalns, localns, do_imports)
+
+
+def _resolve_single_type(
+    hint: Any,
+    globalns: Optional[dict[str, Any]],
+    localns: Optional[dict[str, Any]],
+    do_imports: bool,
+) -> Any:
     mock_obj = type("_T", (), {"__annotations__": {"obj": hint}})()
     hints = resolve_types(mock_obj, globalns, localns, do_imports=do_imports)
     return hints["obj"]
 
 
-_cached_resolve = lru_cache(maxsize=None)(resolve_single_type)
+# LRU cache of resolved hints: {(hint, do_imports): resolved}
+_RESOLVED: OrderedDict[tuple[Any, bool], Any] = OrderedDict()
+_RESOLVED_MAXSIZE = 1024
 
 
-def _try_cached_resolve(v: Any) -> Any:
-    try:
-        return _cached_resolve(v)
-    except TypeError:
-        return resolve_single_type(v)
+def _refers_to_local_class(hint: Any) -> bool:
+    if isinstance(hint, type) and "<locals>" in hint.__qualname__:
+        return True
+    return any(_refers_to_local_class(a) for a in getattr(hint, "__args__", ()))
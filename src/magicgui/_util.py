@@ -14,12 +14,11 @@ from typing import (
     overload,
 )
 
-from docstring_parser import DocstringParam, parse
-
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-    from typing import TypeVar
+    from collections.abc import Iterable, Sequence
+    from typing import Any, TypeVar
 
+    from docstring_parser import DocstringParam
     from typing_extensions import ParamSpec
 
     T = TypeVar("T")
@@ -275,8 +274,7 @@ def merge_super_sigs(
         The modified class (can be used as a decorator)
     """
     params = {}
-    param_docs: list[DocstringParam] = []
-    other_params: list[DocstringParam] = []
+    doc_classes: list[type] = []
     for sup in inspect.getmro(cls):
         try:
             sig = inspect.signature(sup.__init__)  # type: ignore
@@ -288,9 +286,10 @@ def merge_super_sigs(
                 continue
             params[name] = param
 
-        docstring = getattr(sup, "__doc__", "")
-        param_docs += parse(docstring).params
-        if "Parameters" in docstring:
+        doc_classes.append(sup)
+        # (don't evaluate merged docstrings here, they always have parameters)
+        docstring = sup.__dict__.get("__doc__") or ""
+        if isinstance(docstring, _MergedDoc) or "Parameters" in docstring:
             break
 
     # sphinx_autodoc_typehints isn't removing the type annotations from the signature
@@ -303,14 +302,41 @@ def merge_super_sigs(
     cls.__init__.__signature__ = inspect.Signature(  # type: ignore
         sorted(params.values(), key=lambda x: x.kind)
     )
-    param_docs = [p for p in param_docs if p.arg_name not in exclude]
-    cls.__doc__ = (cls.__doc__ or "").split("Parameters")[0].rstrip() + "\n\n"
-    cls.__doc__ += _param_list_to_str(param_docs, other_params)
+    # parsing docstrings is slow, so the docstring is only merged when first accessed
+    cls.__doc__ = _MergedDoc(cls.__doc__, doc_classes, exclude)  # type: ignore
     # this makes docs linking work... but requires that all of these be in __init__
     cls.__module__ = module
     return cls
 
 
+class _MergedDoc:
+    """Class docstring with the parameter docs of `doc_classes`, merged lazily.
+
+    (Stored as `cls.__doc__`: `type.__doc__` calls `__get__` of the stored object.)
+    """
+
+    def __init__(
+        self, doc: str | None, doc_classes: Sequence[type], exclude: Iterable[str]
+    ) -> None:
+        self._doc = doc or ""
+        self._doc_classes = doc_classes
+        self._exclude = set(exclude)
+        self._merged: str | None = None
+
+    def __get__(self, instance: Any, owner: type | None = None) -> str:
+        if self._merged is None:
+            from docstring_parser import parse
+
+            param_docs: list[DocstringParam] = []
+            for sup in self._doc_classes:
+                docstring = self._doc if sup is owner else sup.__doc__
+                param_docs += parse(docstring or "").params
+            param_docs = [p for p in param_docs if p.arg_name not in self._exclude]
+            doc = self._doc.split("Parameters")[0].rstrip() + "\n\n"
+            self._merged = doc + _param_list_to_str(param_docs, [])
+        return self._merged
+
+
 # def mergedoc(
 #     cls: type,
 #     exclude: Iterable[str] = (
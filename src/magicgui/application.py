@@ -11,8 +11,10 @@ from magicgui.backends import BACKENDS
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from concurrent.futures import ProcessPoolExecutor
     from types import ModuleType
 
+    from magicgui.persistence import PersistenceBackend
     from magicgui.widgets.protocols import BaseApplicationBackend
 DEFAULT_BACKEND = "qt"
 APPLICATION_NAME = "magicgui"
@@ -36,6 +38,10 @@ class Application:
     _instance: Application | None = None
 
     def __init__(self, backend_name: str | None = None) -> None:
+        # results of `CachedChoices`: {choices callable: (version, choices)}
+        self._choices_cache: dict[Callable, tuple[Any, list]] = {}
+        self._persistence: PersistenceBackend | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
         self._use(backend_name)
 
     @property
@@ -111,6 +117,8 @@ class Application:
         self._backend._mgui_start_timer(500, lambda: None)
         self._backend._mgui_run()
         self._backend._mgui_stop_timer()
+        if self._persistence is not None:
+            self._persistence.flush()
 
     def start_timer(
         self,
@@ -121,6 +129,85 @@ class Application:
         """Start a timer with a given interval, optional callback, and single_shot."""
         self._backend._mgui_start_timer(interval, on_timeout, single=single_shot)
 
+    @property
+    def persistence(self) -> PersistenceBackend:
+        """Backend storing the values of widgets created with ``persist=True``.
+
+        By default, a [`FileBackend`][magicgui.persistence.FileBackend] (one file
+        per widget in the user cache directory).  With many persisted widgets, a
+        single shared store is faster, for instance::
+
+            from magicgui.persistence import BufferedBackend, SQLiteBackend
+
+            use_app().persistence = BufferedBackend(SQLiteBackend())
+        """
+        if self._persistence is None:
+            from magicgui.persistence import FileBackend
+
+            self._persistence = FileBackend()
+        return self._persistence
+
+    @persistence.setter
+    def persistence(self, backend: PersistenceBackend) -> None:
+        if self._persistence is not None:
+            self._persistence.flush()
+        self._persistence = backend
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """Pool of worker processes shared by all FunctionGuis of this app.
+
+        It is used to call functions with
+        [`FunctionGui.map(..., executor="process")`][magicgui.widgets.FunctionGui.map].
+        The pool is created on first use, and its workers are kept running, so that
+        only the first calls wait for them to start.  The workers import the module
+        of each function, so they use the headless "null" backend: FunctionGuis
+        created when importing the module (e.g. by `@magicgui`) don't start a GUI
+        toolkit.  (With the "spawn" start method, the main script is also imported
+        before that, so create GUIs there under `if __name__ == "__main__":`.)
+
+        The pool may be replaced, e.g. to choose the number of workers, or set to
+        `None` to shut it down.  Pass
+        `initializer=magicgui.application.init_process_pool_worker` to new pools.
+        """
+        if self._process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._process_pool = ProcessPoolExecutor(
+                initializer=init_process_pool_worker
+            )
+        return self._process_pool
+
+    @process_pool.setter
+    def process_pool(self, pool: ProcessPoolExecutor | None) -> None:
+        if self._process_pool is not None and self._process_pool is not pool:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+        self._process_pool = pool
+
+    def invalidate_choices(self, key: Callable | None = None) -> None:
+        """Discard the cached result of choices callable `key` (or of all, if None).
+
+        See [`CachedChoices`][magicgui.widgets.CachedChoices].  The choices are
+        evaluated again the next time a widget using them resets its choices.
+        """
+        if key is None:
+            self._choices_cache.clear()
+        else:
+            self._choices_cache.pop(getattr(key, "func", key), None)
+
+    def call_in_main_thread(self, func: Callable[[], Any]) -> None:
+        """Call `func` in the main (GUI) thread.  May be called from any thread."""
+        self._backend._mgui_call_in_main_thread(func)
+
+
+def init_process_pool_worker() -> None:
+    """Use the headless "null" backend in a worker process.
+
+    This is the initializer of the workers of
+    [`Application.process_pool`][magicgui.application.Application.process_pool].
+    """
+    Application._instance = Application("null")
+
 
 def _use_app(backend_name: str | None = None) -> Application:
     """Get/create the default Application object.
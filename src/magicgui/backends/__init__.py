@@ -5,6 +5,8 @@ from __future__ import annotations
 BACKENDS: dict[str, tuple[str, str]] = {
     "Qt": ("_qtpy", "qtpy"),
     "ipynb": ("_ipynb", "ipynb"),
+    # headless backend, keeping the state of widgets in plain attributes
+    "null": ("_null", "null"),
 }
 
 for key in list(BACKENDS):
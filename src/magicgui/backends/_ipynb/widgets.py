@@ -16,7 +16,7 @@ from magicgui.types import Separator
 from magicgui.widgets import protocols
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from magicgui.widgets.bases import Widget
 
@@ -470,6 +470,13 @@ class Container(_IPyWidget, protocols.ContainerProtocol, protocols.SupportsOrien
         self._ipywidget.children = children
         widget.parent = self._ipywidget
 
+    def _mgui_insert_widgets(self, position: int, widgets: Sequence[Widget]) -> None:
+        children = list(self._ipywidget.children)
+        children[position:position] = [w.native for w in widgets]
+        self._ipywidget.children = children
+        for widget in widgets:
+            widget.parent = self._ipywidget
+
     def _mgui_remove_widget(self, widget: Widget) -> None:
         children = list(self._ipywidget.children)
         children.remove(widget.native)
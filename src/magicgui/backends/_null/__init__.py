@@ -0,0 +1,67 @@
+from .application import ApplicationBackend
+from .widgets import (
+    CheckBox,
+    ComboBox,
+    Container,
+    DateEdit,
+    DateTimeEdit,
+    Dialog,
+    FloatRangeSlider,
+    FloatSlider,
+    FloatSpinBox,
+    Image,
+    Label,
+    LineEdit,
+    LiteralEvalLineEdit,
+    MainWindow,
+    Password,
+    ProgressBar,
+    PushButton,
+    QuantityEdit,
+    RadioButton,
+    RadioButtons,
+    RangeSlider,
+    Select,
+    Slider,
+    SpinBox,
+    Table,
+    TextEdit,
+    TimeEdit,
+    ToolBar,
+    get_text_width,
+    show_file_dialog,
+)
+
+__all__ = [
+    "ApplicationBackend",
+    "CheckBox",
+    "ComboBox",
+    "Container",
+    "DateEdit",
+    "DateTimeEdit",
+    "Dialog",
+    "FloatRangeSlider",
+    "FloatSlider",
+    "FloatSpinBox",
+    "Image",
+    "Label",
+    "LineEdit",
+    "LiteralEvalLineEdit",
+    "MainWindow",
+    "Password",
+    "ProgressBar",
+    "PushButton",
+    "QuantityEdit",
+    "RadioButton",
+    "RadioButtons",
+    "RangeSlider",
+    "Select",
+    "Slider",
+    "SpinBox",
+    "Table",
+    "TextEdit",
+    "TimeEdit",
+    "ToolBar",
+    "get_text_width",
+    "show_file_dialog",
+]
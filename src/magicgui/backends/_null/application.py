@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from magicgui.widgets.protocols import BaseApplicationBackend
+
+
+class _Timer(threading.Thread):
+    """Call `callback` every `interval` ms (or once), until stopped."""
+
+    def __init__(
+        self, interval: int, callback: Callable[[], None] | None, single: bool
+    ) -> None:
+        super().__init__(daemon=True, name="magicgui-null-timer")
+        self.interval = interval
+        self.callback = callback
+        self.single = single
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval / 1000):
+            if self.callback is not None:
+                self.callback()
+            if self.single:
+                break
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+class ApplicationBackend(BaseApplicationBackend):
+    def __init__(self) -> None:
+        self._timer: _Timer | None = None
+
+    def _mgui_get_backend_name(self) -> str:
+        return "null"
+
+    def _mgui_process_events(self) -> None:
+        pass  # there are no events
+
+    def _mgui_run(self) -> None:
+        pass  # there is no event loop to run
+
+    def _mgui_quit(self) -> None:
+        pass
+
+    def _mgui_get_native_app(self) -> ApplicationBackend:
+        return self
+
+    def _mgui_start_timer(
+        self,
+        interval: int = 0,
+        on_timeout: Callable[[], None] | None = None,
+        single: bool = False,
+    ) -> None:
+        # without an event loop, `on_timeout` is called from a daemon thread
+        self._mgui_stop_timer()
+        self._timer = _Timer(interval, on_timeout, single)
+        self._timer.start()
+
+    def _mgui_stop_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
@@ -0,0 +1,861 @@
+"""Widget implementations for the headless ("null") backend.
+
+The state of each widget is kept in plain Python attributes, without any GUI
+toolkit, so widgets can be created, read, updated and called (for instance to
+validate or call a `FunctionGui` in a batch job, or in tests) without a display.
+Nothing is ever drawn.  Change callbacks are called whenever a value changes.
+"""
+
+from __future__ import annotations
+
+import datetime
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable
+
+from magicgui.types import Separator
+from magicgui.widgets import Widget, protocols
+from magicgui.widgets._concrete import _LabeledWidget
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import numpy
+
+# same as Qt's QWIDGETSIZE_MAX
+_MAX_SIZE = 16777215
+
+
+def _equal(a: Any, b: Any) -> bool:
+    try:
+        return type(a) is type(b) and bool(a == b)
+    except Exception:  # e.g. numpy arrays
+        return a is b
+
+
+def _index(values: Iterable[Any], value: Any) -> int:
+    """Return the index of the first item equal to `value`, or -1."""
+    for i, v in enumerate(values):
+        with suppress(Exception):
+            if v == value:
+                return i
+    return -1
+
+
+class NullWidget(protocols.WidgetProtocol):
+    # defaults are class attributes, so that widgets only store what was changed
+    _parent: NullWidget | None = None
+    _visible: bool | None = None  # None: neither shown nor hidden explicitly
+    _enabled = True
+    _tooltip = ""
+    _width = 0
+    _height = 0
+    _min_width = 0
+    _min_height = 0
+    _max_width = _MAX_SIZE
+    _max_height = _MAX_SIZE
+    _parent_callbacks: tuple[Callable[[Any], None], ...] = ()
+
+    def __init__(self, parent: NullWidget | None = None, **kwargs: Any) -> None:
+        if parent is not None:
+            self._parent = parent
+
+    def _set_native_parent(self, parent: NullWidget | None) -> None:
+        old = self._parent
+        if parent is old:
+            return
+        if isinstance(old, Container):
+            with suppress(ValueError):
+                old._children.remove(self)
+        self._parent = parent
+        for callback in self._parent_callbacks:
+            callback(parent)
+
+    def _mgui_close_widget(self) -> None:
+        self._visible = False
+
+    def _mgui_get_visible(self) -> bool:
+        # like Qt: a widget is visible if it is shown and all of its parents are
+        if self._visible is False:
+            return False
+        if self._parent is None:
+            return bool(self._visible)
+        return self._parent._mgui_get_visible()
+
+    def _mgui_set_visible(self, value: bool) -> None:
+        self._visible = bool(value)
+
+    def _mgui_get_enabled(self) -> bool:
+        return self._enabled
+
+    def _mgui_set_enabled(self, enabled: bool) -> None:
+        self._enabled = bool(enabled)
+
+    def _mgui_get_parent(self) -> Widget | None:
+        parent = self._parent
+        while parent is not None:
+            mgui_wdg = getattr(parent, "_magic_widget", None)
+            # the labeled widget itself should be considered a "hidden" layer.
+            if isinstance(mgui_wdg, Widget) and not isinstance(
+                mgui_wdg, _LabeledWidget
+            ):
+                return mgui_wdg
+            parent = parent._parent
+        return None
+
+    def _mgui_set_parent(self, widget: Widget | None) -> None:
+        self._set_native_parent(widget.native if widget else None)
+
+    def _mgui_get_native_widget(self) -> NullWidget:
+        return self
+
+    def _mgui_get_root_native_widget(self) -> NullWidget:
+        return self
+
+    def _mgui_bind_parent_change_callback(
+        self, callback: Callable[[Any], None]
+    ) -> None:
+        self._parent_callbacks = (*self._parent_callbacks, callback)
+
+    def _mgui_render(self) -> numpy.ndarray:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ModuleNotFoundError(
+                "could not find module 'numpy'. "
+                "Please `pip install numpy` to render widgets."
+            ) from None
+
+        # nothing is drawn: a blank image of the size of the widget
+        shape = (self._mgui_get_height(), self._mgui_get_width(), 4)
+        return np.zeros(shape, dtype=np.uint8)
+
+    def _mgui_get_width(self) -> int:
+        return min(max(self._width, self._min_width), self._max_width)
+
+    def _mgui_set_width(self, value: int) -> None:
+        self._width = int(value)
+
+    def _mgui_get_min_width(self) -> int:
+        return self._min_width
+
+    def _mgui_set_min_width(self, value: int) -> None:
+        self._min_width = int(value)
+
+    def _mgui_get_max_width(self) -> int:
+        return self._max_width
+
+    def _mgui_set_max_width(self, value: int) -> None:
+        self._max_width = int(value)
+
+    def _mgui_get_height(self) -> int:
+        return min(max(self._height, self._min_height), self._max_height)
+
+    def _mgui_set_height(self, value: int) -> None:
+        self._height = int(value)
+
+    def _mgui_get_min_height(self) -> int:
+        return self._min_height
+
+    def _mgui_set_min_height(self, value: int) -> None:
+        self._min_height = int(value)
+
+    def _mgui_get_max_height(self) -> int:
+        return self._max_height
+
+    def _mgui_set_max_height(self, value: int) -> None:
+        self._max_height = int(value)
+
+    def _mgui_get_tooltip(self) -> str:
+        return self._tooltip
+
+    def _mgui_set_tooltip(self, value: str | None) -> None:
+        self._tooltip = str(value) if value else ""
+
+
+class NullValueWidget(NullWidget, protocols.ValueWidgetProtocol):
+    _value: Any = None
+    _change_callbacks: tuple[Callable[[Any], Any], ...] = ()
+
+    def _mgui_get_value(self) -> Any:
+        return self._value
+
+    def _mgui_set_value(self, value: Any) -> None:
+        self._update_value(self._cast(value))
+
+    def _mgui_bind_change_callback(self, callback: Callable[[Any], Any]) -> None:
+        self._change_callbacks = (*self._change_callbacks, callback)
+
+    def _cast(self, value: Any) -> Any:
+        return value
+
+    def _update_value(self, value: Any) -> None:
+        if not _equal(value, self._value):
+            self._value = value
+            self._emit(value)
+
+    def _emit(self, value: Any) -> None:
+        for callback in self._change_callbacks:
+            callback(value)
+
+
+class SupportsReadOnly(protocols.SupportsReadOnly):
+    _read_only = False
+
+    def _mgui_set_read_only(self, value: bool) -> None:
+        self._read_only = bool(value)
+
+    def _mgui_get_read_only(self) -> bool:
+        return self._read_only
+
+
+class SupportsOrientation(protocols.SupportsOrientation):
+    _orientation = "horizontal"
+
+    def _mgui_set_orientation(self, value: str) -> None:
+        self._orientation = value
+
+    def _mgui_get_orientation(self) -> str:
+        return self._orientation
+
+
+# STRING WIDGETS
+
+
+class NullStringWidget(NullValueWidget):
+    _value = ""
+
+    def _cast(self, value: Any) -> str:
+        return str(value)
+
+
+class Label(NullStringWidget):
+    def _mgui_bind_change_callback(self, callback: Callable[[Any], Any]) -> None:
+        pass  # labels can't be edited
+
+
+class LineEdit(NullStringWidget):
+    pass
+
+
+class Password(NullStringWidget):
+    pass
+
+
+class LiteralEvalLineEdit(NullStringWidget):
+    def _mgui_get_value(self) -> Any:
+        from ast import literal_eval
+
+        return literal_eval(self._value)
+
+
+class TextEdit(NullStringWidget, SupportsReadOnly):
+    pass
+
+
+class Image(NullValueWidget):
+    def _mgui_bind_change_callback(self, callback: Callable[[Any], Any]) -> None:
+        pass  # images can't be edited
+
+
+class QuantityEdit(NullValueWidget):
+    pass
+
+
+# DATES AND TIMES
+
+
+class DateTimeEdit(NullValueWidget):
+    _value = datetime.datetime(2000, 1, 1)
+
+    def _cast(self, value: Any) -> Any:
+        if type(value) is datetime.date:
+            return datetime.datetime.combine(value, datetime.time())
+        return value
+
+
+class DateEdit(NullValueWidget):
+    _value = datetime.date(2000, 1, 1)
+
+    def _cast(self, value: Any) -> Any:
+        return value.date() if isinstance(value, datetime.datetime) else value
+
+
+class TimeEdit(NullValueWidget):
+    _value = datetime.time()
+
+    def _cast(self, value: Any) -> Any:
+        return value.time() if isinstance(value, datetime.datetime) else value
+
+
+# NUMBERS
+
+
+class NullRangedWidget(NullValueWidget, protocols.RangedWidgetProtocol):
+    _value: Any = 0
+    _min: float = 0
+    _max: float = 99
+    _step: float = 1
+    _adaptive_step = False
+
+    def _mgui_set_value(self, value: Any) -> None:
+        self._update_value(self._clamp(self._cast(value)))
+
+    def _clamp(self, value: Any) -> Any:
+        return min(max(value, self._min), self._max)
+
+    def _mgui_get_min(self) -> float:
+        return self._min
+
+    def _mgui_set_min(self, value: float) -> None:
+        # like Qt, keep max >= min and the value within the range
+        self._min = self._cast(value)
+        self._max = max(self._max, self._min)
+        self._mgui_set_value(self._value)
+
+    def _mgui_get_max(self) -> float:
+        return self._max
+
+    def _mgui_set_max(self, value: float) -> None:
+        self._max = self._cast(value)
+        self._min = min(self._min, self._max)
+        self._mgui_set_value(self._value)
+
+    def _mgui_get_step(self) -> float:
+        return self._step
+
+    def _mgui_set_step(self, value: float) -> None:
+        self._step = self._cast(value)
+
+    def _mgui_get_adaptive_step(self) -> bool:
+        return self._adaptive_step
+
+    def _mgui_set_adaptive_step(self, value: bool) -> None:
+        self._adaptive_step = bool(value)
+
+
+class SpinBox(NullRangedWidget):
+    def _cast(self, value: Any) -> int:
+        return int(value)
+
+
+class FloatSpinBox(NullRangedWidget):
+    _value = 0.0
+
+    def _cast(self, value: Any) -> float:
+        return float(value)
+
+
+class _NullSlider(NullRangedWidget, SupportsOrientation):
+    _readout = True
+    _tracking = True
+
+    def __init__(
+        self, readout: bool = True, orientation: str = "horizontal", **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self._mgui_set_readout_visibility(readout)
+        self._mgui_set_orientation(orientation)
+
+    def _mgui_set_readout_visibility(self, visible: bool) -> None:
+        self._readout = bool(visible)
+
+    def _mgui_get_tracking(self) -> bool:
+        return self._tracking
+
+    def _mgui_set_tracking(self, tracking: bool) -> None:
+        self._tracking = bool(tracking)
+
+
+class Slider(_NullSlider):
+    def _cast(self, value: Any) -> int:
+        return int(value)
+
+
+class FloatSlider(_NullSlider):
+    _value = 0.0
+
+    def _cast(self, value: Any) -> float:
+        return float(value)
+
+
+class RangeSlider(_NullSlider):
+    _value: Any = (0, 99)
+
+    def _mgui_set_value(self, value: Any) -> None:
+        self._update_value(tuple(self._clamp(self._cast(v)) for v in value))
+
+    def _cast(self, value: Any) -> Any:
+        return int(value)
+
+
+class FloatRangeSlider(RangeSlider):
+    _value = (0.0, 99.0)
+
+    def _cast(self, value: Any) -> Any:
+        return float(value)
+
+
+class ProgressBar(_NullSlider):
+    _tracking = False
+
+    def _cast(self, value: Any) -> int:
+        return int(value)
+
+    def _mgui_get_step(self) -> float:
+        return 1
+
+    def _mgui_set_step(self, value: float) -> None:
+        pass
+
+    def _mgui_set_tracking(self, tracking: bool) -> None:
+        pass
+
+
+# BUTTONS
+
+
+class NullButtonWidget(NullValueWidget, protocols.SupportsText, protocols.SupportsIcon):
+    _value = False
+    _text = ""
+    _icon: tuple[str | None, str | None] | None = None
+
+    def _cast(self, value: Any) -> bool:
+        return bool(value)
+
+    def _mgui_set_text(self, value: str) -> None:
+        self._text = str(value)
+
+    def _mgui_get_text(self) -> str:
+        return self._text
+
+    def _mgui_set_icon(self, value: str | None, color: str | None) -> None:
+        self._icon = (value, color)
+
+
+class PushButton(NullButtonWidget):
+    def _mgui_set_value(self, value: Any) -> None:
+        pass  # like Qt, push buttons are not checkable
+
+
+class CheckBox(NullButtonWidget):
+    pass
+
+
+class RadioButton(NullButtonWidget):
+    pass
+
+
+# CATEGORICAL
+
+
+class ComboBox(NullValueWidget, protocols.CategoricalWidgetProtocol):
+    _current = -1
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # (text, data) of all items, including separators
+        self._items: list[tuple[str, Any]] = []
+
+    def _find_text(self, text: str) -> int:
+        return next((i for i, item in enumerate(self._items) if item[0] == text), -1)
+
+    def _set_current(self, index: int) -> None:
+        if index != self._current:
+            self._current = index
+            self._emit(self._mgui_get_value())
+
+    def _mgui_get_value(self) -> Any:
+        return self._items[self._current][1] if self._current >= 0 else None
+
+    def _mgui_set_value(self, value: Any) -> None:
+        self._set_current(_index((item[1] for item in self._items), value))
+
+    def _mgui_get_count(self) -> int:
+        return sum(1 for item in self._items if item[1] is not Separator)
+
+    def _mgui_get_choice(self, choice_name: str) -> Any:
+        index = self._find_text(choice_name)
+        return None if index == -1 else self._items[index][1]
+
+    def _mgui_get_current_choice(self) -> str:
+        return self._items[self._current][0] if self._current >= 0 else ""
+
+    def _mgui_set_choice(self, choice_name: str, data: Any) -> None:
+        index = -1 if data is Separator else self._find_text(choice_name)
+        if index == -1:
+            self._items.append((choice_name, data))
+            if self._current == -1:
+                self._set_current(0)
+        else:
+            self._items[index] = (choice_name, data)
+
+    def _mgui_set_choices(self, choices: Iterable[tuple[str, Any]]) -> None:
+        choices_ = list(choices)
+        if not choices_:
+            self._items = []
+            self._set_current(-1)
+            return
+
+        # like the Qt backend: keep the remaining items in place, and append new ones
+        current = self._mgui_get_current_choice()
+        choice_names = {x[0] for x in choices_}
+        items = [item for item in self._items if item[0] in choice_names]
+        text_index = {item[0]: i for i, item in reversed(list(enumerate(items)))}
+        for name, data in choices_:
+            if data is Separator:
+                items.append((name, data))
+            elif (index := text_index.get(name, -1)) == -1:
+                text_index[name] = len(items)
+                items.append((name, data))
+            else:
+                items[index] = (name, data)
+        self._items = items
+        if current not in choice_names:
+            # previous value was not in the new choices so select the first one
+            self._current = text_index[choices_[0][0]]
+            self._emit(self._mgui_get_value())
+        else:
+            self._current = text_index[current]
+
+    def _mgui_del_choice(self, choice_name: str) -> None:
+        index = self._find_text(choice_name)
+        if index == -1:
+            return
+        del self._items[index]
+        if index < self._current:
+            self._current -= 1
+        elif index == self._current:
+            self._current = min(index, len(self._items) - 1)
+            self._emit(self._mgui_get_value())
+
+    def _mgui_get_choices(self) -> tuple[tuple[str, Any], ...]:
+        return tuple(item for item in self._items if item[1] is not Separator)
+
+
+class Select(NullValueWidget, protocols.CategoricalWidgetProtocol):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # [text, data, selected] of all items
+        self._items: list[list] = []
+
+    def _selected(self) -> list[list]:
+        return [item for item in self._items if item[2]]
+
+    def _emit_if_changed(self, selected_prev: list[list]) -> None:
+        selected_post = self._selected()
+        if [id(i) for i in selected_prev] != [id(i) for i in selected_post]:
+            self._emit([item[1] for item in selected_post])
+
+    def _mgui_get_value(self) -> list[Any]:
+        return [item[1] for item in self._items if item[2]]
+
+    def _mgui_set_value(self, value: Any) -> None:
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        selected_prev = self._selected()
+        for item in self._items:
+            item[2] = _index(value, item[1]) != -1
+        self._emit_if_changed(selected_prev)
+
+    def _mgui_get_count(self) -> int:
+        return len(self._items)
+
+    def _mgui_get_choice(self, choice_name: str) -> list[Any]:
+        return [item[1] for item in self._items if item[0] == choice_name]
+
+    def _mgui_get_current_choice(self) -> list[str]:  # type: ignore[override]
+        return [item[0] for item in self._items if item[2]]
+
+    def _mgui_set_choice(self, choice_name: str, data: Any) -> None:
+        items = [item for item in self._items if item[0] == choice_name]
+        if not items:
+            self._items.append([choice_name, data, False])
+        for item in items:
+            item[1] = data
+
+    def _mgui_set_choices(self, choices: Iterable[tuple[str, Any]]) -> None:
+        choices_ = list(choices)
+        selected_prev = self._selected()
+        choice_names = {x[0] for x in choices_}
+        self._items = [item for item in self._items if item[0] in choice_names]
+        for name, data in choices_:
+            self._mgui_set_choice(name, data)
+        self._emit_if_changed(selected_prev)
+
+    def _mgui_del_choice(self, choice_name: str) -> None:
+        selected_prev = self._selected()
+        self._items = [item for item in self._items if item[0] != choice_name]
+        self._emit_if_changed(selected_prev)
+
+    def _mgui_get_choices(self) -> tuple[tuple[str, Any], ...]:
+        return tuple((item[0], item[1]) for item in self._items)
+
+
+class RadioButtons(
+    NullValueWidget, protocols.CategoricalWidgetProtocol, SupportsOrientation
+):
+    _orientation = "vertical"
+    _current = -1  # index of the checked button
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # (text, data) of all buttons
+        self._items: list[tuple[str, Any]] = []
+
+    def _mgui_get_value(self) -> Any:
+        return self._items[self._current][1] if self._current >= 0 else None
+
+    def _mgui_set_value(self, value: Any) -> None:
+        index = _index((item[1] for item in self._items), value)
+        if index != -1 and index != self._current:
+            self._current = index
+            self._emit(self._mgui_get_value())
+
+    def _mgui_get_current_choice(self) -> str:
+        return self._items[self._current][0] if self._current >= 0 else None  # type: ignore[return-value]
+
+    def _mgui_get_count(self) -> int:
+        return len(self._items)
+
+    def _mgui_get_choice(self, choice_name: str) -> Any:
+        return next((d for name, d in self._items if name == choice_name), None)
+
+    def _mgui_set_choice(self, choice_name: str, data: Any) -> None:
+        for i, item in enumerate(self._items):
+            if item[0] == choice_name:
+                self._items[i] = (choice_name, data)
+                return
+        self._items.append((choice_name, data))
+
+    def _mgui_del_choice(self, choice_name: str) -> None:
+        for i, item in enumerate(self._items):
+            if item[0] == choice_name:
+                del self._items[i]
+                if i == self._current:
+                    self._current = -1
+                elif i < self._current:
+                    self._current -= 1
+                return
+
+    def _mgui_get_choices(self) -> tuple[tuple[str, Any], ...]:
+        return tuple(self._items)
+
+    def _mgui_set_choices(self, choices: Iterable[tuple[str, Any]]) -> None:
+        current = self._mgui_get_value()
+        self._items = list(choices)
+        self._current = -1
+        self._mgui_set_value(current)
+
+
+# CONTAINERS
+
+
+class Container(NullWidget, protocols.ContainerProtocol, SupportsOrientation):
+    _margins = (0, 0, 0, 0)
+
+    def __init__(
+        self, layout: str = "vertical", scrollable: bool = False, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self._orientation = layout
+        self._children: list[NullWidget] = []
+
+    def _mgui_insert_widget(self, position: int, widget: Widget) -> None:
+        self._mgui_insert_widgets(position, [widget])
+
+    def _mgui_insert_widgets(self, position: int, widgets: Sequence[Widget]) -> None:
+        natives = [widget.native for widget in widgets]
+        for native in natives:
+            native._set_native_parent(self)
+            # (re-)inserting a child moves it
+            with suppress(ValueError):
+                self._children.remove(native)
+        self._children[position:position] = natives
+
+    def _mgui_remove_widget(self, widget: Widget) -> None:
+        native = widget.native
+        with suppress(ValueError):
+            self._children.remove(native)
+        native._set_native_parent(None)
+
+    def _mgui_get_margins(self) -> tuple[int, int, int, int]:
+        return self._margins
+
+    def _mgui_set_margins(self, margins: tuple[int, int, int, int]) -> None:
+        self._margins = tuple(margins)  # type: ignore[assignment]
+
+
+class MainWindow(Container, protocols.MainWindowProtocol):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # menu name -> [(action name, callback, shortcut)]
+        self._menus: dict[str, list[tuple[str, Callable | None, str | None]]] = {}
+
+    def _mgui_create_menu_item(
+        self,
+        menu_name: str,
+        action_name: str,
+        callback: Callable | None = None,
+        shortcut: str | None = None,
+    ) -> None:
+        self._menus.setdefault(menu_name, []).append((action_name, callback, shortcut))
+
+
+class Dialog(Container, protocols.DialogProtocol):
+    def _mgui_exec(self) -> bool:
+        return False  # there is nobody to accept the dialog
+
+
+class ToolBar(NullWidget, protocols.ToolBarProtocol):
+    _icon_size: tuple[int, int] | None = None
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # ("button", text, icon, callback), ("separator",), ("spacer",) or
+        # ("widget", native widget)
+        self._items: list[tuple] = []
+
+    def _mgui_add_button(
+        self, text: str, icon: str, callback: Callable | None = None
+    ) -> None:
+        self._items.append(("button", text, icon, callback))
+
+    def _mgui_add_separator(self) -> None:
+        self._items.append(("separator",))
+
+    def _mgui_add_spacer(self) -> None:
+        self._items.append(("spacer",))
+
+    def _mgui_add_widget(self, widget: Widget) -> None:
+        widget.native._set_native_parent(self)
+        self._items.append(("widget", widget.native))
+
+    def _mgui_get_icon_size(self) -> tuple[int, int] | None:
+        return self._icon_size
+
+    def _mgui_set_icon_size(self, size: int | tuple[int, int] | None) -> None:
+        if isinstance(size, int):
+            size = (size, size)
+        self._icon_size = None if size is None else (size[0], size[1])
+
+    def _mgui_clear(self) -> None:
+        self._items = []
+
+
+# TABLE
+
+
+def _maybefloat(text: str | None) -> Any:
+    if not text:
+        return None
+    try:
+        return int(text) if text.isdigit() else float(text)
+    except ValueError:
+        return text
+
+
+class Table(NullWidget, protocols.TableWidgetProtocol, SupportsReadOnly):
+    _row_count = 0
+    _column_count = 0
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._cells: dict[tuple[int, int], Any] = {}
+        # like Qt, headers are stored as text (None if not set)
+        self._row_headers: list[str | None] = []
+        self._column_headers: list[str | None] = []
+
+    def _mgui_get_row_count(self) -> int:
+        return self._row_count
+
+    def _mgui_set_row_count(self, nrows: int) -> None:
+        self._row_count = nrows
+        self._cells = {k: v for k, v in self._cells.items() if k[0] < nrows}
+        del self._row_headers[nrows:]
+        self._row_headers += [None] * (nrows - len(self._row_headers))
+
+    def _mgui_remove_row(self, row: int) -> None:
+        self._cells = {
+            (r - (r > row), c): v for (r, c), v in self._cells.items() if r != row
+        }
+        del self._row_headers[row]
+        self._row_count -= 1
+
+    def _mgui_get_column_count(self) -> int:
+        return self._column_count
+
+    def _mgui_set_column_count(self, ncols: int) -> None:
+        self._column_count = ncols
+        self._cells = {k: v for k, v in self._cells.items() if k[1] < ncols}
+        del self._column_headers[ncols:]
+        self._column_headers += [None] * (ncols - len(self._column_headers))
+
+    def _mgui_remove_column(self, column: int) -> None:
+        self._cells = {
+            (r, c - (c > column)): v for (r, c), v in self._cells.items() if c != column
+        }
+        del self._column_headers[column]
+        self._column_count -= 1
+
+    def _mgui_get_cell(self, row: int, col: int) -> Any:
+        return self._cells.get((row, col))
+
+    def _mgui_set_cell(self, row: int, col: int, value: Any) -> None:
+        if value is None:
+            self._cells.pop((row, col), None)
+            return
+        if isinstance(value, Widget):
+            value.native._set_native_parent(self)
+        self._cells[(row, col)] = value
+
+    def _mgui_get_row_headers(self) -> tuple:
+        return tuple(_maybefloat(h) for h in self._row_headers if h is not None)
+
+    def _mgui_set_row_headers(self, headers: Sequence) -> None:
+        # like Qt, setting more headers than rows adds rows
+        if len(headers) > self._row_count:
+            self._mgui_set_row_count(len(headers))
+        self._row_headers[: len(headers)] = map(str, headers)
+
+    def _mgui_get_column_headers(self) -> tuple:
+        return tuple(_maybefloat(h) for h in self._column_headers if h is not None)
+
+    def _mgui_set_column_headers(self, headers: Sequence) -> None:
+        if len(headers) > self._column_count:
+            self._mgui_set_column_count(len(headers))
+        self._column_headers[: len(headers)] = map(str, headers)
+
+    def _mgui_bind_row_headers_change_callback(
+        self, callback: Callable[[Any], None]
+    ) -> None:
+        pass  # headers only change programmatically
+
+    def _mgui_bind_column_headers_change_callback(
+        self, callback: Callable[[Any], None]
+    ) -> None:
+        pass  # headers only change programmatically
+
+    def _mgui_bind_change_callback(self, callback: Callable[[Any], Any]) -> None:
+        pass  # cells are never edited by a user
+
+    # all of the get/set value logic happens in magicgui.widgets.Table
+    def _mgui_get_value(self) -> Any:
+        pass
+
+    def _mgui_set_value(self, value: Any) -> None:
+        pass
+
+
+def show_file_dialog(
+    mode: Any = None,
+    caption: str | None = None,
+    start_path: str | None = None,
+    filter: str | None = None,
+    parent: Any = None,
+) -> str | None:
+    return None  # there is nobody to pick a file
+
+
+def get_text_width(text: str) -> int:
+    """Return a rough estimate of the width of ``text`` (there is no font)."""
+    return 7 * len(text)
@@ -1,6 +1,6 @@
 import sys
 
-from qtpy.QtCore import QCoreApplication, Qt, QTimer
+from qtpy.QtCore import QCoreApplication, QObject, Qt, QTimer, Signal
 from qtpy.QtWidgets import QApplication
 
 try:
@@ -12,9 +12,26 @@ from magicgui.application import APPLICATION_NAME
 from magicgui.widgets.protocols import BaseApplicationBackend
 
 
+class _MainThreadInvoker(QObject):
+    """Calls functions emitted from any thread in the thread it was created in."""
+
+    call = Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.call.connect(self._call)
+
+    def _call(self, func):
+        func()
+
+
 class ApplicationBackend(BaseApplicationBackend):
     _app: QCoreApplication
 
+    def __init__(self) -> None:
+        # created here, in the main thread, so that calls are queued to it
+        self._invoker = _MainThreadInvoker()
+
     def _mgui_get_backend_name(self):
         return "qt"
 
@@ -53,3 +70,6 @@ class ApplicationBackend(BaseApplicationBackend):
     def _mgui_stop_timer(self):
         if getattr(self, "_timer", None):
             self._timer.stop()
+
+    def _mgui_call_in_main_thread(self, func):
+        self._invoker.call.emit(func)
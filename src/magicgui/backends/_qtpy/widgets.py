@@ -182,17 +182,28 @@ class QBaseWidget(protocols.WidgetProtocol):
             ) from None
 
         img = self._qwidget.grab().toImage()
-        if img.format() != QImage.Format_ARGB32:
-            img = img.convertToFormat(QImage.Format_ARGB32)
-        bits = img.constBits()
+        if img.format() != QImage.Format.Format_RGBA8888:
+            img = img.convertToFormat(QImage.Format.Format_RGBA8888)
         h, w, c = img.height(), img.width(), 4
         if qtpy.API_NAME.startswith("PySide"):
-            arr = np.array(bits).reshape(h, w, c)
-        else:
-            bits.setsize(h * w * c)
-            arr = np.frombuffer(bits, np.uint8).reshape(h, w, c)  # type: ignore
-
-        return arr[:, :, [2, 1, 0, 3]]
+            arr = np.array(img.constBits()).reshape(h, img.bytesPerLine() // c, c)
+            return arr[:, :w]
+        # a view of the QImage pixels, which keeps the QImage alive
+        return np.asarray(_QImageArray(img))
+
+
+class _QImageArray:
+    """Exposes the pixels of an RGBA8888 QImage to numpy without copying."""
+
+    def __init__(self, img: QImage) -> None:
+        self._img = img  # referenced by the array's ``base``
+        self.__array_interface__ = {
+            "shape": (img.height(), img.width(), 4),
+            "strides": (img.bytesPerLine(), 4, 1),
+            "typestr": "|u1",
+            "data": (int(img.bits()), False),
+            "version": 3,
+        }
 
 
 class QBaseValueWidget(QBaseWidget, protocols.ValueWidgetProtocol):
@@ -533,6 +544,21 @@ class Container(
 
     def _mgui_insert_widget(self, position: int, widget: Widget):
         self._layout.insertWidget(position, widget.native)
+        self._update_scroll_min_size()
+
+    def _mgui_insert_widgets(self, position: int, widgets: Sequence[Widget]):
+        # suspend repaints while the layout is filled, then relayout once
+        native = self._mgui_get_native_widget()
+        updates_enabled = native.updatesEnabled()
+        native.setUpdatesEnabled(False)
+        try:
+            for i, widget in enumerate(widgets):
+                self._layout.insertWidget(position + i, widget.native)
+        finally:
+            native.setUpdatesEnabled(updates_enabled)
+        self._update_scroll_min_size()
+
+    def _update_scroll_min_size(self) -> None:
         if self._is_scrollable:
             min_size = self._layout.totalMinimumSize()
             if isinstance(self._layout, QtW.QHBoxLayout):
@@ -890,10 +916,64 @@ class ComboBox(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(QtW.QComboBox, "isChecked", "setCurrentIndex", "", **kwargs)
         self._qwidget.currentIndexChanged.connect(self._emit_data)
+        # lazily built lookup tables (text -> index, data -> index), which are
+        # invalidated whenever the items of the model change.
+        self._text_index: dict[str, int] | None = None
+        self._data_index: tuple[dict[Any, int], list[tuple[int, Any]]] | None = None
+        model = self._qwidget.model()
+        for signal in (
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.dataChanged,
+            model.modelReset,
+            model.layoutChanged,
+        ):
+            signal.connect(self._invalidate_index)
 
     def _emit_data(self, index: int):
         self._event_filter.valueChanged.emit(self._qwidget.itemData(index))
 
+    def _invalidate_index(self, *_: Any) -> None:
+        self._text_index = self._data_index = None
+
+    def _find_text(self, text: str) -> int:
+        """Return index of the first item with `text`, or -1 (like findText)."""
+        if self._text_index is None:
+            wdg = self._qwidget
+            # iterate backwards, so that the first of duplicate texts wins
+            self._text_index = {
+                wdg.itemText(i): i for i in reversed(range(wdg.count()))
+            }
+        return self._text_index.get(text, -1)
+
+    def _find_data(self, value: Any) -> int:
+        """Return index of the first item with data equal to `value`, or -1."""
+        if self._data_index is None:
+            wdg = self._qwidget
+            hashable: dict[Any, int] = {}
+            unhashable: list[tuple[int, Any]] = []
+            for i in range(wdg.count()):
+                data = wdg.itemData(i)
+                try:
+                    hashable.setdefault(data, i)
+                except TypeError:
+                    unhashable.append((i, data))
+            self._data_index = (hashable, unhashable)
+        hashable, unhashable = self._data_index
+        try:
+            idx = hashable.get(value, -1)
+        except TypeError:  # unhashable value: compare with every item
+            wdg = self._qwidget
+            return next((i for i in range(wdg.count()) if wdg.itemData(i) == value), -1)
+        # an unhashable item that compares equal may come first
+        for i, data in unhashable:
+            if 0 <= idx < i:
+                break
+            if data == value:
+                return i
+        return idx
+
     def _mgui_bind_change_callback(self, callback):
         self._event_filter.valueChanged.connect(callback)
 
@@ -906,7 +986,7 @@ class ComboBox(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
         )
 
     def _mgui_get_choice(self, choice_name: str) -> Any:
-        item_index = self._qwidget.findText(choice_name)
+        item_index = self._find_text(choice_name)
         return None if item_index == -1 else self._qwidget.itemData(item_index)
 
     def _mgui_get_current_choice(self) -> str:
@@ -918,9 +998,7 @@ class ComboBox(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
     def _mgui_set_value(self, value) -> None:
         # Note: there's a bug in PyQt6, where CombBox.findData(value) will not
         # find the data if value is an Enum. So we do it manually
-        wdg = self._qwidget
-        idx = next((i for i in range(wdg.count()) if wdg.itemData(i) == value), -1)
-        self._qwidget.setCurrentIndex(idx)
+        self._qwidget.setCurrentIndex(self._find_data(value))
 
     def _mgui_set_choice(self, choice_name: str, data: Any) -> None:
         """Set data for ``choice_name``."""
@@ -929,7 +1007,7 @@ class ComboBox(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
             self._qwidget.insertSeparator(item_index)  # itemData is None
             self._qwidget.setItemData(item_index, Separator)
         else:
-            item_index = self._qwidget.findText(choice_name)
+            item_index = self._find_text(choice_name)
             # if it's not in the list, add a new item
             if item_index == -1:
                 self._qwidget.addItem(choice_name, data)
@@ -944,32 +1022,40 @@ class ComboBox(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
             self._qwidget.clear()
             return
 
-        with _signals_blocked(self._qwidget):
-            choice_names = [x[0] for x in choices_]
+        wdg = self._qwidget
+        with _signals_blocked(wdg):
+            choice_names = {x[0] for x in choices_}
             # remove choices that no longer exist
-            current = self._qwidget.itemText(self._qwidget.currentIndex())
-            for i in reversed(range(self._qwidget.count())):
-                if self._qwidget.itemText(i) not in choice_names:
-                    self._qwidget.removeItem(i)
-            # update choices and insert separators
+            current = wdg.itemText(wdg.currentIndex())
+            for i in reversed(range(wdg.count())):
+                if wdg.itemText(i) not in choice_names:
+                    wdg.removeItem(i)
+            # update choices and insert separators, tracking the index of each
+            # text locally (the lookup table is invalidated by every change)
+            text_index = {wdg.itemText(i): i for i in reversed(range(wdg.count()))}
             for name, data in choices_:
-                self._mgui_set_choice(name, data)
+                if data is Separator:
+                    self._mgui_set_choice(name, data)
+                elif (item_index := text_index.get(name, -1)) == -1:
+                    text_index[name] = wdg.count()
+                    wdg.addItem(name, data)
+                else:
+                    wdg.setItemData(item_index, data)
             # if the currently selected item is not in the new set,
             # remove it and select the first item in the list
-            current2 = self._qwidget.itemText(self._qwidget.currentIndex())
+            current2 = wdg.itemText(wdg.currentIndex())
             if current not in choice_names:
                 # previous value was not in the new choices so set first element
-                first = choice_names[0]
-                self._qwidget.setCurrentIndex(self._qwidget.findText(first))
+                wdg.setCurrentIndex(self._find_text(choices_[0][0]))
             elif current2 != current:
                 # element is present but order is different
-                self._qwidget.setCurrentIndex(self._qwidget.findText(current))
+                wdg.setCurrentIndex(self._find_text(current))
         if current not in choice_names:
-            self._emit_data(self._qwidget.currentIndex())
+            self._emit_data(wdg.currentIndex())
 
     def _mgui_del_choice(self, choice_name: str) -> None:
         """Delete choice_name."""
-        item_index = self._qwidget.findText(choice_name)
+        item_index = self._find_text(choice_name)
         if item_index >= 0:
             self._qwidget.removeItem(item_index)
 
@@ -1018,11 +1104,22 @@ class Select(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
     def _mgui_set_value(self, value) -> None:
         if not isinstance(value, (list, tuple)):
             value = [value]
+        try:
+            lookup: set[Any] | Sequence[Any] = set(value)
+        except TypeError:  # unhashable values
+            lookup = value
+
+        def _in_value(data: Any) -> bool:
+            try:
+                return data in lookup
+            except TypeError:  # unhashable data
+                return data in value
+
         selected_prev = self._qwidget.selectedItems()
         with _signals_blocked(self._qwidget):
             for i in range(self._qwidget.count()):
                 item = self._qwidget.item(i)
-                item.setSelected(item.data(Qt.ItemDataRole.UserRole) in value)
+                item.setSelected(_in_value(item.data(Qt.ItemDataRole.UserRole)))
         selected_post = self._qwidget.selectedItems()
         if selected_prev != selected_post:
             self._emit_data()
@@ -1047,16 +1144,26 @@ class Select(QBaseValueWidget, protocols.CategoricalWidgetProtocol):
             self._qwidget.clear()
             return
 
-        with _signals_blocked(self._qwidget):
-            choice_names = [x[0] for x in choices_]
-            selected_prev = self._qwidget.selectedItems()
+        wdg = self._qwidget
+        with _signals_blocked(wdg):
+            choice_names = {x[0] for x in choices_}
+            selected_prev = wdg.selectedItems()
             # remove choices that no longer exist
-            for i in reversed(range(self._qwidget.count())):
-                if self._qwidget.item(i).text() not in choice_names:
-                    self._qwidget.takeItem(i)
+            for i in reversed(range(wdg.count())):
+                if wdg.item(i).text() not in choice_names:
+                    wdg.takeItem(i)
             # update choices
+            items: dict[str, list[QtW.QListWidgetItem]] = {}
+            for i in range(wdg.count()):
+                item = wdg.item(i)
+                items.setdefault(item.text(), []).append(item)
             for name, data in choices_:
-                self._mgui_set_choice(name, data)
+                if name not in items:
+                    item = QtW.QListWidgetItem(name)
+                    wdg.addItem(item)
+                    items[name] = [item]
+                for item in items[name]:
+                    item.setData(Qt.ItemDataRole.UserRole, data)
             selected_post = self._qwidget.selectedItems()
         if selected_prev != selected_post:
             self._emit_data()
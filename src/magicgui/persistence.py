@@ -0,0 +1,245 @@
+"""Backends storing the state of persisted widgets (e.g. `FunctionGui(persist=True)`).
+
+The state of a widget is a mapping of widget names to pickled values, stored under a
+string key (for a `FunctionGui`, its `module.qualname`).  Backends only receive the
+values that changed since the last write.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
+from weakref import WeakSet
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = ["BufferedBackend", "FileBackend", "PersistenceBackend", "SQLiteBackend"]
+
+
+class PersistenceBackend(ABC):
+    """Storage for the persisted state of widgets, keyed by a string."""
+
+    @abstractmethod
+    def read(self, key: str) -> dict[str, bytes]:
+        """Return the state stored under `key` (empty if there is none)."""
+
+    @abstractmethod
+    def write(self, key: str, changes: Mapping[str, bytes]) -> None:
+        """Merge `changes` into the state stored under `key`."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Discard the state stored under `key`."""
+
+    def flush(self) -> None:  # noqa: B027
+        """Write any buffered changes (no-op for unbuffered backends)."""
+
+
+class FileBackend(PersistenceBackend):
+    """Store the state of each key in its own pickle file.
+
+    Files are replaced atomically (written to a temporary file that is then renamed),
+    so a crash while saving never leaves a truncated file behind.
+
+    Parameters
+    ----------
+    directory : str | Path | None, optional
+        Directory of the files.  By default, `magicgui._util.user_cache_dir()`.
+        Absolute keys are used as paths as they are.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = directory
+
+    def path(self, key: str) -> Path:
+        """Return the path of the file storing `key`."""
+        if self.directory is None:
+            from magicgui._util import user_cache_dir
+
+            return user_cache_dir() / key
+        return Path(self.directory) / key
+
+    def read(self, key: str) -> dict[str, bytes]:
+        """Return the state stored under `key` (empty if there is none)."""
+        path = self.path(key)
+        if not path.exists():
+            return {}
+        data = pickle.loads(path.read_bytes())
+        if not isinstance(data, dict):
+            raise TypeError(f"Invalid widget state file: {path}")
+        return data
+
+    def write(self, key: str, changes: Mapping[str, bytes]) -> None:
+        """Merge `changes` into the state stored under `key`."""
+        if not changes:
+            return
+        try:
+            data = self.read(key)
+        except Exception:
+            data = {}
+        data.update(changes)
+
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pickle.dumps(data))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        """Discard the state stored under `key`."""
+        self.path(key).unlink(missing_ok=True)
+
+
+class SQLiteBackend(PersistenceBackend):
+    """Store the state of all keys in a single SQLite database.
+
+    Compared to one file per key, this needs a single file to be opened at startup,
+    and saving only writes the changed values.  The database uses write-ahead
+    logging, so readers (e.g. other processes) don't block writers.
+
+    Parameters
+    ----------
+    path : str | Path | None, optional
+        Path of the database file.  By default, ``state.sqlite`` in
+        `magicgui._util.user_cache_dir()`.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        if path is None:
+            from magicgui._util import user_cache_dir
+
+            path = user_cache_dir() / "state.sqlite"
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS state (key TEXT, name TEXT, value BLOB, "
+                "PRIMARY KEY (key, name)) WITHOUT ROWID"
+            )
+            self._conn = conn
+        return self._conn
+
+    def read(self, key: str) -> dict[str, bytes]:
+        """Return the state stored under `key` (empty if there is none)."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT name, value FROM state WHERE key = ?", (key,)
+            )
+            return dict(rows.fetchall())
+
+    def write(self, key: str, changes: Mapping[str, bytes]) -> None:
+        """Merge `changes` into the state stored under `key`."""
+        if not changes:
+            return
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO state VALUES (?, ?, ?)",
+                [(key, name, value) for name, value in changes.items()],
+            )
+
+    def delete(self, key: str) -> None:
+        """Discard the state stored under `key`."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM state WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection (it is reopened when needed)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# buffered backends that still need to be flushed at exit
+_BUFFERED: WeakSet[BufferedBackend] = WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for backend in list(_BUFFERED):
+        backend.flush()
+
+
+class BufferedBackend(PersistenceBackend):
+    """In-memory write-back cache in front of another backend.
+
+    States are read from `backend` once and then kept in memory.  Changes are
+    collected and written to `backend` at most every `interval` seconds (from a
+    background thread), when `flush` is called, and at interpreter exit.
+
+    Parameters
+    ----------
+    backend : PersistenceBackend
+        The backend to read from and write to.
+    interval : float, optional
+        Seconds after a change within which it is written to `backend`, by default 2.
+    """
+
+    def __init__(self, backend: PersistenceBackend, interval: float = 2) -> None:
+        self.backend = backend
+        self.interval = interval
+        self._cache: dict[str, dict[str, bytes]] = {}
+        self._pending: dict[str, dict[str, bytes]] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        _BUFFERED.add(self)
+
+    def read(self, key: str) -> dict[str, bytes]:
+        """Return the state stored under `key` (empty if there is none)."""
+        with self._lock:
+            if key not in self._cache:
+                state = self.backend.read(key)
+                state.update(self._pending.get(key, {}))
+                self._cache[key] = state
+            return dict(self._cache[key])
+
+    def write(self, key: str, changes: Mapping[str, bytes]) -> None:
+        """Merge `changes` into the state stored under `key`."""
+        if not changes:
+            return
+        with self._lock:
+            if key in self._cache:
+                self._cache[key].update(changes)
+            self._pending.setdefault(key, {}).update(changes)
+            if self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def delete(self, key: str) -> None:
+        """Discard the state stored under `key`."""
+        with self._lock:
+            self._cache.pop(key, None)
+            self._pending.pop(key, None)
+            self.backend.delete(key)
+
+    def flush(self) -> None:
+        """Write all pending changes to the wrapped backend."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+            for key, changes in pending.items():
+                self.backend.write(key, changes)
+            self.backend.flush()
@@ -355,9 +355,9 @@ class UiField(Generic[T]):
 
         Note that this will also return the origin type for Annotated types.
         """
-        from magicgui._type_resolution import _try_cached_resolve
+        from magicgui._type_resolution import resolve_single_type
 
-        return _try_cached_resolve(self.type)
+        return resolve_single_type(self.type)
 
     @property
     def is_annotated_type(self) -> bool:
@@ -202,20 +202,27 @@ class MagicParameter(inspect.Parameter):
         type_map: TypeMap | None = None,
     ) -> Widget:
         """Create and return a widget for this object."""
+        return self._widget_constructor(app, type_map)()
+
+    def _widget_constructor(
+        self,
+        app: AppRef | None = None,
+        type_map: TypeMap | None = None,
+    ) -> Callable[[], Widget]:
+        """Return a callable creating the widget for this object (see `to_widget`)."""
         from magicgui.type_map import TypeMap
 
         value = Undefined if self.default in (self.empty, TZ_EMPTY) else self.default
         if type_map is None:
             type_map = TypeMap.global_instance()
-        widget = type_map.create_widget(
+        return type_map._widget_constructor(
             name=self.name,
             value=value,
             annotation=self.annotation,
+            param_kind=self.kind,
             app=app,
             raise_on_unknown=self.raise_on_unknown,
         )
-        widget.param_kind = self.kind
-        return widget
 
     @classmethod
     def from_widget(cls, widget: Widget) -> MagicParameter:
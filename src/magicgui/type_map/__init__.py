@@ -1,17 +1,39 @@
 """Functions that map python types to widgets."""
 
-from ._type_map import (
-    TypeMap,
-    get_widget_class,
-    register_type,
-    type2callback,
-    type_registered,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._type_map import (
+        TypeMap,
+        get_widget_class,
+        register_table_type,
+        register_type,
+        type2callback,
+        type_registered,
+    )
 
 __all__ = [
     "TypeMap",
     "get_widget_class",
+    "register_table_type",
     "register_type",
     "type2callback",
     "type_registered",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the type map (and with it, all widgets) when first accessed."""
+    if name in __all__:
+        from . import _type_map
+
+        value = getattr(_type_map, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *__all__]
@@ -14,12 +14,12 @@ from collections import defaultdict
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from enum import EnumMeta
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
     Callable,
-    ForwardRef,
     Literal,
     TypeVar,
     Union,
@@ -83,6 +83,11 @@ _ADDITIONAL_KWARGS_DEFAULTS: dict[type, dict[str, Any]] = {
     Sequence[pathlib.Path]: {"mode": "rm"}
 }
 
+# dotted names of (optional) types shown in a Table when returned
+_TABLE_TYPES_DEFAULTS = ["pandas.DataFrame", "numpy.ndarray"]
+# table types that have been looked up in their (imported) module
+_TABLE_TYPE_CACHE: dict[str, type] = {}
+
 
 class TypeMap:
     """Storage for mapping from types to widgets and callbacks."""
@@ -95,6 +100,7 @@ class TypeMap:
         type_defs: dict | None = None,
         return_callbacks: dict | None = None,
         additional_kwargs: dict | None = None,
+        table_types: list[str] | None = None,
     ):
         if simple_types is None:
             simple_types = _SIMPLE_TYPES_DEFAULTS.copy()
@@ -109,6 +115,12 @@ class TypeMap:
             list, return_callbacks or {}
         )
         self._additional_kwargs = additional_kwargs
+        if table_types is None:
+            table_types = _TABLE_TYPES_DEFAULTS.copy()
+        self._table_types = table_types
+        # incremented whenever registered widget types change, so that widget types
+        # picked earlier (e.g. by FunctionGui templates) can be invalidated
+        self._version = 0
 
     @staticmethod
     def global_instance() -> TypeMap:
@@ -123,6 +135,7 @@ class TypeMap:
             type_defs=self._type_defs.copy(),
             return_callbacks=self._return_callbacks.copy(),
             additional_kwargs=self._additional_kwargs.copy(),
+            table_types=self._table_types.copy(),
         )
 
     def match_type(self, type_: Any, default: Any | None = None) -> WidgetTuple | None:
@@ -166,23 +179,35 @@ class TypeMap:
         if type_ is widgets.Table:
             return widgets.Table, {}
 
-        table_types = []
-        for type_name in ("pandas.DataFrame", "numpy.ndarray"):
-            try:
-                table_types.append(resolve_single_type(type_name))
-            except ModuleNotFoundError:
-                # if the type cannot be resolved, it is not available
-                pass
-
-        if any(
-            safe_issubclass(type_, tt)
-            for tt in table_types
-            if not isinstance(tt, ForwardRef)
-        ):
+        if any(safe_issubclass(type_, tt) for tt in self._loaded_table_types()):
             return widgets.Table, {}
 
         return None
 
+    def register_table_type(self, type_name: str) -> None:
+        """Show return values of type `type_name` in a [Table][magicgui.widgets.Table].
+
+        `type_name` is the dotted name of the class (e.g. ``"polars.DataFrame"``), so
+        that registering it does not import its module.  The class is only looked up
+        once its module has been imported by someone else.
+        """
+        if type_name not in self._table_types:
+            self._table_types.append(type_name)
+
+    def _loaded_table_types(self) -> Iterator[type]:
+        """Yield the registered table types whose module has been imported."""
+        for type_name in self._table_types:
+            if (cls := _TABLE_TYPE_CACHE.get(type_name)) is None:
+                module_name, _, attr = type_name.rpartition(".")
+                if (module := sys.modules.get(module_name)) is None:
+                    # if the module was not imported, there can't be instances
+                    continue
+                cls = getattr(module, attr, None)
+                if not isinstance(cls, type):
+                    continue
+                _TABLE_TYPE_CACHE[type_name] = cls
+            yield cls
+
     @overload
     def register_type(
         self,
@@ -313,6 +338,7 @@ class TypeMap:
                 self._type_defs[resolved_type] = prev_type_def
             else:
                 self._type_defs.pop(resolved_type, None)
+            self._version += 1
 
     def type2callback(self, type_: type) -> list[ReturnCallback]:
         """Return any callbacks that have been registered for ``type_``.
@@ -475,6 +501,39 @@ class TypeMap:
         assert wdg.value == ""
         ```
         """
+        return self._widget_constructor(
+            value=value,
+            annotation=annotation,
+            name=name,
+            param_kind=param_kind,
+            label=label,
+            gui_only=gui_only,
+            app=app,
+            widget_type=widget_type,
+            options=options,
+            is_result=is_result,
+            raise_on_unknown=raise_on_unknown,
+        )()
+
+    def _widget_constructor(
+        self,
+        value: Any = Undefined,
+        annotation: Any | None = None,
+        name: str = "",
+        param_kind: str | inspect._ParameterKind = "POSITIONAL_OR_KEYWORD",
+        label: str | None = None,
+        gui_only: bool = False,
+        app: AppRef = None,
+        widget_type: str | type[WidgetProtocol] | None = None,
+        options: dict | None = None,
+        is_result: bool = False,
+        raise_on_unknown: bool = True,
+    ) -> Callable[[], widgets.Widget]:
+        """Pick the widget class for `create_widget`, return a callable creating it.
+
+        The returned callable may be called repeatedly to create identical widgets,
+        without picking the widget class again.
+        """
         options_ = options.copy() if options is not None else {}
         kwargs = {
             "value": value,
@@ -503,10 +562,12 @@ class TypeMap:
             )
 
             if issubclass(wdg_class, widgets.Widget):
-                widget = wdg_class(**{**kwargs, **opts, **options_})
-                if param_kind:
-                    widget.param_kind = param_kind
-                return widget
+                return partial(
+                    _construct_widget,
+                    wdg_class,
+                    {**kwargs, **opts, **options_},
+                    param_kind,
+                )
 
         # pick the appropriate subclass for the given protocol
         # order matters
@@ -515,10 +576,12 @@ class TypeMap:
             if isinstance(wdg_class, prot):
                 options_ = kwargs.pop("options", None)
                 cls = getattr(widgets.bases, f"{p}Widget")
-                widget = cls(**{**kwargs, **(options_ or {}), "widget_type": wdg_class})
-                if param_kind:
-                    widget.param_kind = param_kind
-                return widget  # type: ignore[no-any-return]
+                return partial(
+                    _construct_widget,
+                    cls,
+                    {**kwargs, **(options_ or {}), "widget_type": wdg_class},
+                    param_kind,
+                )
 
         raise TypeError(f"{wdg_class!r} does not implement any known widget protocols")
 
@@ -1020,6 +1083,7 @@ class TypeMap:
         _options = cast("dict", options)
 
         previous_widget = self._type_defs.get(resolved_type)
+        self._version += 1
 
         if "choices" in _options:
             self._type_defs[resolved_type] = (widgets.ComboBox, _options)
@@ -1087,11 +1151,23 @@ class TypeMap:
 
 _GLOBAL_TYPE_MAP = TypeMap()
 get_widget_class = _GLOBAL_TYPE_MAP.get_widget_class
+register_table_type = _GLOBAL_TYPE_MAP.register_table_type
 register_type = _GLOBAL_TYPE_MAP.register_type
 type2callback = _GLOBAL_TYPE_MAP.type2callback
 type_registered = _GLOBAL_TYPE_MAP.type_registered
 
 
+def _construct_widget(
+    cls: Callable[..., widgets.Widget],
+    kwargs: dict[str, Any],
+    param_kind: str | inspect._ParameterKind,
+) -> widgets.Widget:
+    widget = cls(**kwargs)
+    if param_kind:
+        widget.param_kind = param_kind
+    return widget
+
+
 def _is_none_type(type_: Any) -> bool:
     return any(type_ is x for x in {None, type(None), Literal[None]})
 
@@ -9,69 +9,125 @@ to the function.
 
 """
 
-from functools import partial
+from __future__ import annotations
 
-from ._concrete import (
-    CheckBox,
-    ComboBox,
-    Container,
-    DateEdit,
-    DateTimeEdit,
-    Dialog,
-    EmptyWidget,
-    FileEdit,
-    FloatRangeSlider,
-    FloatSlider,
-    FloatSpinBox,
-    Label,
-    LineEdit,
-    ListEdit,
-    LiteralEvalLineEdit,
-    LogSlider,
-    MainWindow,
-    Password,
-    ProgressBar,
-    PushButton,
-    QuantityEdit,
-    RadioButton,
-    RadioButtons,
-    RangeEdit,
-    RangeSlider,
-    Select,
-    SliceEdit,
-    Slider,
-    SpinBox,
-    TextEdit,
-    TimeEdit,
-    ToolBar,
-    TupleEdit,
-)
-from ._dialogs import request_values, show_file_dialog
-from ._function_gui import FunctionGui, MainFunctionGui
-from ._image import Image
-from ._table import Table
-from .bases import Widget, create_widget
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._concrete import (
+        CheckBox,
+        ComboBox,
+        Container,
+        DateEdit,
+        DateTimeEdit,
+        Dialog,
+        EmptyWidget,
+        FileEdit,
+        FloatRangeSlider,
+        FloatSlider,
+        FloatSpinBox,
+        Label,
+        LineEdit,
+        ListEdit,
+        LiteralEvalLineEdit,
+        LogSlider,
+        MainWindow,
+        Password,
+        ProgressBar,
+        PushButton,
+        QuantityEdit,
+        RadioButton,
+        RadioButtons,
+        RangeEdit,
+        RangeSlider,
+        Select,
+        SliceEdit,
+        Slider,
+        SpinBox,
+        TextEdit,
+        TimeEdit,
+        ToolBar,
+        TupleEdit,
+    )
+    from ._dialogs import request_values, show_file_dialog
+    from ._function_gui import FunctionGui, MainFunctionGui, MapRun
+    from ._image import Image
+    from ._lazy_choices import CachedChoices, LazyChoices
+    from ._table import Table
+    from .bases import Widget, create_widget, render_widgets
+
+# widgets are only imported when they are first accessed (PEP 562), so that
+# importing magicgui does not import every widget (and its dependencies)
+_LAZY_ATTRS: dict[str, str] = {
+    "CheckBox": "_concrete",
+    "ComboBox": "_concrete",
+    "Container": "_concrete",
+    "DateEdit": "_concrete",
+    "DateTimeEdit": "_concrete",
+    "Dialog": "_concrete",
+    "EmptyWidget": "_concrete",
+    "FileEdit": "_concrete",
+    "FloatRangeSlider": "_concrete",
+    "FloatSlider": "_concrete",
+    "FloatSpinBox": "_concrete",
+    "Label": "_concrete",
+    "LineEdit": "_concrete",
+    "ListEdit": "_concrete",
+    "LiteralEvalLineEdit": "_concrete",
+    "LogSlider": "_concrete",
+    "MainWindow": "_concrete",
+    "Password": "_concrete",
+    "ProgressBar": "_concrete",
+    "PushButton": "_concrete",
+    "QuantityEdit": "_concrete",
+    "RadioButton": "_concrete",
+    "RadioButtons": "_concrete",
+    "RangeEdit": "_concrete",
+    "RangeSlider": "_concrete",
+    "Select": "_concrete",
+    "SliceEdit": "_concrete",
+    "Slider": "_concrete",
+    "SpinBox": "_concrete",
+    "TextEdit": "_concrete",
+    "TimeEdit": "_concrete",
+    "ToolBar": "_concrete",
+    "TupleEdit": "_concrete",
+    "request_values": "_dialogs",
+    "show_file_dialog": "_dialogs",
+    "FunctionGui": "_function_gui",
+    "MainFunctionGui": "_function_gui",
+    "MapRun": "_function_gui",
+    "Image": "_image",
+    "CachedChoices": "_lazy_choices",
+    "LazyChoices": "_lazy_choices",
+    "Table": "_table",
+    "Widget": "bases",
+    "create_widget": "bases",
+    "render_widgets": "bases",
+}
 
 #: Aliases for compatibility with ipywidgets.  (WIP)
-IntSlider = Slider
-FloatLogSlider = LogSlider
-IntText = SpinBox
-BoundedIntText = SpinBox
-FloatText = FloatSpinBox
-BoundedFloatText = FloatSpinBox
-ToggleButton = RadioButton
-Checkbox = CheckBox
-Dropdown = ComboBox
-Text = LineEdit
-Textarea = TextEdit
-Combobox = ComboBox
-DatePicker = DateTimeEdit
-Box = Container
-HBox = partial(Container, layout="horizontal")
-VBox = partial(Container, layout="vertical")
-Button = PushButton
+_ALIASES: dict[str, str] = {
+    "IntSlider": "Slider",
+    "FloatLogSlider": "LogSlider",
+    "IntText": "SpinBox",
+    "BoundedIntText": "SpinBox",
+    "FloatText": "FloatSpinBox",
+    "BoundedFloatText": "FloatSpinBox",
+    "ToggleButton": "RadioButton",
+    "Checkbox": "CheckBox",
+    "Dropdown": "ComboBox",
+    "Text": "LineEdit",
+    "Textarea": "TextEdit",
+    "Combobox": "ComboBox",
+    "DatePicker": "DateTimeEdit",
+    "Box": "Container",
+    "Button": "PushButton",
+}
 
 __all__ = [
+    "CachedChoices",
     "CheckBox",
     "ComboBox",
     "Container",
@@ -86,12 +142,14 @@ __all__ = [
     "FunctionGui",
     "Image",
     "Label",
+    "LazyChoices",
     "LineEdit",
     "ListEdit",
     "LiteralEvalLineEdit",
     "LogSlider",
     "MainFunctionGui",
     "MainWindow",
+    "MapRun",
     "Password",
     "ProgressBar",
     "PushButton",
@@ -111,8 +169,28 @@ __all__ = [
     "TupleEdit",
     "Widget",
     "create_widget",
+    "render_widgets",
     "request_values",
     "show_file_dialog",
 ]
 
-del partial
+
+def __getattr__(name: str) -> Any:
+    """Import widgets when they are first accessed."""
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(f"{__name__}.{_LAZY_ATTRS[name]}"), name)
+    elif name in _ALIASES:
+        value = __getattr__(_ALIASES[name])
+    elif name in ("HBox", "VBox"):
+        from functools import partial
+
+        layout = "horizontal" if name == "HBox" else "vertical"
+        value = partial(__getattr__("Container"), layout=layout)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_LAZY_ATTRS, *_ALIASES, "HBox", "VBox"]
@@ -34,6 +34,7 @@ from magicgui._util import merge_super_sigs, safe_issubclass
 from magicgui.application import use_app
 from magicgui.types import ChoicesType, FileDialogMode, PathLike, Undefined, _Undefined
 from magicgui.widgets.bases import (
+    BaseContainerWidget,
     BaseValueWidget,
     ButtonWidget,
     CategoricalWidget,
@@ -51,9 +52,12 @@ from magicgui.widgets.bases import (
     create_widget,
 )
 from magicgui.widgets.bases._mixins import _OrientationMixin, _ReadOnlyMixin
+from magicgui.widgets.bases._widget import _blocked_if_created
+from magicgui.widgets.bases._widget_pool import WidgetPool
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Sequence
+    from weakref import ReferenceType
 
     from typing_extensions import Unpack
 
@@ -659,6 +663,8 @@ class ListEdit(ValuedContainerWidget[list[_V]]):
         **container_kwargs: Unpack[ValuedContainerKwargs],
     ) -> None:
         self._args_type: type | None = None
+        # removed child widgets, reused by _add_child
+        self._child_pool: WidgetPool[_ListEditChildWidget] = WidgetPool()
         container_kwargs.setdefault("layout", "horizontal")
         container_kwargs.setdefault("labels", False)
         super().__init__(**container_kwargs)
@@ -683,7 +689,7 @@ class ListEdit(ValuedContainerWidget[list[_V]]):
         button_plus.changed.connect(lambda: self._append_value())
 
         for a in _value:
-            self._append_value(a)
+            self._add_child(a)
 
         self.btn_plus = button_plus
 
@@ -727,14 +733,16 @@ class ListEdit(ValuedContainerWidget[list[_V]]):
 
         self._annotation = value
         self._args_type = arg
+        # pooled child widgets were made for the previous type
+        self._child_pool.clear()
 
     def __delitem__(self, key: int | slice) -> None:
         """Delete child widget(s)."""
         if isinstance(key, int):
-            self._pop_widget(key)
+            self._recycle_child(key)
         elif isinstance(key, slice):
             for i in range(*key.indices(len(self))):
-                self._pop_widget(i)
+                self._recycle_child(i)
         else:
             raise TypeError(
                 f"{self.__class__.__name__} indices must be integers or slices, got "
@@ -743,9 +751,36 @@ class ListEdit(ValuedContainerWidget[list[_V]]):
         self.changed.emit(self.value)
 
     def _append_value(self, value: _V | _Undefined = Undefined) -> None:
-        """Create a new child value widget and append it."""
+        """Append a child value widget and emit the changed signal."""
+        self._add_child(value)
+        self.changed.emit(self.value)
+
+    def _add_child(self, value: _V | _Undefined = Undefined) -> None:
+        """Append a child value widget, reusing a previously removed one if possible."""
         i = len(self) - 1
 
+        # a pooled widget keeps its old value, so it is only reused if it will get
+        # a new one (a fresh widget is needed to start from the default value)
+        widget = None
+        if value is not Undefined or i > 0:
+            widget = self._child_pool.take(self._args_type)
+        if widget is None:
+            widget = self._create_child(i)
+        else:
+            widget.value_widget.name = f"value_{i}"
+        self._insert_widget(i, widget)
+
+        # Value must be set after new widget is inserted because it could be
+        # valid only after same parent is shared between widgets.
+        if value is Undefined and i > 0:
+            # copy value from the previous child widget if possible
+            value = self._get_child_widget(i - 1).value
+        if value is not Undefined:
+            with widget.changed.blocked():
+                widget.value = value
+
+    def _create_child(self, i: int) -> _ListEditChildWidget[_V]:
+        """Create a new child value widget, connected to this ListEdit."""
         _value_widget = create_widget(
             annotation=self._args_type,
             name=f"value_{i}",
@@ -755,22 +790,18 @@ class ListEdit(ValuedContainerWidget[list[_V]]):
 
         # connect the minus-button-clicked event
         def _remove_me() -> None:
-            self._pop_widget(self.index(widget))
+            self._recycle_child(self.index(widget))
             self.changed.emit(self.value)
 
         widget.btn_minus.changed.connect(_remove_me)
-        self._insert_widget(i, widget)
-
-        # Value must be set after new widget is inserted because it could be
-        # valid only after same parent is shared between widgets.
-        if value is Undefined and i > 0:
-            # copy value from the previous child widget if possible
-            value = self._get_child_widget(i - 1).value
-        if value is not Undefined:
-            widget.value = value
-
         widget.changed.connect(lambda: self.changed.emit(self.value))
-        self.changed.emit(self.value)
+        return widget
+
+    def _recycle_child(self, index: int) -> None:
+        """Remove the child widget at `index`, keeping it for reuse."""
+        widget = self._pop_widget(index)
+        if isinstance(widget, _ListEditChildWidget):
+            self._child_pool.put(self._args_type, widget)
 
     def _get_child_widget(self, key: int) -> _ListEditChildWidget[_V]:
         if key < 0:
@@ -788,11 +819,18 @@ class ListEdit(ValuedContainerWidget[list[_V]]):
         return list(ListDataView(self))
 
     def set_value(self, vals: Iterable[_V]) -> None:
+        vals = list(vals)
+        children = self._get_child_widgets(slice(None))
         with self.changed.blocked():
-            for _ in range(len(self) - 1):
-                self._pop_widget(0)
-            for v in vals:
-                self._append_value(v)
+            # reuse existing children by position, only add/remove the difference.
+            # (children's changed is blocked too: forwarding it computes the value)
+            for w, v in zip(children, vals):
+                with w.changed.blocked():
+                    w.value = v
+            for _ in range(len(children) - len(vals)):
+                self._recycle_child(len(self) - 2)
+            for v in vals[len(children) :]:
+                self._add_child(v)
         self.changed.emit(self.value)
 
     @property
@@ -852,16 +890,25 @@ class ListDataView(Generic[_V]):
         if isinstance(key, int):
             self._obj._get_child_widget(key).value = cast("_V", value)
         elif isinstance(key, slice):
-            with self._obj.changed.blocked():
-                if isinstance(value, type(self._obj._get_child_widget(0).value)):
-                    for w in self._obj._get_child_widgets(key):
+            children = self._obj._get_child_widgets(key)
+            if isinstance(value, type(self._obj._get_child_widget(0).value)):
+                for w in children:
+                    with w.changed.blocked():
                         w.value = value
-                else:
-                    value_list = list(value)  # type: ignore
-                    if len(value_list) != len(self._obj._get_child_widgets(key)):
-                        raise ValueError("Length of value does not match.")
-                    for w, v in zip(self._obj._get_child_widgets(key), value_list):
-                        w.value = v
+                self._obj.changed.emit(self._obj.value)
+                return
+            value_list = list(value)  # type: ignore
+            if len(value_list) != len(children):
+                if key.step not in (None, 1):
+                    raise ValueError("Length of value does not match.")
+                # resize like a list, reusing the existing child widgets
+                new_value = list(self)
+                new_value[key] = value_list
+                self._obj.set_value(new_value)
+                return
+            for w, v in zip(children, value_list):
+                with w.changed.blocked():
+                    w.value = v
             self._obj.changed.emit(self._obj.value)
         else:
             raise TypeError(
@@ -1002,6 +1049,10 @@ class ToolBar(ToolBarWidget):
 class _LabeledWidget(Container):
     """Simple container that wraps a widget and provides a label."""
 
+    _reset_choices_on_parent_change = False
+    # the container this widget was inserted into
+    _container_ref: ReferenceType[BaseContainerWidget] | None = None
+
     def __init__(  # type: ignore [misc]  # overlap between argument names
         self,
         widget: Widget,
@@ -1015,14 +1066,38 @@ class _LabeledWidget(Container):
         _visible = False if widget._explicitly_hidden else None
         self._label_widget = Label(value=label or widget.label, tooltip=widget.tooltip)
         super().__init__(**kwargs, visible=_visible)
-        self.native_parent_changed.disconnect()  # don't need _LabeledWidget to trigger
         self.labels = False  # important to avoid infinite recursion during insert!
-        self._inner_widget.label_changed.connect(self._on_label_change)
+        if isinstance(widget, (BaseValueWidget, BaseContainerWidget)):
+            widget.changed.connect(self._on_inner_change)
         for w in [self._label_widget, widget]:
-            with w.native_parent_changed.blocked():
-                self.append(w)
+            with _blocked_if_created(w, "native_parent_changed"):
+                self._insert_widget(len(self), w)
         self.margins = (0, 0, 0, 0)
 
+    def _set_inner_widget(self, widget: Widget) -> None:
+        """Wrap `widget`, reusing this (previously released) label wrapper."""
+        self._inner_widget = widget
+        widget._labeled_widget_ref = ref(self)
+        self._label_widget.value = widget.label
+        self._label_widget.tooltip = widget.tooltip
+        self._label_widget.min_width = 0
+        if widget._explicitly_hidden:
+            self.hide()
+        if isinstance(widget, (BaseValueWidget, BaseContainerWidget)):
+            widget.changed.connect(self._on_inner_change)
+        with _blocked_if_created(widget, "native_parent_changed"):
+            self._insert_widget(len(self), widget)
+
+    def _release_inner_widget(self) -> None:
+        """Remove the wrapped widget, so that this label wrapper may be reused."""
+        widget = self._inner_widget
+        if isinstance(widget, (BaseValueWidget, BaseContainerWidget)):
+            widget.changed.disconnect(self._on_inner_change)
+        widget._labeled_widget_ref = None
+        with _blocked_if_created(widget, "native_parent_changed"):
+            self._pop_widget(len(self) - 1)
+        self._inner_widget = None  # type: ignore [assignment]
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"Labeled{self._inner_widget!r}"
@@ -1044,8 +1119,15 @@ class _LabeledWidget(Container):
     def label(self, label: str) -> None:
         self._label_widget.label = label
 
+    def _on_inner_change(self) -> None:
+        self.changed.emit(self)
+
     def _on_label_change(self, value: str) -> None:
+        # called directly by the inner widget, rather than connected to its
+        # `label_changed`, so that its signal instance needn't be created
         self._label_widget.value = value
+        if self._container_ref and (container := self._container_ref()) is not None:
+            container._unify_label_widths()
 
     @property
     def label_width(self) -> int:
@@ -6,35 +6,51 @@ The core `magicgui` decorator returns an instance of a FunctionGui widget.
 from __future__ import annotations
 
 import inspect
+import pickle
 import re
+import warnings
 from collections import deque
-from contextlib import contextmanager
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, suppress
+from copy import copy
+from dataclasses import dataclass
+from functools import cache, partial
+from importlib import import_module
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Generic,
+    Literal,
     NoReturn,
     TypeVar,
     cast,
 )
+from weakref import WeakKeyDictionary, finalize, ref
 
 from psygnal import Signal
 
 from magicgui._type_resolution import resolve_single_type
-from magicgui.signature import MagicSignature, magic_signature
+from magicgui.signature import (
+    MagicParameter,
+    MagicSignature,
+    _make_hashable,
+    magic_signature,
+)
 from magicgui.widgets import Container, MainWindow, ProgressBar, PushButton
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Executor, Future
     from pathlib import Path
 
     from typing_extensions import ParamSpec
 
     from magicgui.application import Application, AppRef  # noqa: F401
     from magicgui.type_map import TypeMap
-    from magicgui.widgets import TextEdit
+    from magicgui.widgets import TextEdit, Widget
     from magicgui.widgets.bases import BaseValueWidget
     from magicgui.widgets.protocols import ContainerProtocol, MainWindowProtocol
 
@@ -43,20 +59,43 @@ else:
     _P = TypeVar("_P")  # easier runtime dependency than ParamSpec
 
 
-def _inject_tooltips_from_docstrings(
-    docstring: str | None, sig: MagicSignature
-) -> None:
-    """Update `sig` gui options with tooltips extracted from `docstring`."""
-    from docstring_parser import parse
+# tooltips parsed from the docstrings of functions: {function: (docstring, tooltips)}
+_DOC_TOOLTIPS: WeakKeyDictionary[Callable, tuple[str, dict[str, str]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _inject_tooltips_from_docstrings(function: Callable, sig: MagicSignature) -> None:
+    """Update `sig` gui options with tooltips extracted from the docstring."""
+    for argname, desc in _docstring_tooltips(function).items():
+        # some docstring params may be mislabeled and not appear in the params
+        if argname in sig.parameters:
+            # use setdefault so as not to override an explicitly provided tooltip
+            sig.parameters[argname].options.setdefault("tooltip", desc)
 
+
+def _docstring_tooltips(function: Callable) -> dict[str, str]:
+    """Return {parameter name: description} from the docstring of `function`.
+
+    Parsing docstrings is slow, so the result is cached for each function object.
+    """
+    docstring = function.__doc__
     if not docstring:
-        return
+        return {}
+    # (bound methods are created on each access, cache their function instead)
+    function = getattr(function, "__func__", function)
+    try:
+        cached = _DOC_TOOLTIPS.get(function)
+    except TypeError:  # not weak-referenceable
+        cached = None
+    if cached is not None and cached[0] == docstring:
+        return cached[1]
+
+    from docstring_parser import parse
 
     doc_params: dict[str, str | None] = {
         p.arg_name: p.description for p in parse(docstring).params
     }
-    if not doc_params:
-        return
 
     # deal with the (numpydocs) case when there are multiple parameters separated
     # by a comma
@@ -65,22 +104,309 @@ def _inject_tooltips_from_docstrings(
             for split_key in k.split(","):
                 doc_params[split_key.strip()] = v
             del doc_params[k]
+    tooltips: dict[str, str] = {}
     for name, description in doc_params.items():
         # this is to catch potentially bad arg_name parsing in docstring_parser
         # if using napoleon style google docstringss
         argname = name.split(" ", maxsplit=1)[0]
         desc = description.replace("`", "") if description else ""
-        # some docstring params may be mislabeled and not appear in the params
-        if argname in sig.parameters:
-            # use setdefault so as not to override an explicitly provided tooltip
-            sig.parameters[argname].options.setdefault("tooltip", desc)
+        tooltips.setdefault(argname, desc)
+
+    with suppress(TypeError):
+        _DOC_TOOLTIPS[function] = (docstring, tooltips)
+    return tooltips
+
+
+class _FunctionGuiTemplate:
+    """The signature of a function, with the widget constructor of each parameter.
+
+    Inspecting the function and picking widget types is done once; FunctionGuis for
+    the same function and options (e.g. created by a `MagicFactory`) reuse the most
+    recent template for the function.  If only the options of some parameters
+    differ, a new template is derived from it, in which only the widgets of those
+    parameters are picked again.  A template is no longer used once the types
+    registered in its `TypeMap` have changed.  Templates don't reference their
+    function, which is the key of their entry in `_TEMPLATES` (the entry would never
+    be removed otherwise).
+    """
+
+    def __init__(
+        self,
+        function: Callable,
+        param_options: dict[str, dict],
+        raise_on_unknown: bool,
+        tooltips: bool,
+        app: AppRef,
+        type_map: TypeMap,
+    ) -> None:
+        self.settings = (raise_on_unknown, tooltips, app)
+        self.type_map = type_map
+        self.type_map_version = type_map._version
+        sig = magic_signature(
+            function, gui_options=param_options, raise_on_unknown=raise_on_unknown
+        )
+        if tooltips:
+            _inject_tooltips_from_docstrings(function, sig)
+        self.signature = sig
+        # parameters without the options, to derive templates with other options
+        self.raw_parameters = list(inspect.signature(function).parameters.values())
+        self.options = {k: _make_hashable(v) for k, v in param_options.items()}
+        self.return_annotation = resolve_single_type(sig.return_annotation)
+        self.constructors = [
+            p._widget_constructor(app, type_map) for p in sig.parameters.values()
+        ]
+
+    @classmethod
+    def get(
+        cls,
+        function: Callable,
+        param_options: dict[str, dict],
+        raise_on_unknown: bool,
+        tooltips: bool,
+        app: AppRef,
+        type_map: TypeMap,
+    ) -> _FunctionGuiTemplate:
+        """Return a (cached or derived) template for these arguments."""
+        try:
+            template = _TEMPLATES.get(function)
+        except TypeError:  # not weak-referenceable
+            template = None
+        if (
+            template is None
+            or template.type_map is not type_map
+            or template.type_map_version != type_map._version
+            or template.settings != (raise_on_unknown, tooltips, app)
+            or not set(param_options).issubset(template.signature.parameters)
+            or not all(isinstance(v, dict) for v in param_options.values())
+        ):
+            template = cls(
+                function, param_options, raise_on_unknown, tooltips, app, type_map
+            )
+        else:
+            template = template._derive(function, param_options)
+        with suppress(TypeError):
+            _TEMPLATES[function] = template
+        return template
+
+    def _derive(
+        self, function: Callable, param_options: dict[str, dict]
+    ) -> _FunctionGuiTemplate:
+        """Return template with `param_options`, re-using unchanged parameters."""
+        options = {k: _make_hashable(v) for k, v in param_options.items()}
+        params = list(self.signature.parameters.values())
+        constructors = list(self.constructors)
+        changed = False
+        for i, param in enumerate(params):
+            with suppress(Exception):  # e.g. options with arrays can't be compared
+                if options.get(param.name) == self.options.get(param.name):
+                    continue
+            changed = True
+            params[i] = MagicParameter.from_parameter(
+                self.raw_parameters[i],
+                param_options.get(param.name),
+                raise_on_unknown=self.settings[0],
+            )
+        if not changed:
+            return self
 
+        new = copy(self)
+        new.options = options
+        new.signature = MagicSignature(
+            params, return_annotation=self.signature.return_annotation
+        )
+        if self.settings[1]:
+            _inject_tooltips_from_docstrings(function, new.signature)
+        app, type_map = self.settings[2], self.type_map
+        new.constructors = [
+            c if p is old else p._widget_constructor(app, type_map)
+            for c, p, old in zip(
+                constructors, params, self.signature.parameters.values()
+            )
+        ]
+        return new
+
+    def widgets(self) -> list[Widget]:
+        """Create the widgets of all parameters."""
+        return [constructor() for constructor in self.constructors]
+
+
+class _WeakBind:
+    """Bind callback returning `obj`, without keeping a reference to it."""
+
+    def __init__(self, obj: object) -> None:
+        self._ref = ref(obj)
+
+    def __call__(self, widget: Any) -> Any:
+        return self._ref()
+
+
+# most recent template of each function
+_TEMPLATES: WeakKeyDictionary[Callable, _FunctionGuiTemplate] = WeakKeyDictionary()
 
 _R = TypeVar("_R")
 _KT = TypeVar("_KT")
 _VT = TypeVar("_VT")
 
 
+@dataclass(frozen=True)
+class _CallSpec:
+    """A call of the function of a FunctionGui, that can be made in another process.
+
+    Functions defined at the top level of a module are referenced by their name:
+    decorating a function with `@magicgui` replaces it with its FunctionGui in the
+    module, so pickle could not find it.  Other callables are pickled as they are.
+    """
+
+    function: Callable | tuple[str, str]
+    args: tuple
+    kwargs: dict[str, Any]
+
+    @classmethod
+    def create(cls, function: Callable, args: tuple, kwargs: dict) -> _CallSpec:
+        qualname = getattr(function, "__qualname__", "<")
+        if isinstance(function, FunctionType) and "<" not in qualname:
+            return cls((function.__module__, qualname), args, kwargs)
+        return cls(function, args, kwargs)
+
+    def __call__(self) -> Any:
+        function = self.function
+        if isinstance(function, tuple):
+            module, qualname = function
+            obj: Any = import_module(module)
+            for name in qualname.split("."):
+                obj = getattr(obj, name)
+            function = obj._function if isinstance(obj, FunctionGui) else obj
+        return function(*self.args, **self.kwargs)
+
+    def dumps(self, name: str, arguments: Mapping[str, Any]) -> bytes:
+        """Return the pickled call, or raise a TypeError saying what can't be pickled.
+
+        The executor only copies the resulting bytes, so the arguments are pickled
+        once.  Only if that fails, each part is pickled to find the culprit.
+        """
+        try:
+            return pickle.dumps(self)
+        except Exception as e:
+            error = e
+        parts = [("its function", self.function)]
+        parts += [(f"argument {k!r}", v) for k, v in arguments.items()]
+        for what, obj in parts:
+            try:
+                pickle.dumps(obj)
+            except Exception as e:
+                raise TypeError(
+                    f"Cannot call {name!r} in another process: {what} can't be "
+                    f"pickled ({e})"
+                ) from None
+        raise TypeError(
+            f"Cannot call {name!r} in another process: the call can't be pickled "
+            f"({error})"
+        ) from error
+
+
+def _call_pickled(data: bytes) -> Any:
+    """Make a pickled `_CallSpec` call (in a worker process)."""
+    return pickle.loads(data)()
+
+
+@cache
+def _get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(thread_name_prefix="magicgui-map")
+
+
+class MapRun(Generic[_R]):
+    """Handle of the calls of a FunctionGui started by `FunctionGui.map`.
+
+    Iterating over this object waits for the results of the calls (in the order of
+    the parameter sets if `ordered`, otherwise as they complete), raising the
+    exception of a failed call.  Calls that were cancelled are skipped, so after
+    `cancel`, iterating yields the results of the calls that had already started.
+    Independently, each result is handled by the FunctionGui in the main thread
+    (like the result of `__call__`) until the run is cancelled.  Failed calls are
+    reported with a warning.
+    """
+
+    def __init__(
+        self,
+        gui: FunctionGui[Any, _R],
+        futures: list[Future[_R]],
+        ordered: bool,
+        progressbar: ProgressBar | None = None,
+    ) -> None:
+        self.futures = futures
+        self.ordered = ordered
+        self._gui = gui
+        self._progressbar = progressbar
+        self._cancelled = False
+        # finished calls that are not handled yet (waiting for earlier ones if ordered)
+        self._finished: dict[int, Future[_R]] = {}
+        self._next = 0
+        for i, future in enumerate(futures):
+            future.add_done_callback(partial(self._call_on_done, i))
+
+    def __len__(self) -> int:
+        """Return the number of calls."""
+        return len(self.futures)
+
+    def __iter__(self) -> Iterator[_R]:
+        """Yield the results of the calls (except cancelled ones), waiting for them."""
+        futures = self.futures if self.ordered else as_completed(self.futures)
+        for future in futures:
+            if not future.cancelled():
+                yield future.result()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the run was cancelled."""
+        return self._cancelled
+
+    def done(self) -> bool:
+        """Return whether all calls have finished (or were cancelled)."""
+        return all(f.done() for f in self.futures)
+
+    def cancel(self) -> None:
+        """Cancel the calls that have not started, and stop handling results."""
+        self._cancelled = True
+        for future in self.futures:
+            future.cancel()
+        if self._progressbar is not None:
+            self._progressbar.hide()
+
+    def _call_on_done(self, index: int, future: Future[_R]) -> None:
+        # called in the thread of the call (or the main thread if cancelled)
+        self._gui.__magicgui_app__.call_in_main_thread(
+            partial(self._on_done, index, future)
+        )
+
+    def _on_done(self, index: int, future: Future[_R]) -> None:
+        if self._cancelled:
+            return
+        if self._progressbar is not None:
+            self._progressbar.increment(1)
+        if not self.ordered:
+            self._handle(index, future)
+            return
+        self._finished[index] = future
+        while self._next in self._finished:
+            self._handle(self._next, self._finished.pop(self._next))
+            self._next += 1
+
+    def _handle(self, index: int, future: Future[_R]) -> None:
+        if future.cancelled():
+            return
+        try:
+            value = future.result()
+        except Exception as e:
+            # (called from the event loop, there is no caller to point at)
+            warnings.warn(
+                f"Call of {self._gui._callable_name!r} with parameter set {index} "
+                f"failed: {e!r}",
+                stacklevel=1,
+            )
+            return
+        self._gui._on_result(value)
+
+
 class FunctionGui(Container, Generic[_P, _R]):
     """Wrapper for a container of widgets representing a callable object.
 
@@ -174,13 +500,12 @@ class FunctionGui(Container, Generic[_P, _R]):
         elif not isinstance(param_options, dict):
             raise TypeError("'param_options' must be a dict of dicts")
 
-        sig = magic_signature(
-            function, gui_options=param_options, raise_on_unknown=raise_on_unknown
+        template = _FunctionGuiTemplate.get(
+            function, param_options, raise_on_unknown, tooltips, app, type_map
         )
-        self._return_annotation = resolve_single_type(sig.return_annotation)
+        self._template = template
+        self._return_annotation = template.return_annotation
         self._tooltips = tooltips
-        if tooltips:
-            _inject_tooltips_from_docstrings(function.__doc__, sig)
 
         self.persist = persist
         self._function = function
@@ -204,7 +529,7 @@ class FunctionGui(Container, Generic[_P, _R]):
             scrollable=scrollable,
             labels=labels,
             visible=visible,
-            widgets=list(sig.widgets(app, type_map).values()),
+            widgets=template.widgets(),
             name=name or self._callable_name,
         )
         self._type_map = type_map
@@ -217,6 +542,8 @@ class FunctionGui(Container, Generic[_P, _R]):
         self._tqdm_pbars: deque[ProgressBar] = deque()
         # the nesting level of tqdm_mgui iterators in a given __call__
         self._tqdm_depth: int = 0
+        # created by the first call of `map` in a visible gui
+        self._map_progressbar: ProgressBar | None = None
 
         if call_button is None:
             call_button = not auto_call
@@ -350,17 +677,111 @@ class FunctionGui(Container, Generic[_P, _R]):
         with _function_name_pointing_to_widget(self):
             value = self._function(*bound.args, **bound.kwargs)
 
+        self._on_result(value)
+        return value
+
+    def _on_result(self, value: Any) -> None:
+        """Show `value`, pass it to the return type callbacks and emit `called`."""
         self._call_count += 1
         if self._result_widget is not None:
             with self._result_widget.changed.blocked():
                 self._result_widget.value = value
 
-        return_type = sig.return_annotation
+        return_type = self.return_annotation
         if return_type:
             for callback in self._type_map.type2callback(return_type):
                 callback(self, value, return_type)
         self.called.emit(value)
-        return value
+
+    def map(
+        self,
+        param_sets: Iterable[Mapping[str, Any] | Sequence[Any]],
+        executor: Executor | Literal["process"] | None = None,
+        ordered: bool = True,
+    ) -> MapRun[_R]:
+        """Call the function once for each parameter set, in the background.
+
+        Each parameter set (a mapping of parameter names to values, or a sequence of
+        positional arguments) is bound like the arguments of `__call__`: parameters
+        that it doesn't provide take the current values of the gui.  The calls are
+        submitted to `executor` (by default, a thread pool shared by all
+        FunctionGuis).  For CPU-bound functions, use `executor="process"` to make the
+        calls in the [process pool][magicgui.application.Application.process_pool] of
+        the application (or pass another `ProcessPoolExecutor`).  Only the function
+        (by reference) and the arguments are then sent to the worker processes, so
+        they must be picklable: the function must be defined at the top level of a
+        module.  In the main thread, each result is then handled as
+        the result of `__call__` (i.e. shown in the result widget, passed to the
+        return type callbacks, and emitted by the `called` signal), and the progress
+        is shown in a progress bar if the gui is visible.
+
+        Parameters
+        ----------
+        param_sets : Iterable[Mapping[str, Any] | Sequence[Any]]
+            Arguments of each call.
+        executor : Executor | Literal["process"] | None, optional
+            Executor in which to call the function, by default a shared thread pool.
+            If "process", the process pool of the application.
+        ordered : bool, optional
+            Whether results are handled in the order of `param_sets`, by default True.
+            Otherwise, they are handled as soon as they are available.
+
+        Returns
+        -------
+        MapRun
+            Handle of the calls, to wait for their results or to cancel them.
+
+        Raises
+        ------
+        TypeError
+            If a parameter set doesn't match the signature, or if the calls are made
+            in a process pool and the function or an argument can't be pickled.
+        ValueError
+            If `executor` is a string other than "process".
+
+        Examples
+        --------
+        ```python
+        run = gui.map({"x": x, "y": y} for x in range(10) for y in range(10))
+        run.cancel()  # calls that have not started yet will not be made
+        results = list(run)  # the results of the calls that were not cancelled
+        ```
+        """
+        if executor == "process":
+            executor = self.__magicgui_app__.process_pool
+        elif isinstance(executor, str):
+            raise ValueError(
+                f"executor must be an Executor or 'process', not {executor!r}"
+            )
+        executor = executor or _get_executor()
+        in_process = isinstance(executor, ProcessPoolExecutor)
+
+        sig = self.__signature__
+        calls: list[Callable[[], Any]] = []
+        for params in param_sets:
+            if isinstance(params, Mapping):
+                bound = sig.bind(**params)
+            else:
+                bound = sig.bind(*params)
+            bound.apply_defaults()
+            if in_process:
+                spec = _CallSpec.create(self._function, bound.args, bound.kwargs)
+                data = spec.dumps(self._callable_name, bound.arguments)
+                calls.append(partial(_call_pickled, data))
+            else:
+                calls.append(_CallSpec(self._function, bound.args, bound.kwargs))
+
+        futures: list[Future[_R]] = [executor.submit(call) for call in calls]
+
+        progressbar = None
+        if self.visible:
+            if self._map_progressbar is None:
+                self._map_progressbar = ProgressBar(gui_only=True)
+                self.append(self._map_progressbar)
+            progressbar = self._map_progressbar
+            progressbar.range = (0, len(futures))
+            progressbar.value = 0
+        return MapRun(self, futures, ordered, progressbar)
 
     def __repr__(self) -> str:
         """Return string representation of instance."""
@@ -431,10 +852,16 @@ class FunctionGui(Container, Generic[_P, _R]):
         if obj_id not in self._bound_instances:
             method = getattr(obj.__class__, self._function.__name__)
             p0 = next(iter(inspect.signature(method).parameters))
+            try:
+                # don't let the (cached) bound FunctionGui keep `obj` alive
+                bind: Any = _WeakBind(obj)
+                finalize(obj, self._bound_instances.pop, obj_id, None)
+            except TypeError:  # not weak-referenceable, keep it (and its id) alive
+                bind = obj
             prior, self._param_options = (
                 self._param_options,
                 {
-                    p0: {"bind": obj},
+                    p0: {"bind": bind},
                     **self._param_options,
                 },
             )
@@ -448,19 +875,29 @@ class FunctionGui(Container, Generic[_P, _R]):
         """Prevent setting a magicgui attribute."""
         raise AttributeError("Can't set magicgui attribute")
 
+    @property
+    def _persist_key(self) -> str:
+        name = getattr(self._function, "__qualname__", self._callable_name)
+        name = name.replace("<", "-").replace(">", "-")  # e.g. <locals>
+        return f"{self._function.__module__}.{name}"
+
     @property
     def _dump_path(self) -> Path:
         from magicgui._util import user_cache_dir
 
-        name = getattr(self._function, "__qualname__", self._callable_name)
-        name = name.replace("<", "-").replace(">", "-")  # e.g. <locals>
-        return user_cache_dir() / f"{self._function.__module__}.{name}"
+        return user_cache_dir() / self._persist_key
 
     def _dump(self, path: str | Path | None = None) -> None:
-        super()._dump(path or self._dump_path)
+        if path is not None:
+            return super()._dump(path)
+        backend = self.__magicgui_app__.persistence
+        self._dump_later(backend, self._persist_key)
 
     def _load(self, path: str | Path | None = None, quiet: bool = False) -> None:
-        super()._load(path or self._dump_path, quiet=quiet)
+        if path is not None:
+            return super()._load(path, quiet=quiet)
+        backend = self.__magicgui_app__.persistence
+        self._load_from(backend, self._persist_key, quiet=quiet)
 
 
 class MainFunctionGui(FunctionGui[_P, _R], MainWindow):
@@ -69,7 +69,10 @@ class Image(ValueWidget):
             size (1:1).  If width is provided, height is auto-set based on aspect ratio.
         format : str, optional
             Force image format type for ``imread`` when ``val`` is provided as a string,
-            by default None
+            by default None.  ``.npy`` files (and uncompressed TIFFs, if ``tifffile``
+            is installed) are memory-mapped.  If ``width`` or ``height`` is an int,
+            large files are downsampled while reading, so that only the pixels needed
+            for display are read.
 
         Raises
         ------
@@ -86,7 +89,11 @@ class Image(ValueWidget):
 
             self._image = _mpl_image.Image()
 
-        self._image.set_data(val, format=format)
+        size = (
+            width if isinstance(width, int) else None,
+            height if isinstance(height, int) else None,
+        )
+        self._image.set_data(val, format=format, size=size)
         self._image.set_clim(vmin, vmax)
         self._image.set_cmap(cmap)
         self._image.set_norm(norm)
@@ -139,6 +146,47 @@ class Image(ValueWidget):
         self._image.set_clim(vmin, vmax)
         self._widget._mgui_set_value(self._image.make_image())
 
+    def autocontrast(
+        self, percentiles: tuple[float, float] = (0, 100)
+    ) -> tuple[float, float]:
+        """Set contrast limits from percentiles of the image data.
+
+        Statistics are computed from a subsample of the data once per ``set_data``,
+        and reused for every subsequent call.
+
+        Parameters
+        ----------
+        percentiles : tuple[float, float]
+            The (low, high) percentiles of the data, in the range ``[0, 100]``, to use
+            as the min and max contrast limits.  By default ``(0, 100)``, the full
+            data range.
+
+        Returns
+        -------
+        tuple[float, float]
+            The new contrast limits.
+        """
+        if self._image is None:
+            raise RuntimeError("You add data with `set_data` before autocontrast")
+        vmin, vmax = self._image.percentile(percentiles)
+        self.set_clim(vmin, vmax)
+        return vmin, vmax
+
+    def histogram(self, bins: int = 256) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(counts, bin_edges)`` for a histogram of the image data.
+
+        The histogram is computed from the same cached subsample of the data that
+        [`autocontrast`][magicgui.widgets.Image.autocontrast] uses.
+
+        Parameters
+        ----------
+        bins : int
+            Number of equal-width bins spanning the data range, by default 256.
+        """
+        if self._image is None:
+            raise RuntimeError("You add data with `set_data` before histogram")
+        return self._image.histogram(bins)
+
     def set_cmap(self, cmap: str | Colormap | matplotlib.colors.Colormap):
         """Set colormap (for monochromatic images).
 
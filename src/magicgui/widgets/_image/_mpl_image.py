@@ -52,6 +52,7 @@ Agreement.
 """
 
 import logging
+import os
 from collections.abc import Collection
 from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Union
@@ -88,6 +89,25 @@ def _is_mpl_cmap(cmap):
         return isinstance(cmap, colors.Colormap)
 
 
+def _minmax(A: "np.ndarray", chunksize: int = 1 << 16) -> tuple:
+    """Return ``(A.min(), A.max())``, reading *A* from memory only once.
+
+    Large contiguous arrays are reduced in cache-sized blocks, so the max of each
+    block is computed while it is still in cache from the min.  NaNs propagate.
+    """
+    if A.size <= chunksize or not A.flags.c_contiguous:
+        return A.min(), A.max()
+    flat = A.reshape(-1)
+    nblocks = -(-flat.size // chunksize)
+    los = np.empty(nblocks, dtype=A.dtype)
+    his = np.empty(nblocks, dtype=A.dtype)
+    for i in range(nblocks):
+        block = flat[i * chunksize : (i + 1) * chunksize]
+        los[i] = block.min()
+        his[i] = block.max()
+    return los.min(), his.max()
+
+
 def _is_pil_image(image):
     try:
         from PIL.Image import Image
@@ -293,6 +313,34 @@ class Normalize:
             result = result[0]
         return result
 
+    def _normalize_into(self, value, out, clip=None, chunksize=1 << 16):
+        """Normalize plain ndarray *value* into the float32 buffer *out*, in place.
+
+        NOT from mpl: this is the fast path used by `ScalarMappable.to_rgba` for
+        plain (unmasked, NaN-free) arrays.  ``vmin`` and ``vmax`` must already be
+        set.  Returns *out*.
+        """
+        if clip is None:
+            clip = self.clip
+        vmin, vmax = float(self.vmin), float(self.vmax)
+        if vmin == vmax:
+            out.fill(0)
+        elif vmin > vmax:
+            raise ValueError("minvalue must be less than or equal to maxvalue")
+        elif value.dtype.itemsize <= 2 or value.dtype == np.float32:
+            # values are exactly representable as float32
+            np.subtract(value, vmin, out=out, dtype=np.float32)
+            out /= vmax - vmin
+        else:
+            # subtract in float64 (blockwise), so that large offsets keep precision
+            flat_in, flat_out = value.reshape(-1), out.reshape(-1)
+            for start in range(0, flat_in.size, chunksize):
+                block = flat_in[start : start + chunksize]
+                flat_out[start : start + chunksize] = (block - vmin) / (vmax - vmin)
+        if clip and vmin < vmax:
+            np.clip(out, 0, 1, out=out)
+        return out
+
     def autoscale(self, A):
         """Set *vmin*, *vmax* to min, max of *A*."""
         A = np.asanyarray(A)
@@ -334,6 +382,8 @@ class ScalarMappable:
             The colormap used to map normalized data values to RGBA colors.
         """
         self._A = None
+        self._A_range = None  # cached (min, max) of self._A
+        self._scratch = None  # reusable float32 buffer for normalization
         self.norm = None  # So that the setter knows we're initializing.
         self.set_norm(norm)  # The Normalize instance of this ScalarMappable.
         self.cmap = None  # So that the setter knows we're initializing.
@@ -386,10 +436,13 @@ class ScalarMappable:
                 else:
                     raise ValueError("Third dimension must be 3 or 4")
                 if xx.dtype.kind == "f":
-                    if norm and (xx.max() > 1 or xx.min() < 0):
-                        raise ValueError(
-                            "Floating point image RGB values must be in the 0..1 range."
-                        )
+                    if norm:
+                        lo, hi = self._data_range(x)
+                        if hi > 1 or lo < 0:
+                            raise ValueError(
+                                "Floating point image RGB values must be in the "
+                                "0..1 range."
+                            )
                     if bytes:
                         xx = (xx * 255).astype(np.uint8)
                 elif xx.dtype == np.uint8:
@@ -406,12 +459,61 @@ class ScalarMappable:
             pass
 
         # This is the normal case, mapping a scalar array:
+        normed = self._fast_norm(x) if norm else None
+        if normed is not None:
+            return self.cmap(normed, bytes=bytes)
         x = np.ma.asarray(x)
         if norm:
             x = self.norm(x)
         rgba = self.cmap(x, bytes=bytes)
         return rgba
 
+    # NOT from mpl
+    def _data_range(self, x):
+        """Return ``(min, max)`` of *x*, cached if *x* is the current array."""
+        if x is not self._A:
+            return _minmax(x)
+        if self._A_range is None:
+            self._A_range = _minmax(x)
+        return self._A_range
+
+    # NOT from mpl
+    def _fast_norm(self, x, out=None):
+        """Normalize *x* without masked arrays, or return None if not possible.
+
+        The fast path applies to plain numeric ndarrays without NaNs, normalized
+        with a (non-subclassed) `Normalize`.  Data is normalized in float32, into
+        *out* if given, or else into a scratch buffer that is reused across calls.
+        """
+        if not self._prepare_fast_norm(x):
+            return None
+        if out is None:
+            if self._scratch is None or self._scratch.shape != x.shape:
+                self._scratch = np.empty(x.shape, dtype=np.float32)
+            out = self._scratch
+        return self.norm._normalize_into(x, out)
+
+    # NOT from mpl
+    def _prepare_fast_norm(self, x) -> bool:
+        """Return whether `_fast_norm` can be used for *x*, autoscaling the norm."""
+        norm = self.norm
+        if (
+            type(x) is not np.ndarray
+            or type(norm) is not Normalize
+            or x.dtype.kind not in "biuf"
+            or x.size == 0
+        ):
+            return False
+        if x.dtype.kind == "f" or not norm.scaled():
+            lo, hi = self._data_range(x)
+            if np.isnan(lo) or np.isnan(hi):
+                return False
+            if norm.vmin is None:
+                norm.vmin = lo
+            if norm.vmax is None:
+                norm.vmax = hi
+        return True
+
     def get_cmap(self):
         """Return the `.Colormap` instance."""
         return self.cmap
@@ -488,7 +590,11 @@ class ScalarMappable:
         """
         if self._A is None:
             raise TypeError("You must first set_array for mappable")
-        self.norm.autoscale(self._A)
+        if type(self.norm) is Normalize:
+            # NOT from mpl: reuse the cached data range
+            self.norm.vmin, self.norm.vmax = self._data_range(self._A)
+        else:
+            self.norm.autoscale(self._A)
         self.changed()
 
     def autoscale_None(self):
@@ -506,14 +612,25 @@ class ScalarMappable:
 
 
 class Image(ScalarMappable):
+    #: NOT from mpl: monochromatic images with at least this many pixels are
+    #: normalized and colormapped in row bands on a thread pool (numpy releases
+    #: the GIL for these operations).  The output is identical to the serial path.
+    #: Set to ``None`` to disable.
+    parallel_threshold: Optional[int] = 4_000_000
+    #: NOT from mpl: maximum number of pixels sampled for `percentile` and
+    #: `histogram` statistics.
+    stats_sample_size: int = 1 << 20
+
     def __init__(self, cmap=None, norm=None):
         super().__init__(norm, cmap)
         self._imcache = None
+        self._sample = None  # sorted, NaN-free subsample of self._A
 
     def set_data(
         self,
         A: Union[str, "Path", "np.ndarray", "PIL.Image.Image"],
         format: Optional[str] = None,
+        size: Optional[tuple[Optional[int], Optional[int]]] = None,
     ):
         """Set the image array.
 
@@ -522,13 +639,18 @@ class Image(ScalarMappable):
         Parameters
         ----------
         A : array-like or `PIL.Image.Image`
+        format : str, optional
+            Image format passed to `imread` if *A* is a filename.
+        size : tuple of (int or None, int or None), optional
+            Display ``(width, height)`` passed to `imread` if *A* is a filename.
         """
         from pathlib import Path
 
         if isinstance(A, Path):
             A = str(A)
+        loaded = isinstance(A, str) or _is_pil_image(A)
         if isinstance(A, str):
-            A = imread(A, format=format)
+            A = imread(A, format=format, size=size)
         elif _is_pil_image(A):
             A = pil_to_array(A)  # Needed e.g. to apply png palette.
 
@@ -538,7 +660,14 @@ class Image(ScalarMappable):
             )
 
         # self._A = cbook.safe_masked_invalid(A, copy=True)
-        self._A = A.copy()
+        if not loaded:
+            self._A = A.copy()
+        elif isinstance(A, np.memmap):
+            # read the (possibly strided) memory-mapped pixels exactly once
+            self._A = np.array(A)
+        else:
+            # freshly loaded from a file: no need to copy
+            self._A = A
 
         if self._A.dtype != np.uint8 and not np.can_cast(
             self._A.dtype, float, "same_kind"
@@ -559,27 +688,91 @@ class Image(ScalarMappable):
                 "(monochromatic), or 3D: MxNx3 (RGB) or MxNx4 (RGBA)"
             )
 
-        if self._A.ndim == 3:
+        self._A_range = None
+        if self._A.ndim == 3 and self._A.dtype != np.uint8:
             # If the input data has values outside the valid range (after
             # normalisation), we issue a warning and then clip X to the bounds
             # - otherwise casting wraps extreme values, hiding outliers and
             # making reliable interpretation impossible.
             high = 255 if np.issubdtype(self._A.dtype, np.integer) else 1
-            if self._A.min() < 0 or high < self._A.max():
+            lo, hi = self._data_range(self._A)
+            if lo < 0 or high < hi:
                 _log.warning(
                     "Clipping input data to the valid range for imshow with "
                     "RGB data ([0..1] for floats or [0..255] for integers)."
                 )
-                self._A = np.clip(self._A, 0, high)
+                if self._A.flags.writeable:  # our own copy, so clip in place
+                    np.clip(self._A, 0, high, out=self._A)
+                else:
+                    self._A = np.clip(self._A, 0, high)
+                self._A_range = None
             # Cast unsupported integer types to uint8
             if self._A.dtype != np.uint8 and np.issubdtype(self._A.dtype, np.integer):
                 self._A = self._A.astype(np.uint8)
 
         self._imcache = None
+        self._sample = None
 
     def changed(self):
         self._imcache = None
 
+    # NOT from mpl
+    def _sorted_sample(self):
+        """Return a sorted, NaN-free subsample of the data, cached per `set_data`."""
+        if self._sample is None:
+            if self._A is None:
+                raise TypeError("You must first set_data for image")
+            A = self._A
+            npix = A.shape[0] * A.shape[1]
+            step = int(np.ceil(np.sqrt(npix / self.stats_sample_size)))
+            sample = A[::step, ::step].ravel()
+            if sample.dtype.kind == "f":
+                sample = sample[~np.isnan(sample)]
+            self._sample = np.sort(sample)
+        return self._sample
+
+    # NOT from mpl
+    def percentile(self, q):
+        """Return percentile(s) *q* (in ``[0, 100]``) of the image data.
+
+        Percentiles are estimated from a subsample of at most `stats_sample_size`
+        pixels, which is computed once per `set_data`; the 0th and 100th
+        percentiles are the exact (cached) min and max of the data.
+        """
+        sample = self._sorted_sample()
+        if not sample.size:
+            raise ValueError("Cannot compute percentiles of an image without data")
+        q = np.asarray(q, dtype=float)
+        if np.any((q < 0) | (q > 100)):
+            raise ValueError("Percentiles must be in the range [0, 100]")
+        # linear interpolation between closest ranks of the sorted sample
+        pos = q / 100 * (sample.size - 1)
+        lo = np.floor(pos).astype(int)
+        hi = np.minimum(lo + 1, sample.size - 1)
+        # (in float64: differences of small integer types may overflow)
+        below, above = sample[lo].astype(float), sample[hi].astype(float)
+        result = below + (above - below) * (pos - lo)
+        dmin, dmax = self._data_range(self._A)
+        if not (np.isnan(dmin) or np.isnan(dmax)):
+            result = np.where(q == 0, dmin, np.where(q == 100, dmax, result))
+        return result[()]
+
+    # NOT from mpl
+    def histogram(self, bins=256):
+        """Return ``(counts, bin_edges)`` of the image data.
+
+        Like `percentile`, counts are computed from the cached subsample of at most
+        `stats_sample_size` pixels, so this never scans the full array.
+        """
+        sample = self._sorted_sample()
+        if not sample.size:
+            raise ValueError("Cannot compute a histogram of an image without data")
+        edges = np.linspace(sample[0], sample[-1], bins + 1)
+        # the sample is sorted, so bin counts are differences of insertion indices
+        idx = np.searchsorted(sample, edges, side="left")
+        idx[-1] = sample.size
+        return np.diff(idx), edges
+
     def make_image(self):
         return self._make_image(self._A)
 
@@ -608,10 +801,51 @@ class Image(ScalarMappable):
             )
 
         if self._imcache is None:
-            self._imcache = self.to_rgba(A, bytes=True, norm=(A.ndim == 2))
+            threshold = self.parallel_threshold
+            if A.ndim == 2 and threshold is not None and A.size >= threshold:
+                self._imcache = self._to_rgba_parallel(A)
+            else:
+                self._imcache = self.to_rgba(A, bytes=True, norm=(A.ndim == 2))
 
         return self._imcache
 
+    # NOT from mpl
+    def _to_rgba_parallel(self, A):
+        """Normalize and colormap 2D array *A* in row bands on a thread pool.
+
+        The result is identical to ``self.to_rgba(A, bytes=True)``: the norm is
+        autoscaled on the full array first, and the same normalization path
+        (fast or masked) is used for every band.
+        """
+        nbands = min(_n_workers(), A.shape[0])
+        fast = self._prepare_fast_norm(A)
+        if not fast:
+            self.norm.autoscale_None(A)
+            if not self.norm.scaled():
+                return self.to_rgba(A, bytes=True)
+        if nbands < 2:
+            return self.to_rgba(A, bytes=True)
+
+        if fast and (self._scratch is None or self._scratch.shape != A.shape):
+            self._scratch = np.empty(A.shape, dtype=np.float32)
+        # lazily-initialized (mpl) colormaps must be initialized before threading
+        self.cmap(np.zeros(1), bytes=True)
+        out = np.empty((*A.shape, 4), dtype=np.uint8)
+
+        def _map_band(rows: slice) -> None:
+            band = A[rows]
+            if fast:
+                normed = self.norm._normalize_into(band, self._scratch[rows])
+            else:
+                normed = self.norm(np.ma.asarray(band))
+            out[rows] = self.cmap(normed, bytes=True)
+
+        bounds = np.linspace(0, A.shape[0], nbands + 1).astype(int)
+        rows = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+        # list() re-raises the first exception from any band
+        list(_get_executor().map(_map_band, rows))
+        return out
+
 
 def pil_to_array(pilImage):
     """Load a `PIL image`_ and return it as a numpy int array.
@@ -647,6 +881,17 @@ def pil_to_array(pilImage):
         return np.asarray(pilImage)  # return MxNx4 RGBA array
 
 
+def _n_workers() -> int:
+    return min(32, os.cpu_count() or 1)
+
+
+@lru_cache
+def _get_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(_n_workers(), thread_name_prefix="magicgui-image")
+
+
 @lru_cache
 def _get_ssl_context():
     try:
@@ -658,7 +903,58 @@ def _get_ssl_context():
     return ssl.create_default_context(cafile=certifi.where())
 
 
-def imread(fname, format=None):
+def _reduction_factor(height, width, size):
+    """Return the largest integer factor keeping (*height*, *width*) >= *size*.
+
+    *size* is a ``(width, height)`` tuple, either of which may be None.
+    """
+    if size is None:
+        return 1
+    max_w, max_h = size
+    factors = []
+    if max_w:
+        factors.append(width // max_w)
+    if max_h:
+        factors.append(height // max_h)
+    return max(1, min(factors)) if factors else 1
+
+
+def _downsample(A, size):
+    """Return a strided view of *A*, reduced to no smaller than *size*."""
+    factor = _reduction_factor(A.shape[0], A.shape[1], size)
+    return A[::factor, ::factor] if factor > 1 else A
+
+
+def _tifffile_memmap(fname):
+    """Return *fname* memory-mapped with tifffile, or None if not possible."""
+    try:
+        import tifffile
+    except ImportError:
+        return None
+    try:
+        return tifffile.memmap(fname, mode="r")
+    except (ValueError, OSError):
+        # e.g. compressed or tiled data that can't be memory-mapped
+        return None
+
+
+def _pil_reduce(image, size):
+    """Return PIL *image*, decoded at (or reduced to) no smaller than *size*."""
+    factor = _reduction_factor(image.height, image.width, size)
+    if factor < 2:
+        return image
+    # JPEG (and some other) decoders can decode directly at a reduced scale
+    image.draft(image.mode, (image.width // factor, image.height // factor))
+    factor = _reduction_factor(image.height, image.width, size)
+    if factor > 1:
+        try:
+            image = image.reduce(factor)
+        except ValueError:  # image mode not supported by reduce
+            pass
+    return image
+
+
+def imread(fname, format=None, size=None):
     """Read an image from a file into an array.
 
     Parameters
@@ -670,6 +966,11 @@ def imread(fname, format=None):
         The image file format assumed for reading the data. If not
         given, the format is deduced from the filename.  If nothing can
         be deduced, PNG is tried.
+    size : tuple of (int or None, int or None), optional
+        NOT from mpl: the ``(width, height)`` at which the image will be displayed.
+        If given, large images are reduced by an integer factor while reading, so
+        that only the pixels needed for display are read (the result is never
+        smaller than ``size``).
 
     Returns
     -------
@@ -678,27 +979,21 @@ def imread(fname, format=None):
 
         - (M, N) for grayscale images.
         - (M, N, 4) for RGBA images. (RGB will be padded to RGBA)
+
+        ``.npy`` files (and uncompressed TIFF files, if tifffile is installed)
+        are returned as read-only memory-mapped arrays.
     """
     # hide imports to speed initial import on systems with slow linkers
     from pathlib import Path
     from urllib import parse
 
-    try:
-        import PIL.Image
-        import PIL.PngImagePlugin
-    except ImportError as e:  # pragma: no cover
-        msg = (
-            f"{e}. To load images from files or urls `pip install pillow`, "
-            "or use the image extra: `pip install magicgui[image]`"
-        )
-        raise type(e)(msg) from e
-
+    is_url = isinstance(fname, str) and len(parse.urlparse(fname).scheme) > 1
     if format is None:
         if isinstance(fname, str):
             parsed = parse.urlparse(fname)
             # If the string is a URL (Windows paths appear as if they have a
             # length-1 scheme), assume png.
-            if len(parsed.scheme) > 1:
+            if is_url:
                 ext = parsed.path.rsplit(".", maxsplit=1)[-1] or "png"
             else:
                 ext = Path(fname).suffix.lower()[1:]
@@ -715,28 +1010,49 @@ def imread(fname, format=None):
             ext = "png"
     else:
         ext = format
+
+    # NOT from mpl: read only what is needed from arrays that can be memory-mapped
+    if ext == "npy" and not is_url:
+        mmap_mode = "r" if isinstance(fname, str) else None
+        return _downsample(np.load(fname, mmap_mode=mmap_mode), size)
+    if ext in ("tif", "tiff") and isinstance(fname, str) and not is_url:
+        mapped = _tifffile_memmap(fname)
+        # only single images (gray or RGB(A)), stacks are read by PIL (first page)
+        if mapped is not None and (
+            mapped.ndim == 2 or (mapped.ndim == 3 and mapped.shape[-1] in (3, 4))
+        ):
+            return _downsample(mapped, size)
+
+    try:
+        import PIL.Image
+        import PIL.PngImagePlugin
+    except ImportError as e:  # pragma: no cover
+        msg = (
+            f"{e}. To load images from files or urls `pip install pillow`, "
+            "or use the image extra: `pip install magicgui[image]`"
+        )
+        raise type(e)(msg) from e
+
     img_open = PIL.PngImagePlugin.PngImageFile if ext == "png" else PIL.Image.open
-    if isinstance(fname, str):
-        parsed = parse.urlparse(fname)
-        if len(parsed.scheme) > 1:  # Pillow doesn't handle URLs directly.
-            # hide imports to speed initial import on systems with slow linkers
-            from urllib import request
-
-            ssl_ctx = _get_ssl_context()
-            if ssl_ctx is None:
-                from warnings import warn
-
-                warn(
-                    "Could not get certifi ssl context, https may not work.",
-                    stacklevel=2,
-                )
-            with request.urlopen(fname, context=ssl_ctx) as response:
-                import io
-
-                try:
-                    response.seek(0)
-                except (AttributeError, io.UnsupportedOperation):
-                    response = io.BytesIO(response.read())
-                return imread(response, format=ext)
+    if is_url:  # Pillow doesn't handle URLs directly.
+        # hide imports to speed initial import on systems with slow linkers
+        from urllib import request
+
+        ssl_ctx = _get_ssl_context()
+        if ssl_ctx is None:
+            from warnings import warn
+
+            warn(
+                "Could not get certifi ssl context, https may not work.",
+                stacklevel=2,
+            )
+        with request.urlopen(fname, context=ssl_ctx) as response:
+            import io
+
+            try:
+                response.seek(0)
+            except (AttributeError, io.UnsupportedOperation):
+                response = io.BytesIO(response.read())
+            return imread(response, format=ext, size=size)
     with img_open(fname) as image:
-        return pil_to_array(image)
+        return pil_to_array(_pil_reduce(image, size))
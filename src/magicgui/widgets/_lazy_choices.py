@@ -0,0 +1,258 @@
+"""Choices callables that avoid evaluating (or waiting for) choices repeatedly."""
+
+from __future__ import annotations
+
+import inspect
+import time
+import warnings
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Union
+from weakref import WeakKeyDictionary
+
+from magicgui.application import use_app
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from concurrent.futures import Executor, Future
+
+    from magicgui.types import ChoicesIterable
+    from magicgui.widgets.bases import CategoricalWidget
+
+    ChoicesProvider = Callable[[], Union[ChoicesIterable, Awaitable[ChoicesIterable]]]
+
+
+@cache
+def _get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="magicgui-choices")
+
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+
+def _load(provider: ChoicesProvider) -> list[tuple[str, Any]]:
+    """Call `provider` (running it to completion if async) and normalize choices."""
+    result = provider()
+    if inspect.isawaitable(result):
+        import asyncio
+
+        result = asyncio.run(_await(result))
+    return _normalize(result)
+
+
+def _normalize(choices: ChoicesIterable) -> list[tuple[str, Any]]:
+    normed = list(choices)
+    if not all(isinstance(i, tuple) and len(i) == 2 for i in normed):
+        normed = [(str(i), i) for i in normed]
+    return normed
+
+
+class LazyChoices:
+    """Choices from a slow (possibly async) provider, loaded in the background.
+
+    Use an instance as the `choices` of a categorical widget, for example
+    `ComboBox(choices=LazyChoices(query_catalog))`.  The provider is run in an
+    executor (coroutine functions are run to completion there), so creating or
+    re-parenting the widget never blocks: until the first result has arrived, the
+    widget shows the `placeholder` choices, and afterwards the cached result.  Once
+    that result is older than `ttl` seconds, it is still shown but refreshed in the
+    background.  Widgets using this object are updated whenever a new result arrives.
+
+    To keep widgets responsive with many choices, only `page_size` choices are shown
+    at first.  [`show_more`][magicgui.widgets.LazyChoices.show_more] adds another
+    page, and [`filter`][magicgui.widgets.LazyChoices.filter] restricts the choices
+    to those whose name starts with some text (for type-ahead), using a sorted index
+    of the choice names.  The current choice of a widget is always kept.
+
+    Parameters
+    ----------
+    provider : Callable[[], ChoicesIterable | Awaitable[ChoicesIterable]]
+        Callable or coroutine function, taking no arguments, that returns the
+        choices.  It is called outside of the main thread, and its result is shared
+        by all widgets using this object.
+    ttl : float | None, optional
+        Number of seconds after which the cached result is refreshed, by default 60.
+        If `None`, the result is only loaded once (see also `refresh`).
+    page_size : int | None, optional
+        Number of choices shown per page, by default 200.  If `None`, all choices are
+        shown.
+    executor : Executor | None, optional
+        Executor in which to call the provider.  By default, a thread pool shared by
+        all `LazyChoices` is used.
+    placeholder : ChoicesIterable, optional
+        Choices shown until the first result has arrived, by default none.
+    """
+
+    def __init__(
+        self,
+        provider: ChoicesProvider,
+        *,
+        ttl: float | None = 60,
+        page_size: int | None = 200,
+        executor: Executor | None = None,
+        placeholder: ChoicesIterable = (),
+    ) -> None:
+        self.provider = provider
+        self.ttl = ttl
+        self.page_size = page_size
+        self.executor = executor
+        self.placeholder = placeholder
+        self._choices: list[tuple[str, Any]] | None = None
+        self._loaded_at = 0.0
+        # sorted (casefolded name, position) pairs, for prefix lookups
+        self._index: list[tuple[str, int]] = []
+        self._pending: Future | None = None
+        self._updating = False
+        # per widget: [number of pages shown, filter prefix]
+        self._views: WeakKeyDictionary[CategoricalWidget, list] = WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"{type(self).__name__}({self.provider!r})"
+
+    def __call__(self, widget: CategoricalWidget) -> list[tuple[str, Any]]:
+        """Return the choices to show in `widget`, loading them if necessary."""
+        if widget not in self._views:
+            self._views[widget] = [1, ""]
+        # don't start another refresh while widgets are updated with a new result
+        if self.is_stale and not self._updating:
+            self.refresh()
+        if self._choices is None:
+            return _normalize(self.placeholder)
+        return self._view(widget)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the choices have not been loaded, or are older than `ttl`."""
+        if self._choices is None:
+            return True
+        return self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl
+
+    @property
+    def is_loading(self) -> bool:
+        """Whether the provider is currently running."""
+        return self._pending is not None
+
+    def refresh(self) -> None:
+        """Load the choices in the background (unless they are already loading)."""
+        if self._pending is not None:
+            return
+        app = use_app()
+        executor = self.executor or _get_executor()
+        self._pending = future = executor.submit(_load, self.provider)
+        future.add_done_callback(
+            lambda f: app.call_in_main_thread(partial(self._set_result, f))
+        )
+
+    def show_more(self, widget: CategoricalWidget) -> None:
+        """Show another page of choices in `widget`."""
+        if view := self._views.get(widget):
+            view[0] += 1
+            widget.reset_choices()
+
+    def filter(self, widget: CategoricalWidget, prefix: str) -> None:
+        """Show only choices whose name starts with `prefix` (ignoring case)."""
+        if (view := self._views.get(widget)) is not None:
+            view[:] = [1, prefix.casefold()]
+            widget.reset_choices()
+
+    def _set_result(self, future: Future) -> None:
+        self._pending = None
+        try:
+            choices = future.result()
+        except Exception as e:
+            warnings.warn(
+                f"Could not load choices from {self.provider!r}: {e!r}", stacklevel=2
+            )
+            return
+        self._choices = choices
+        self._loaded_at = time.monotonic()
+        self._index = sorted((c[0].casefold(), i) for i, c in enumerate(choices))
+        self._updating = True
+        try:
+            for widget in list(self._views):
+                if widget._default_choices is self:
+                    widget.reset_choices()
+        finally:
+            self._updating = False
+
+    def _view(self, widget: CategoricalWidget) -> list[tuple[str, Any]]:
+        """Return the filtered page(s) of choices for `widget`."""
+        choices = all_choices = self._choices or []
+        n_pages, prefix = self._views[widget]
+        if prefix:
+            index = self._index
+            matches = []
+            j = bisect_left(index, (prefix,))
+            while j < len(index) and index[j][0].startswith(prefix):
+                matches.append(index[j][1])
+                j += 1
+            matches.sort()
+            choices = [choices[i] for i in matches]
+        if self.page_size is not None:
+            choices = choices[: n_pages * self.page_size]
+
+        # never drop the current choice of the widget
+        current = widget.current_choice
+        if isinstance(current, str) and all(c[0] != current for c in choices):
+            if kept := next((c for c in all_choices if c[0] == current), None):
+                choices = [*choices, kept]
+        return choices
+
+
+class CachedChoices:
+    """Choices callable whose result is shared by all widgets of an Application.
+
+    Categorical widgets call their choices callable every time they reset their
+    choices (for instance whenever they are re-parented).  Wrapping the callable in
+    `CachedChoices` evaluates it only once for all widgets using it; the result is
+    cached on the widget's [`Application`][magicgui.application.Application] (keyed
+    by `func`) until it is discarded with
+    [`Application.invalidate_choices`][magicgui.application.Application.invalidate_choices],
+    or until `version` changes.  It may also be used as a decorator.
+
+    Parameters
+    ----------
+    func : Callable[[CategoricalWidget], ChoicesIterable]
+        The choices callable.  It is called with the first widget that needs the
+        choices, so its result should not depend on the widget.
+    version : Any, optional
+        If given, a version key for the choices: the cached result is only used while
+        it is equal to the version it was computed for.  If `version` is callable,
+        it is called (without arguments) to get the current version, so it should be
+        cheap (e.g. return a counter that is incremented whenever the choices
+        change).
+
+    Examples
+    --------
+    >>> @CachedChoices
+    ... def get_layers(widget):
+    ...     return [layer.name for layer in viewer.layers]
+    >>> ComboBox(choices=get_layers)
+    >>> use_app().invalidate_choices(get_layers)  # when the layers changed
+    """
+
+    def __init__(
+        self,
+        func: Callable[[CategoricalWidget], ChoicesIterable],
+        version: Any = None,
+    ) -> None:
+        self.func = func
+        self.version = version
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"{type(self).__name__}({self.func!r})"
+
+    def __call__(self, widget: CategoricalWidget) -> list:
+        """Return the (cached) choices for `widget`."""
+        version = self.version() if callable(self.version) else self.version
+        cache = widget.__magicgui_app__._choices_cache
+        cached = cache.get(self.func)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        choices = list(self.func(widget))
+        cache[self.func] = (version, choices)
+        return choices
@@ -53,7 +53,7 @@ from ._ranged_widget import RangedWidget, TransformedRangedWidget
 from ._slider_widget import MultiValuedSliderWidget, SliderWidget
 from ._toolbar import ToolBarWidget
 from ._value_widget import BaseValueWidget, ValueWidget
-from ._widget import Widget
+from ._widget import Widget, render_widgets
 
 __all__ = [
     "BaseContainerWidget",
@@ -72,4 +72,5 @@ __all__ = [
     "ValuedContainerWidget",
     "Widget",
     "create_widget",
+    "render_widgets",
 ]
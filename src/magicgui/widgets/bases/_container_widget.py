@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import contextlib
-from collections.abc import Iterable, Mapping, MutableSequence, Sequence
+from collections.abc import Iterable, Iterator, Mapping, MutableSequence, Sequence
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -13,6 +13,7 @@ from typing import (
     cast,
     overload,
 )
+from weakref import ref
 
 from psygnal import Signal
 
@@ -26,6 +27,7 @@ from ._button_widget import ButtonWidget
 from ._named_list import NamedList
 from ._value_widget import BaseValueWidget
 from ._widget import Widget
+from ._widget_pool import WidgetPool
 
 WidgetVar = TypeVar("WidgetVar", bound=Widget)
 T = TypeVar("T")
@@ -36,7 +38,9 @@ if TYPE_CHECKING:
 
     from typing_extensions import Unpack
 
+    from magicgui.persistence import PersistenceBackend
     from magicgui.widgets import Container, protocols
+    from magicgui.widgets._concrete import _LabeledWidget
 
     from ._widget import WidgetKwargs
 
@@ -80,6 +84,8 @@ class BaseContainerWidget(Widget, _OrientationMixin, Sequence[WidgetVar]):
 
     _widget: protocols.ContainerProtocol
     _initialized = False
+    # whether to reset the choices of all children when the parent changes
+    _reset_choices_on_parent_change = True
     # this is janky ... it's here to allow connections during __init__ by
     # avoiding a recursion error in __getattr__
     _list: NamedList[WidgetVar] = NamedList()
@@ -94,6 +100,8 @@ class BaseContainerWidget(Widget, _OrientationMixin, Sequence[WidgetVar]):
         **base_widget_kwargs: Unpack[WidgetKwargs],
     ) -> None:
         self._list: NamedList[WidgetVar] = NamedList()
+        # label wrappers of removed widgets, reused when inserting widgets
+        self._labeled_pool: WidgetPool[_LabeledWidget] = WidgetPool()
         self._labels = labels
         self._layout = layout
         self._scrollable = scrollable
@@ -101,9 +109,9 @@ class BaseContainerWidget(Widget, _OrientationMixin, Sequence[WidgetVar]):
             {"layout": layout, "scrollable": scrollable}
         )
         Widget.__init__(self, **base_widget_kwargs)
-        for index, widget in enumerate(widgets):
-            self._insert_widget(index, widget)
-        self.native_parent_changed.connect(self.reset_choices)
+        self._insert_widgets(0, widgets)
+        if self._reset_choices_on_parent_change:
+            self.native_parent_changed.connect(self.reset_choices)
         self._initialized = True
 
     def __len__(self) -> int:
@@ -202,34 +210,70 @@ class BaseContainerWidget(Widget, _OrientationMixin, Sequence[WidgetVar]):
 
     def _insert_widget(self, index: int, widget: WidgetVar) -> None:
         """Insert widget at the given index."""
-        _widget = widget
-
-        if self.labels:
-            from magicgui.widgets._concrete import _LabeledWidget
-
-            # no labels for button widgets (push buttons, checkboxes, have their own)
-            if not isinstance(widget, (_LabeledWidget, ButtonWidget)):
-                _widget = _LabeledWidget(widget)  # type: ignore
-                widget.label_changed.connect(self._unify_label_widths)
+        self._insert_widgets(index, [widget])
 
+    def _insert_widgets(self, index: int, widgets: Iterable[WidgetVar]) -> None:
+        """Insert widgets at the given index, updating the backend layout once."""
+        widgets = list(widgets)
+        if not widgets:
+            return
         if index < 0:
             index += len(self)
-        self._list.insert(index, widget)
+        index = min(index, len(self))
+        natives = [self._wrap_widget(widget) for widget in widgets]
+        for i, widget in enumerate(widgets):
+            self._list.insert(index + i, widget)
         # NOTE: if someone has manually mucked around with self.native.layout()
         # it's possible that indices will be off.
-        self._widget._mgui_insert_widget(index, _widget)
+        # backends may (optionally) implement `_mgui_insert_widgets` to update their
+        # layout only once for the whole batch
+        if insert_widgets := getattr(self._widget, "_mgui_insert_widgets", None):
+            insert_widgets(index, natives)
+        else:
+            for i, native in enumerate(natives):
+                self._widget._mgui_insert_widget(index + i, native)
         self._unify_label_widths()
 
+    def _wrap_widget(self, widget: WidgetVar) -> Widget:
+        """Return `widget`, or a label wrapper for it if this container has labels."""
+        _widget: Widget = widget
+
+        if self.labels:
+            from magicgui.widgets._concrete import _LabeledWidget
+
+            # no labels for button widgets (push buttons, checkboxes, have their own)
+            if not isinstance(widget, (_LabeledWidget, ButtonWidget)):
+                labeled = self._labeled_pool.take(_LabeledWidget)
+                if labeled is None:
+                    labeled = _LabeledWidget(widget)
+                else:
+                    labeled._set_inner_widget(widget)
+                labeled._container_ref = ref(self)
+                _widget = labeled
+        return _widget
+
     def _pop_widget(self, index: int) -> WidgetVar:
         """Remove a widget instance and return it."""
         item = self._list[index]
-        ref = getattr(item, "_labeled_widget_ref", None)
-        if ref:
-            item = item._labeled_widget_ref()  # type: ignore
-        self._widget._mgui_remove_widget(item)
+        self._remove_native(item)
         del self._list[index]
         return item
 
+    def _remove_native(self, widget: WidgetVar) -> None:
+        """Remove `widget` (or its label wrapper) from the backend container.
+
+        Label wrappers are kept in a pool, to be reused by `_insert_widget`.
+        """
+        labeled = widget._labeled_widget()
+        if labeled is None:
+            self._widget._mgui_remove_widget(widget)
+            return
+        self._widget._mgui_remove_widget(labeled)
+        labeled._container_ref = None
+        labeled._release_inner_widget()
+        if not labeled._explicitly_hidden:
+            self._labeled_pool.put(type(labeled), labeled)
+
 
 class ValuedContainerWidget(
     BaseContainerWidget[Widget], BaseValueWidget[T], Generic[T]
@@ -297,6 +341,10 @@ class ContainerWidget(BaseContainerWidget[WidgetVar], MutableSequence[WidgetVar]
         object,
         description="Emitted with `self` when any sub-widget in the container changes.",
     )
+    # names of changed children, while inside `changes_coalesced`
+    _coalesced: set[str] | None = None
+    # pickled values, as last written to (or read from) a persistence backend
+    _persisted: dict[str, bytes] | None = None
 
     def __init__(
         self,
@@ -315,8 +363,7 @@ class ContainerWidget(BaseContainerWidget[WidgetVar], MutableSequence[WidgetVar]
             **base_widget_kwargs,
         )
         for widget in self._list:
-            if isinstance(widget, (BaseValueWidget, BaseContainerWidget)):
-                widget.changed.connect(lambda: self.changed.emit(self))
+            self._connect_child(widget)
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set attribute ``name``.  Prevents changing widget if present, (use del)."""
@@ -347,19 +394,15 @@ class ContainerWidget(BaseContainerWidget[WidgetVar], MutableSequence[WidgetVar]
     def __delitem__(self, key: int | slice) -> None:
         """Delete a widget by integer or slice index."""
         if isinstance(key, slice):
-            for item in self._list[key]:
-                ref = getattr(item, "_labeled_widget_ref", None)
-                if ref:
-                    item = ref()
-                self._widget._mgui_remove_widget(item)
+            items = list(self._list[key])
         elif isinstance(key, int):
-            item = self._list[key]
-            ref = getattr(item, "_labeled_widget_ref", None)
-            if ref:
-                item = item._labeled_widget_ref()  # type: ignore
-            self._widget._mgui_remove_widget(item)
+            items = [self._list[key]]
         else:
             raise TypeError(f"list indices must be integers or slices, not {type(key)}")
+        for item in items:
+            self._remove_native(item)
+            if isinstance(item, (BaseValueWidget, BaseContainerWidget)):
+                item.changed.disconnect(self._on_child_changed)
         del self._list[key]
 
     def __setitem__(self, key: Any, value: Any) -> NoReturn:
@@ -374,10 +417,63 @@ class ContainerWidget(BaseContainerWidget[WidgetVar], MutableSequence[WidgetVar]
 
     def insert(self, key: int, widget: WidgetVar) -> None:
         """Insert widget at ``key``."""
-        if isinstance(widget, (BaseValueWidget, BaseContainerWidget)):
-            widget.changed.connect(lambda: self.changed.emit(self))
+        self._connect_child(widget)
         self._insert_widget(key, widget)
 
+    def extend(self, widgets: Iterable[WidgetVar]) -> None:
+        """Append all `widgets`, updating the layout only once.
+
+        If a subclass overrides `insert`, widgets are appended one at a time with
+        `insert` instead.
+        """
+        widgets = list(widgets)
+        if type(self).insert is not ContainerWidget.insert:
+            for widget in widgets:
+                self.insert(len(self), widget)
+            return
+        for widget in widgets:
+            self._connect_child(widget)
+        self._insert_widgets(len(self), widgets)
+
+    def _connect_child(self, widget: WidgetVar) -> None:
+        if isinstance(widget, (BaseValueWidget, BaseContainerWidget)):
+            widget.changed.connect(self._on_child_changed)
+
+    def _on_child_changed(self) -> None:
+        if self._coalesced is not None:
+            self._coalesced.add(Signal.sender().name)
+            return
+        self.changed.emit(self)
+
+    @contextlib.contextmanager
+    def changes_coalesced(self) -> Iterator[set[str]]:
+        """Context in which changes of child widgets are emitted only once.
+
+        Inside the context, changes of child widgets do not emit `changed`.  Instead,
+        the names of the changed children are collected in the yielded set, and
+        `changed` is emitted once when the (outermost) context exits, if any child
+        changed.
+
+        Examples
+        --------
+        >>> with container.changes_coalesced() as changed_names:
+        ...     container.x.value = 1
+        ...     container.y.value = 2
+        >>> changed_names
+        {'x', 'y'}
+        """
+        if self._coalesced is not None:  # nested
+            yield self._coalesced
+            return
+        names: set[str] = set()
+        self._coalesced = names
+        try:
+            yield names
+        finally:
+            self._coalesced = None
+            if names:
+                self.changed.emit(self)
+
     @property
     def __signature__(self) -> MagicSignature:
         """Return a MagicSignature object representing the current state of the gui."""
@@ -445,50 +541,74 @@ class ContainerWidget(BaseContainerWidget[WidgetVar], MutableSequence[WidgetVar]
                     wdg.value = value
         self.changed.emit(self)
 
-    @debounce
     def _dump(self, path: str | Path) -> None:
         """Dump the state of the widget to `path`."""
-        import pickle
+        from magicgui.persistence import FileBackend
+
+        self._dump_later(FileBackend(), str(path))
+
+    def _load(self, path: str | Path, quiet: bool = False) -> None:
+        """Restore the state of the widget from previously saved file at `path`."""
         from pathlib import Path
 
-        path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        _dict = {}
+        from magicgui.persistence import FileBackend
+
+        if not Path(path).exists():
+            if quiet:
+                return
+            raise FileNotFoundError(f"Widget state file does not exist: {path}")
+        self._load_from(FileBackend(), str(path), quiet=quiet)
+
+    @debounce
+    def _dump_later(self, backend: PersistenceBackend, key: str) -> None:
+        self._dump_to(backend, key)
+
+    def _dump_to(self, backend: PersistenceBackend, key: str) -> None:
+        """Write the values that changed since the last dump/load to `backend`."""
+        import pickle
+
+        last = self._persisted or {}
+        changes = {}
         for widget in self._list:
             try:
                 # not all values will be pickleable and restorable...
                 # for now, don't even try
                 _v = pickle.dumps(getattr(widget, "value", self.NO_VALUE))
-                _dict[widget.name] = _v
             except Exception:
                 continue
-
-        path.write_bytes(pickle.dumps(_dict))
-
-    def _load(self, path: str | Path, quiet: bool = False) -> None:
-        """Restore the state of the widget from previously saved file at `path`."""
+            if last.get(widget.name) != _v:
+                changes[widget.name] = _v
+        if changes:
+            backend.write(key, changes)
+            self._persisted = {**last, **changes}
+
+    def _load_from(
+        self, backend: PersistenceBackend, key: str, quiet: bool = False
+    ) -> None:
+        """Restore the state of the widget stored under `key` in `backend`."""
         import pickle
-        from pathlib import Path
-
-        path = Path(path)
-        if not path.exists():
-            if quiet:
-                return
-            raise FileNotFoundError(f"Widget state file does not exist: {path}")
 
         try:
-            data: dict = pickle.loads(path.read_bytes())
+            data = backend.read(key)
         except Exception:
             if quiet:
-                path.unlink(missing_ok=True)
+                backend.delete(key)
                 return
             raise
 
-        for key, val in data.items():
-            with contextlib.suppress(ValueError, AttributeError):
-                val = pickle.loads(val)
-                if val != self.NO_VALUE:
-                    getattr(self, key).value = val
+        # restore all values before emitting a single `changed` event
+        restored = False
+        with self.changed.blocked():
+            for name, val in data.items():
+                with contextlib.suppress(ValueError, AttributeError):
+                    wdg = getattr(self, name)
+                    val = pickle.loads(val)
+                    if val != self.NO_VALUE:
+                        wdg.value = val
+                        restored = True
+        self._persisted = data
+        if restored:
+            self.changed.emit(self)
 
 
 class MainWindowWidget(ContainerWidget):
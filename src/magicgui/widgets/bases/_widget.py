@@ -4,6 +4,7 @@ import inspect
 import warnings
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary, WeakSet
 
 from psygnal import Signal, SignalInstance
 
@@ -12,7 +13,7 @@ from magicgui.application import Application, use_app
 from magicgui.widgets import protocols
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Sequence
     from weakref import ReferenceType
 
     import numpy as np
@@ -39,6 +40,73 @@ if TYPE_CHECKING:
         description: str  # alias for label
 
 
+# widget class -> backend classes already checked against its protocol
+_CHECKED_BACKENDS: WeakKeyDictionary[type, WeakSet[type]] = WeakKeyDictionary()
+
+
+def _check_backend_protocol(widget_class: type[Widget], widget_type: type) -> None:
+    """Ensure `widget_type` implements the protocol declared by `widget_class`.
+
+    The protocol is the ``_widget`` annotation of `widget_class` (or its bases).
+    Successful checks are remembered per (widget_class, widget_type) pair, so the
+    (slow) runtime protocol check runs only once per pair.  Failures are not cached.
+    """
+    checked = _CHECKED_BACKENDS.setdefault(widget_class, WeakSet())
+    if widget_type in checked:
+        return
+    for m in widget_class.__mro__[:-1]:
+        _prot = m.__annotations__.get("_widget")
+        if _prot:
+            break
+    else:
+        raise TypeError(f"Widget type {widget_class} declared no _widget annotation")
+    if not isinstance(_prot, str):
+        _prot = _prot.__name__
+    prot = getattr(protocols, _prot.replace("protocols.", ""))
+    protocols.assert_protocol(widget_type, prot)
+    checked.add(widget_type)
+
+
+def _signal_instances_in_dict() -> bool:
+    """Return whether psygnal caches signal instances in the instance ``__dict__``."""
+
+    class _Probe:
+        signal = Signal()
+
+    probe = _Probe()
+    return probe.signal is probe.__dict__.get("signal")
+
+
+# checked once, so that signals are always created (and emitted) if psygnal stops
+# caching them this way
+_SIGNAL_INSTANCES_IN_DICT = _signal_instances_in_dict()
+
+
+def _emit_if_created(widget: Widget, name: str, *args: Any) -> None:
+    """Emit the signal `name` of `widget`, unless its instance was never created.
+
+    psygnal creates signal instances (about 1.4 KB each) on first access, and caches
+    them in the instance ``__dict__``.  A signal that was never accessed has nothing
+    connected to it, so there is no need to create its instance just to emit it.
+    """
+    if not _SIGNAL_INSTANCES_IN_DICT:
+        getattr(widget, name).emit(*args)
+    elif (signal := widget.__dict__.get(name)) is not None:
+        signal.emit(*args)
+
+
+@contextmanager
+def _blocked_if_created(widget: Widget, name: str) -> Iterator[None]:
+    """Block the signal `name` of `widget`, if its instance was created."""
+    if not _SIGNAL_INSTANCES_IN_DICT:
+        signal = getattr(widget, name)
+    elif (signal := widget.__dict__.get(name)) is None:
+        yield
+        return
+    with signal.blocked():
+        yield
+
+
 class Widget:
     """Basic Widget, wrapping a class that implements WidgetProtocol.
 
@@ -107,18 +175,7 @@ class Widget:
                 f"{type(self).__name__} got an unexpected "
                 f"keyword argument: {', '.join(extra)}"
             )
-        for m in self.__class__.__mro__[:-1]:
-            _prot = m.__annotations__.get("_widget")
-            if _prot:
-                break
-        else:
-            raise TypeError(
-                f"Widget type {self.__class__} declared no _widget annotation"
-            )
-        if not isinstance(_prot, str):
-            _prot = _prot.__name__
-        prot = getattr(protocols, _prot.replace("protocols.", ""))
-        protocols.assert_protocol(widget_type, prot)
+        _check_backend_protocol(self.__class__, widget_type)
         self.__magicgui_app__ = use_app()
         assert self.__magicgui_app__.native
         if isinstance(parent, Widget):
@@ -145,7 +202,7 @@ class Widget:
         self.enabled = enabled
         self.annotation: Any = annotation
         self.gui_only = gui_only
-        self._widget._mgui_bind_parent_change_callback(self.native_parent_changed.emit)
+        self._widget._mgui_bind_parent_change_callback(self._on_native_parent_change)
 
         # put the magicgui widget on the native object...may cause error on some backend
         self.native._magic_widget = self
@@ -155,6 +212,10 @@ class Widget:
         if visible is not None:
             self.visible = visible
 
+    def _on_native_parent_change(self, parent: Any) -> None:
+        """Called by the backend when the parent of the widget changes."""
+        _emit_if_created(self, "native_parent_changed", parent)
+
     @property
     def parent_changed(self) -> SignalInstance:
         """Signal emitted when the parent of the widget changes."""
@@ -258,7 +319,9 @@ class Widget:
     @label.setter
     def label(self, value: str) -> None:
         self._label = value
-        self.label_changed.emit(value)
+        if (labeled := self._labeled_widget()) is not None:
+            labeled._on_label_change(value)
+        _emit_if_created(self, "label_changed", value)
 
     @property
     def width(self) -> int:
@@ -393,9 +456,26 @@ class Widget:
         """Close widget."""
         self._widget._mgui_close_widget()
 
-    def render(self) -> np.ndarray:
-        """Return an RGBA (MxNx4) numpy array bitmap of the rendered widget."""
-        return self._widget._mgui_render()
+    def render(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Return an RGBA (MxNx4) numpy array bitmap of the rendered widget.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            A preallocated uint8 array of shape (M, N, 4) into which the bitmap is
+            written.  Useful to avoid allocating a new array when repeatedly
+            rendering a widget of the same size.  If provided, ``out`` is returned.
+        """
+        rendered = self._widget._mgui_render()
+        if out is None:
+            return rendered
+        if out.shape != rendered.shape:
+            raise ValueError(
+                f"Output array has shape {out.shape}, but the rendered widget has "
+                f"shape {rendered.shape}"
+            )
+        out[...] = rendered
+        return out
 
     def __repr__(self) -> str:
         """Return representation of widget of instance."""
@@ -431,3 +511,31 @@ class Widget:
         if hasattr(self.native, "_repr_mimebundle_"):
             return self.native._repr_mimebundle_(*args, **kwargs)  # type: ignore
         raise NotImplementedError()
+
+
+def render_widgets(
+    widgets: Iterable[Widget], out: Sequence[np.ndarray] | None = None
+) -> list[np.ndarray]:
+    """Return RGBA (MxNx4) numpy array bitmaps for many widgets.
+
+    Parameters
+    ----------
+    widgets : Iterable[Widget]
+        The widgets to render.
+    out : Sequence[np.ndarray], optional
+        Preallocated uint8 arrays, one per widget, into which the bitmaps are written.
+        See [`Widget.render`][magicgui.widgets.Widget.render].
+
+    Returns
+    -------
+    list[np.ndarray]
+        One bitmap per widget, in order.
+    """
+    widgets = list(widgets)
+    if out is None:
+        return [w.render() for w in widgets]
+    if len(out) != len(widgets):
+        raise ValueError(
+            f"Got {len(out)} output arrays for {len(widgets)} widgets to render."
+        )
+    return [w.render(out=o) for w, o in zip(widgets, out)]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from ._widget import Widget
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+WidgetVar = TypeVar("WidgetVar", bound=Widget)
+
+
+class WidgetPool(Generic[WidgetVar]):
+    """A bounded pool of detached widgets that may be reused instead of re-created.
+
+    Creating native backend widgets is comparatively expensive.  Containers that
+    repeatedly create and remove widgets of the same kind (such as the rows of a
+    `ListEdit`, or the label wrappers of a `Container`) can park removed widgets
+    here, grouped by a hashable key describing how they were created (e.g. widget
+    class and options), and take them back out later.  Whoever takes a widget out of
+    the pool is responsible for resetting its state.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of widgets kept per key, by default 64.  Widgets put into a
+        full pool are not kept.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self._pool: dict[Hashable, list[WidgetVar]] = {}
+
+    def __len__(self) -> int:
+        """Return the total number of pooled widgets."""
+        return sum(len(bucket) for bucket in self._pool.values())
+
+    def put(self, key: Hashable, widget: WidgetVar) -> bool:
+        """Add `widget` to the pool under `key`.  Return whether it was kept."""
+        try:
+            bucket = self._pool.setdefault(key, [])
+        except TypeError:  # unhashable key
+            return False
+        if len(bucket) >= self.maxsize:
+            return False
+        bucket.append(widget)
+        return True
+
+    def take(self, key: Hashable) -> WidgetVar | None:
+        """Remove and return a widget stored under `key`, or None if there is none."""
+        try:
+            bucket = self._pool.get(key)
+        except TypeError:  # unhashable key
+            return None
+        return bucket.pop() if bucket else None
+
+    def clear(self) -> None:
+        """Drop all pooled widgets."""
+        self._pool.clear()
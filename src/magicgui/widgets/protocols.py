@@ -640,3 +640,11 @@ class BaseApplicationBackend(ABC):
     @abstractmethod
     def _mgui_stop_timer(self) -> None:
         """Stop timer.  Should check for the existence of the timer."""
+
+    def _mgui_call_in_main_thread(self, func: Callable[[], Any]) -> None:
+        """Call `func` in the main thread (may be called from any thread).
+
+        Backends whose widgets may only be used from the main thread must override
+        this; by default `func` is called immediately.
+        """
+        func()
@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 import pytest
 
 from magicgui import magicgui, use_app, widgets
@@ -117,6 +119,97 @@ def test_delete_widget():
         container.index(a)
 
 
+def test_reuse_label_wrapper():
+    """Label wrappers of removed widgets are reused for new widgets."""
+    a = widgets.Slider(name="a", tooltip="tip")
+    container = widgets.Container(widgets=[a])
+    labeled = a._labeled_widget()
+    del container.a
+    assert a._labeled_widget() is None
+    assert labeled._inner_widget is None
+
+    b = widgets.LineEdit(name="b")
+    container.append(b)
+    assert b._labeled_widget() is labeled
+    assert labeled._label_widget.value == "b"
+    assert not labeled._label_widget.tooltip
+
+    # the removed widget no longer updates the reused wrapper
+    a.label = "A"
+    assert labeled._label_widget.value == "b"
+    b.label = "B"
+    assert labeled._label_widget.value == "B"
+
+    container.show(run=False)
+    assert b.visible
+    container.close()
+
+
+def test_container_extend():
+    """Extending a container inserts all widgets at once."""
+    container = widgets.Container(widgets=[widgets.Label(name="a")])
+    new = [widgets.LineEdit(name="b"), widgets.Slider(name="c")]
+    mock = Mock()
+    container.changed.connect(mock)
+
+    container.extend(new)
+    assert [w.name for w in container] == ["a", "b", "c"]
+    assert container.native.layout().count() == 3
+    assert container.native.updatesEnabled()
+    assert new[0]._labeled_widget() is not None
+
+    new[1].value = 3
+    mock.assert_called_once_with(container)
+    # removed widgets no longer emit the container's changed signal
+    mock.reset_mock()
+    container.remove(new[1])
+    new[1].value = 4
+    mock.assert_not_called()
+
+
+def test_container_extend_custom_insert():
+    """Subclasses overriding insert still see every widget on extend."""
+    inserted = []
+
+    class C(widgets.Container):
+        def insert(self, key, widget):
+            inserted.append(widget.name)
+            super().insert(key, widget)
+
+    c = C()
+    c.extend([widgets.Label(name="a"), widgets.Label(name="b")])
+    assert inserted == ["a", "b"]
+    assert [w.name for w in c] == ["a", "b"]
+
+
+def test_changes_coalesced():
+    """Child changes inside changes_coalesced emit changed only once."""
+    inner = widgets.Container(widgets=[widgets.Slider(name="z")], name="inner")
+    container = widgets.Container(
+        widgets=[widgets.Slider(name="x"), widgets.LineEdit(name="y"), inner]
+    )
+    mock = Mock()
+    container.changed.connect(mock)
+
+    with container.changes_coalesced() as names:
+        container.x.value = 1
+        container.y.value = "hi"
+        with container.changes_coalesced() as nested_names:
+            inner.z.value = 2
+        assert nested_names is names
+        mock.assert_not_called()
+    assert names == {"x", "y", "inner"}
+    mock.assert_called_once_with(container)
+
+    mock.reset_mock()
+    with container.changes_coalesced() as names:
+        pass
+    assert not names
+    mock.assert_not_called()
+    container.x.value = 3
+    mock.assert_called_once_with(container)
+
+
 def test_reset_choice_recursion():
     """Test that reset_choices recursion works for multiple types of widgets."""
     x = 0
@@ -213,3 +306,60 @@ def test_parent():
     assert lbl.parent is inner
     assert inner.parent is outer
     assert outer.parent is None
+
+
+# bytes per SpinBox in a labeled container (about 15.8 KB with the Qt backend,
+# before signal instances were created lazily)
+LABELED_WIDGET_BUDGET = 12_000
+
+
+def test_labeled_widget_memory():
+    import gc
+    import tracemalloc
+
+    def _build(n):
+        return widgets.Container(
+            widgets=[widgets.SpinBox(name=f"w{i}") for i in range(n)]
+        )
+
+    _build(10)  # warm up caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        container = _build(200)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # unused signals are never created
+    for w in container:
+        assert "native_parent_changed" not in vars(w)
+        assert "label_changed" not in vars(w)
+    assert size / 200 < LABELED_WIDGET_BUDGET
+
+    # but work as before once connected
+    mock = Mock()
+    container.w0.label_changed.connect(mock)
+    container.w0.label = "new"
+    mock.assert_called_once_with("new")
+    assert container.w0._labeled_widget()._label_widget.value == "new"
+
+
+def test_signal_instances_in_dict(monkeypatch):
+    """Unused signals are only skipped while psygnal caches them in ``__dict__``."""
+    from magicgui.widgets.bases import _widget
+
+    # if this fails, psygnal changed how signal instances are cached
+    assert _widget._SIGNAL_INSTANCES_IN_DICT
+    w = widgets.LineEdit()
+    assert w.label_changed is vars(w)["label_changed"]
+
+    # without that cache, signals are always emitted
+    monkeypatch.setattr(_widget, "_SIGNAL_INSTANCES_IN_DICT", False)
+    container = widgets.Container(widgets=[widgets.SpinBox(name="w0")])
+    mock = Mock()
+    container.w0.label_changed.connect(mock)
+    container.w0.label = "new"
+    mock.assert_called_once_with("new")
+    assert container.w0._labeled_widget()._label_widget.value == "new"
@@ -68,6 +68,8 @@ def test_examples(fname, monkeypatch):
         if "Numpy required to use images" in str(e):
             pytest.skip("numpy unavailable: skipping image example")
     finally:
+        # don't keep quitting the event loops of later tests
+        app._backend._mgui_stop_timer()
         if "waveform" in fname:
             type_map.TypeMap.global_instance()._type_defs.pop(int, None)
             type_map.TypeMap.global_instance()._type_defs.pop(float, None)
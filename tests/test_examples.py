@@ -9,6 +9,10 @@ EXAMPLES_DIR = Path(__file__).parent.parent / "docs" / "examples"
 EXAMPLES = sorted(EXAMPLES_DIR.rglob("*.py"))
 
 
+def _process_events(app: QApplication) -> None:
+    QApplication.processEvents()
+
+
 @pytest.mark.parametrize(
     "example",
     EXAMPLES,
@@ -17,7 +21,11 @@ EXAMPLES = sorted(EXAMPLES_DIR.rglob("*.py"))
 def test_example(qapp: QApplication, example: Path) -> None:
     """Test that each example script runs without errors."""
     assert example.is_file()
-    with patch.object(QApplication, "exec", lambda x: QApplication.processEvents()):
+    # (magicgui's Qt backend runs the event loop with `exec_`)
+    with (
+        patch.object(QApplication, "exec", _process_events),
+        patch.object(QApplication, "exec_", _process_events),
+    ):
         try:
             runpy.run_path(str(example), run_name="__main__")
         except (ModuleNotFoundError, ImportError) as e:
@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 import pytest
 from psygnal import EmitLoopError
 
@@ -145,3 +147,32 @@ def test_none_defaults():
         return 1
 
     assert factory()() == 1
+
+
+def test_factory_template(monkeypatch):
+    """Test that factory widgets are created from a template, until types change."""
+    from magicgui.type_map import TypeMap
+    from magicgui.widgets import _function_gui
+
+    class Thing: ...
+
+    def func(x: int = 1, thing: Thing = None): ...
+
+    compile_template = Mock(wraps=_function_gui.magic_signature)
+    monkeypatch.setattr(_function_gui, "magic_signature", compile_template)
+    type_map = TypeMap()
+    factory = MagicFactory(func, type_map=type_map, raise_on_unknown=False)
+
+    w1, w2 = factory(), factory()
+    assert compile_template.call_count == 1
+    assert w1.x is not w2.x
+    assert isinstance(w2.x, type(w1.x))
+
+    # with different options, only the widgets of changed parameters are re-picked
+    assert factory(x={"max": 5}).x.max == 5
+    assert factory().x.max != 5
+    assert compile_template.call_count == 1
+
+    type_map.register_type(Thing, widget_type=Slider)
+    assert isinstance(factory().thing, Slider)
+    assert compile_template.call_count == 2
@@ -4,7 +4,7 @@ import pytest
 
 from magicgui.widgets import Image
 
-_mpl_image = pytest.importorskip("magicgui._mpl_image")
+_mpl_image = pytest.importorskip("magicgui.widgets._image._mpl_image")
 np = pytest.importorskip("numpy")
 pilImage = pytest.importorskip("PIL.Image")
 
@@ -139,3 +139,141 @@ def test_mpl_norm():
     assert isinstance(rendered2, np.ndarray)
     assert rendered2.shape == (60, 60, 4)
     assert not np.allclose(rendered, rendered2)
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "uint16", "int32", "float32", "float64"])
+def test_fast_norm_matches_masked(dtype):
+    data = (np.random.rand(64, 64) * 200).astype(dtype)
+    fast = _mpl_image.Image()
+    fast.set_data(data)
+    slow = _mpl_image.Image()
+    slow.set_data(data)
+    slow._fast_norm = lambda x: None  # force the masked-array path
+
+    assert fast._fast_norm(fast._A) is not None
+    assert np.abs(fast.make_image().astype(int) - slow.make_image()).max() <= 1
+    assert fast.get_clim() == slow.get_clim()
+
+
+def test_fast_norm_large_offset():
+    # the same image, with and without a large offset
+    data = np.tile(np.linspace(0, 100, 256), (4, 1))
+    offset = _mpl_image.Image()
+    offset.set_data(data + 1e8)
+    plain = _mpl_image.Image()
+    plain.set_data(data)
+
+    assert offset._fast_norm(offset._A) is not None
+    rgba = offset.make_image()
+    assert len(np.unique(rgba[..., 0])) > 200
+    assert np.abs(rgba.astype(int) - plain.make_image()).max() <= 1
+
+
+def test_fast_norm_skips_nan():
+    data = np.random.rand(32, 32)
+    data[0, 0] = np.nan
+    image = _mpl_image.Image()
+    image.set_data(data)
+    assert image._fast_norm(image._A) is None
+
+
+def test_minmax():
+    data = np.random.rand(300, 300)
+    assert _mpl_image._minmax(data, chunksize=1000) == (data.min(), data.max())
+    strided = data[::2]
+    assert _mpl_image._minmax(strided, chunksize=1000) == (strided.min(), strided.max())
+
+
+@pytest.mark.parametrize("dtype", ["uint16", "float64"])
+def test_parallel_make_image(monkeypatch, dtype):
+    monkeypatch.setattr(_mpl_image, "_n_workers", lambda: 4)
+    data = (np.random.rand(101, 80) * 1000).astype(dtype)
+    parallel = _mpl_image.Image()
+    parallel.parallel_threshold = 10
+    parallel.set_data(data)
+    serial = _mpl_image.Image()
+    serial.parallel_threshold = None
+    serial.set_data(data)
+    np.testing.assert_array_equal(parallel.make_image(), serial.make_image())
+    assert parallel.get_clim() == serial.get_clim()
+
+
+def test_npy_memmap(tmp_path):
+    data = np.random.rand(100, 120)
+    np.save(tmp_path / "data.npy", data)
+    assert isinstance(_mpl_image.imread(str(tmp_path / "data.npy")), np.memmap)
+
+    image = Image(value=tmp_path / "data.npy")
+    assert type(image.image_data) is np.ndarray
+    np.testing.assert_array_equal(image.image_data, data)
+
+    # only the pixels needed to display at the requested size are read
+    image.set_data(tmp_path / "data.npy", width=30)
+    np.testing.assert_array_equal(image.image_data, data[::4, ::4])
+
+
+def test_tiff_memmap(tmp_path):
+    tifffile = pytest.importorskip("tifffile")
+    data = (np.random.rand(50, 60, 3) * 255).astype("uint8")
+    tifffile.imwrite(tmp_path / "rgb.tif", data)
+    mapped = _mpl_image.imread(str(tmp_path / "rgb.tif"))
+    assert isinstance(mapped, np.memmap)
+    np.testing.assert_array_equal(mapped, data)
+
+    # stacks are not memory-mapped, the first page is read instead
+    stack = (np.random.rand(3, 50, 60) * 255).astype("uint8")
+    tifffile.imwrite(tmp_path / "stack.tif", stack, photometric="minisblack")
+    image = Image(value=tmp_path / "stack.tif")
+    np.testing.assert_array_equal(image.image_data, stack[0])
+
+
+def test_imread_reduce():
+    path = str(Path(__file__).parent / "_test.jpg")
+    assert _mpl_image.imread(path).shape == (200, 232, 3)
+    reduced = _mpl_image.imread(path, size=(100, None))
+    assert reduced.shape[1] >= 100
+    assert reduced.shape[1] < 232
+    # never reduced below the requested size
+    assert _mpl_image.imread(path, size=(150, 150)).shape == (200, 232, 3)
+
+
+def test_autocontrast():
+    data = np.random.randint(0, 4000, (200, 200)).astype("uint16")
+    image = Image(value=data)
+    assert image.autocontrast() == (data.min(), data.max())
+    assert image.get_clim() == (data.min(), data.max())
+
+    vmin, vmax = image.autocontrast((1, 99))
+    assert np.allclose((vmin, vmax), np.percentile(data, (1, 99)))
+    assert image.get_clim() == (vmin, vmax)
+
+    # statistics are cached until new data is set
+    sample = image._image._sample
+    image.autocontrast((5, 95))
+    assert image._image._sample is sample
+    image.value = data.astype("float32") / 2
+    assert image._image._sample is None
+    assert image.autocontrast() == (data.min() / 2, data.max() / 2)
+
+    with pytest.raises(ValueError, match="range"):
+        image.autocontrast((-1, 101))
+
+
+def test_percentile_small_ints():
+    image = _mpl_image.Image()
+    image.set_data(np.array([[-128, 127]], dtype="int8"))
+    assert image.percentile(50) == -0.5
+
+
+def test_histogram():
+    data = np.random.rand(64, 64)
+    data[0, 0] = np.nan
+    image = _mpl_image.Image()
+    image.set_data(data)
+    counts, edges = image.histogram(bins=16)
+    expected, expected_edges = np.histogram(data[~np.isnan(data)], bins=16)
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_allclose(edges, expected_edges)
+
+    widget = Image(value=data[1:])
+    assert widget.histogram(bins=16)[0].sum() == data[1:].size
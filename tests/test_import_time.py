@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+# cumulative time of `import magicgui`, in microseconds
+IMPORT_BUDGET_US = 50_000
+HEAVY_MODULES = ["qtpy", "PyQt5", "PyQt6", "PySide2", "PySide6", "numpy", "PIL"]
+
+
+def _imported_modules(
+    code: str, modules: list[str], *flags: str
+) -> subprocess.CompletedProcess:
+    """Run `code` in a new interpreter, printing which of `modules` it imported."""
+    code += f"; import sys; print([m for m in {modules} if m in sys.modules])"
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_time():
+    modules = [*HEAVY_MODULES, "docstring_parser"]
+    result = _imported_modules("import magicgui", modules, "-X", "importtime")
+    assert result.stdout.strip() == "[]"
+
+    *_, last = result.stderr.strip().splitlines()
+    _, cumulative, name = last.split("|")
+    assert name.strip() == "magicgui"
+    assert int(cumulative) < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes():
+    result = _imported_modules(
+        "import magicgui, magicgui.widgets; "
+        "magicgui.register_type, magicgui.widgets.HBox, magicgui.__version__",
+        [*HEAVY_MODULES, "docstring_parser"],  # docstrings are merged lazily
+    )
+    assert result.stdout.strip() == "[]"
@@ -3,6 +3,12 @@
 """Tests for `magicgui` package."""
 
 import inspect
+import multiprocessing
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
 from typing import NewType, Optional, Union
 from unittest.mock import Mock
@@ -548,6 +554,71 @@ def test_function_binding_multiple():
     assert a.method_1.sigma.value == 2
 
 
+def test_function_binding_released(monkeypatch):
+    """Test that bound FunctionGuis are cloned, and don't keep their instance alive."""
+    import gc
+    import weakref
+
+    from magicgui.widgets import _function_gui
+
+    class MyObject:
+        @magicgui
+        def method(self, sigma: float = 1):
+            return self
+
+    a, b = MyObject(), MyObject()
+    assert a.method() is a
+    compile_template = Mock(wraps=_function_gui.magic_signature)
+    monkeypatch.setattr(_function_gui, "magic_signature", compile_template)
+    assert b.method() is b
+    compile_template.assert_not_called()
+    ref = weakref.ref(a)
+    del a
+    gc.collect()
+    assert ref() is None
+    assert list(MyObject.method._bound_instances) == [id(b)]
+
+
+def test_function_released():
+    """Test that the cached template of a function doesn't keep it alive."""
+    import gc
+    import weakref
+
+    data = bytearray(10)
+
+    def func(x: int = 1):
+        return len(data) + x
+
+    gui = magicgui(func)
+    assert gui() == 11
+    magicgui(func, x={"max": 5})  # derived template
+    ref = weakref.ref(func)
+    gui.close()
+    del func, gui
+    gc.collect()
+    assert ref() is None
+
+
+def test_method_released():
+    """Test that templates derived for bound methods don't keep the class alive."""
+    import gc
+    import weakref
+
+    class MyObject:
+        @magicgui
+        def method(self, sigma: float = 1):
+            return self
+
+    a = MyObject()
+    assert a.method() is a
+    ref = weakref.ref(MyObject.method._function)
+    cls_ref = weakref.ref(MyObject)
+    del a, MyObject
+    gc.collect()
+    assert ref() is None
+    assert cls_ref() is None
+
+
 def test_call_count():
     """Test that a function gui remembers how many times it's been called."""
 
@@ -563,6 +634,174 @@ def test_call_count():
     assert func.call_count == 0
 
 
+def test_map(qtbot):
+    """Test calling a function gui over parameter sets in the background."""
+
+    @magicgui(result_widget=True)
+    def func(x: int = 1, y: int = 10) -> int:
+        time.sleep(0.05 * (3 - x % 3))  # finish out of order
+        return x + y
+
+    func.y.value = 20
+    func.show()
+    results = []
+    func.called.connect(results.append)
+    run = func.map([{"x": 2}, {"x": 3, "y": 0}, (4, 5), [6]])
+    assert len(run) == 4
+    assert list(run) == [22, 3, 9, 26]
+    qtbot.waitUntil(lambda: len(results) == 4, timeout=2000)
+    assert results == [22, 3, 9, 26]  # handled in order
+    assert func.call_count == 4
+    assert func._result_widget.value == "26"
+    assert func._map_progressbar.value == 4
+    assert func._map_progressbar.max == 4
+
+    results.clear()
+    run = func.map([{"x": 3}, {"x": 2}], ordered=False)
+    assert list(run) == [22, 23]
+    qtbot.waitUntil(lambda: len(results) == 2, timeout=2000)
+    assert results == [22, 23]
+
+    with pytest.raises(TypeError):
+        func.map([{"z": 1}])  # parameters are bound before any call is made
+
+
+def test_map_cancel():
+    """Test that cancelled calls are not made, and their results not handled."""
+    started = threading.Event()
+    release = threading.Event()
+
+    @magicgui
+    def func(x: int = 0) -> int:
+        started.set()
+        release.wait(2)
+        return x
+
+    mock = Mock()
+    func.called.connect(mock)
+    executor = ThreadPoolExecutor(max_workers=1)
+    run = func.map([{"x": i} for i in range(5)], executor=executor)
+    assert started.wait(2)
+    run.cancel()
+    release.set()
+    executor.shutdown(wait=True)
+    assert run.cancelled and run.done()
+    assert sum(f.cancelled() for f in run.futures) == 4
+    mock.assert_not_called()
+    assert list(run) == [0]  # cancelled calls are skipped
+
+
+def test_map_failure(qtbot):
+    """Test that failed calls are reported with their parameter set."""
+
+    @magicgui
+    def func(x: int = 1) -> float:
+        return 1 / x
+
+    results = []
+    func.called.connect(results.append)
+    run = func.map([{"x": 2}, {"x": 0}, {"x": 4}])
+    with pytest.raises(ZeroDivisionError):
+        list(run)
+    with pytest.warns(UserWarning, match="with parameter set 1 failed"):
+        qtbot.waitUntil(lambda: len(results) == 2, timeout=2000)
+    assert results == [0.5, 0.25]
+
+
+def _sum_of_squares(n: int = 10) -> int:
+    return sum(i * i for i in range(n))
+
+
+def test_map_in_process_pool(qtbot):
+    """Test calling a function gui in the process pool of the application."""
+    gui = magicgui(_sum_of_squares)
+    app = gui.__magicgui_app__
+    app.process_pool = ProcessPoolExecutor(max_workers=2)
+    results = []
+    gui.called.connect(results.append)
+    try:
+        run = gui.map([{"n": 3}, {}, (100,)], executor="process")
+        assert list(run) == [5, 285, 328350]
+        qtbot.waitUntil(lambda: len(results) == 3, timeout=2000)
+        assert results == [5, 285, 328350]
+    finally:
+        app.process_pool = None
+
+
+def _worker_gui_backend(x: int = 0) -> tuple[str, bool]:
+    from qtpy.QtWidgets import QApplication
+
+    gui = magicgui(_sum_of_squares)  # as if created by importing a module
+    return gui.__magicgui_app__.backend_name, QApplication.instance() is None
+
+
+def test_map_in_spawned_workers():
+    """Test that worker processes don't start a GUI toolkit."""
+    from magicgui.application import init_process_pool_worker
+
+    gui = magicgui(_worker_gui_backend)
+    pool = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_process_pool_worker,
+    )
+    try:
+        assert list(gui.map([{}], executor=pool)) == [("null", True)]
+    finally:
+        pool.shutdown()
+
+
+class _Pickled:
+    count = 0
+
+    def __reduce__(self):
+        type(self).count += 1
+        return (_Pickled, ())
+
+
+def _identity(x=None):
+    return x
+
+
+def test_map_pickles_once():
+    """Test that the arguments of calls in a process pool are pickled once."""
+    pool = Mock(spec=ProcessPoolExecutor)
+    magicgui(_identity).map([{"x": _Pickled()}], executor=pool)
+    assert _Pickled.count == 1
+    submitted = pool.submit.call_args[0][0]
+    data = pickle.dumps(submitted)  # what the executor sends to a worker
+    assert _Pickled.count == 1
+    assert isinstance(pickle.loads(data)(), _Pickled)
+
+
+def test_map_unpicklable():
+    """Test that unpicklable calls are reported before any call is made."""
+
+    @magicgui
+    def local(x=1):
+        return x
+
+    pool = Mock(spec=ProcessPoolExecutor)
+    with pytest.raises(TypeError, match="its function can't be pickled"):
+        local.map([{"x": 2}], executor=pool)
+    with pytest.raises(TypeError, match="argument 'n' can't be pickled"):
+        magicgui(_sum_of_squares).map([{}, {"n": threading.Lock()}], executor=pool)
+    pool.submit.assert_not_called()
+    with pytest.raises(ValueError):
+        local.map([{}], executor="thread")
+
+
+def test_call_spec_of_decorated_function(monkeypatch):
+    """Test that functions replaced by their FunctionGui are found by name."""
+    from magicgui.widgets._function_gui import _CallSpec
+
+    gui = magicgui(_sum_of_squares)
+    monkeypatch.setattr(sys.modules[__name__], "_sum_of_squares", gui)
+    call = _CallSpec.create(gui._function, (3,), {})
+    assert call.function == (__name__, "_sum_of_squares")
+    assert pickle.loads(pickle.dumps(call))() == 5
+
+
 def test_tooltips_from_numpydoc():
     """Test that numpydocs docstrings can be used for tooltips."""
 
@@ -940,3 +1179,24 @@ def test_no_order():
 
     func()
     mock.assert_called_once()
+
+
+def test_tooltips_parsed_once():
+    """Test that the docstring of a function is only parsed once."""
+    from unittest.mock import patch
+
+    import docstring_parser
+
+    def func(x: int):
+        """Do something.
+
+        Parameters
+        ----------
+        x : int
+            The x value.
+        """
+
+    with patch.object(docstring_parser, "parse", wraps=docstring_parser.parse) as p:
+        assert magicgui(func).x.tooltip == "The x value."
+        assert magicgui(func).x.tooltip == "The x value."
+    p.assert_called_once()
@@ -0,0 +1,149 @@
+import datetime
+import subprocess
+import sys
+from enum import Enum
+from unittest.mock import Mock
+
+import pytest
+
+from magicgui import magicgui, widgets
+from magicgui.application import Application
+from magicgui.backends._null.widgets import Container as NullContainer
+
+
+@pytest.fixture(autouse=True)
+def null_app(monkeypatch):
+    app = Application("null")
+    monkeypatch.setattr(Application, "_instance", app)
+    return app
+
+
+class Medium(Enum):
+    Glass = 1
+    Water = 2
+
+
+def test_function_gui():
+    @magicgui(call_button=True)
+    def func(
+        a: int = 1,
+        b: float = 2.5,
+        c: str = "hi",
+        d: Medium = Medium.Water,
+        e: datetime.date = datetime.date(2020, 1, 1),
+        f: bool = True,
+    ):
+        return a * b
+
+    assert isinstance(func.native, NullContainer)
+    assert func() == 2.5
+    assert func.asdict() == {
+        "a": 1,
+        "b": 2.5,
+        "c": "hi",
+        "d": Medium.Water,
+        "e": datetime.date(2020, 1, 1),
+        "f": True,
+    }
+
+    mock = Mock()
+    func.changed.connect(mock)
+    func.update(a=4, d=Medium.Glass)
+    assert func() == 10
+    assert func.d.value is Medium.Glass
+    mock.assert_called_once()  # changes are coalesced
+    assert str(func.__signature__) == (
+        "(a: int = 4, b: float = 2.5, c: str = 'hi', "
+        "d: tests.test_null_backend.Medium = <Medium.Glass: 1>, "
+        "e: datetime.date = datetime.date(2020, 1, 1), f: bool = True)"
+    )
+    assert func.a.parent is func
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs, value",
+    [
+        (widgets.LineEdit, {}, "text"),
+        (widgets.TextEdit, {}, "text"),
+        (widgets.LiteralEvalLineEdit, {}, "[1, 2]"),
+        (widgets.SpinBox, {"max": 10}, 5),
+        (widgets.FloatSpinBox, {}, 1.5),
+        (widgets.Slider, {}, 5),
+        (widgets.FloatSlider, {}, 0.5),
+        (widgets.RangeSlider, {}, (2, 8)),
+        (widgets.CheckBox, {}, True),
+        (widgets.ComboBox, {"choices": ["a", "b"]}, "b"),
+        (widgets.Select, {"choices": ["a", "b"]}, ["b"]),
+        (widgets.RadioButtons, {"choices": ["a", "b"]}, "b"),
+        (widgets.DateTimeEdit, {}, datetime.datetime(2021, 1, 1, 12)),
+        (widgets.TimeEdit, {}, datetime.time(12, 30)),
+    ],
+)
+def test_value_widgets(cls, kwargs, value):
+    wdg = cls(**kwargs)
+    mock = Mock()
+    wdg.changed.connect(mock)
+    wdg.value = value
+    expected = [1, 2] if cls is widgets.LiteralEvalLineEdit else value
+    assert wdg.value == expected
+    mock.assert_called_once()
+    wdg.value = value
+    mock.assert_called_once()  # only emitted on changes
+
+
+def test_ranged_widget_clamped():
+    wdg = widgets.SpinBox(value=8, max=10)
+    wdg.max = 5
+    assert wdg.value == 5
+    with pytest.raises(ValueError):
+        wdg.value = 6
+
+
+def test_categorical_choices():
+    wdg = widgets.ComboBox(choices=["a", "b", "c"], value="b")
+    wdg.choices = ["c", "b"]
+    assert wdg.value == "b"
+    assert wdg.choices == ("b", "c")
+    wdg.choices = ["x", "y"]
+    assert wdg.value == "x"
+    wdg.del_choice("x")
+    assert wdg.value == "y"
+
+
+def test_container_parent_and_visibility():
+    lbl = widgets.Label(name="lbl")
+    inner = widgets.Container(widgets=[lbl])
+    outer = widgets.Container(widgets=[inner])
+    assert lbl.parent is inner
+    assert inner.parent is outer
+    assert not lbl.visible
+    outer.show()
+    assert lbl.visible
+    lbl.hide()
+    assert not lbl.visible and inner.visible
+
+    outer.remove(inner)
+    assert inner.parent is None
+    assert not inner.visible
+
+
+def test_table():
+    table = widgets.Table(value={"a": [1, 2], "b": [3, 4]})
+    assert table.shape == (2, 2)
+    assert table.column_headers == ("a", "b")
+    assert table.to_dict("list") == {"a": [1, 2], "b": [3, 4]}
+    table.delete_row(index=0)
+    assert table.to_dict("list") == {"a": [2], "b": [4]}
+
+
+def test_no_gui_toolkit_imported():
+    code = (
+        "from magicgui import magicgui, use_app; use_app('null'); "
+        "f = magicgui(lambda x=1, y='a': x); f.update(x=2); f(); "
+        "import sys; "
+        "print([m for m in ('qtpy', 'ipywidgets', 'numpy') if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
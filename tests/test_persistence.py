@@ -1,7 +1,7 @@
 import os
 import sys
 import time
-from unittest.mock import patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
@@ -64,3 +64,85 @@ def test_debounce():
 
     assert len(store) <= 7  # exact timing will vary on CI ... fails too much
     assert store[-1] == 9
+
+
+def test_persistence_writes_changes(tmp_path):
+    """Test that only changed values are written, and restored in one batch."""
+    from magicgui.persistence import FileBackend
+
+    def _my_func(x: int = 1, y: str = "hello"): ...
+
+    backend = FileBackend(tmp_path)
+    fg = FunctionGui(_my_func, call_button=False)
+    with patch.object(backend, "write", wraps=backend.write) as write:
+        fg._dump_to(backend, "key")
+        write.assert_called_once_with("key", {"x": ANY, "y": ANY})
+        write.reset_mock()
+        fg._dump_to(backend, "key")
+        write.assert_not_called()
+        fg.x.value = 10
+        fg._dump_to(backend, "key")
+        write.assert_called_once_with("key", {"x": ANY})
+    assert [p.name for p in tmp_path.iterdir()] == ["key"]  # no temporary files
+
+    fg2 = FunctionGui(_my_func, call_button=False)
+    mock = Mock()
+    fg2.changed.connect(mock)
+    fg2._load_from(backend, "key")
+    mock.assert_called_once_with(fg2)
+    assert fg2.asdict() == {"x": 10, "y": "hello"}
+
+    (tmp_path / "key").write_bytes(b"corrupt")
+    fg2._load_from(backend, "key", quiet=True)
+    assert not (tmp_path / "key").exists()
+
+
+def test_sqlite_backend(tmp_path):
+    from magicgui.persistence import SQLiteBackend
+
+    backend = SQLiteBackend(tmp_path / "state.sqlite")
+    assert backend.read("a") == {}
+    backend.write("a", {"x": b"1", "y": b"2"})
+    backend.write("a", {"x": b"3"})
+    backend.write("b", {"x": b"4"})
+    assert backend.read("a") == {"x": b"3", "y": b"2"}
+    backend.delete("a")
+    assert backend.read("a") == {}
+    backend.close()
+    assert SQLiteBackend(tmp_path / "state.sqlite").read("b") == {"x": b"4"}
+
+
+def test_buffered_backend(tmp_path):
+    from magicgui.persistence import BufferedBackend, FileBackend
+
+    inner = FileBackend(tmp_path)
+    backend = BufferedBackend(inner, interval=60)
+    with patch.object(inner, "read", wraps=inner.read) as read:
+        backend.write("a", {"x": b"1"})
+        assert backend.read("a") == {"x": b"1"}
+        assert backend.read("a") == {"x": b"1"}
+        read.assert_called_once()
+    assert inner.read("a") == {}  # not flushed yet
+    backend.flush()
+    assert inner.read("a") == {"x": b"1"}
+
+
+def test_app_persistence(tmp_path):
+    """Test that persisted FunctionGuis use the backend of the Application."""
+    from magicgui.application import use_app
+    from magicgui.persistence import SQLiteBackend
+
+    def _my_func(x: int = 1): ...
+
+    app = use_app()
+    prior = app.persistence
+    app.persistence = backend = SQLiteBackend(tmp_path / "state.sqlite")
+    try:
+        fg = FunctionGui(_my_func, persist=True)
+        fg._dump_to(backend, fg._persist_key)
+        fg.x.value = 5
+        fg._dump_to(backend, fg._persist_key)
+        assert FunctionGui(_my_func, persist=True).x.value == 5
+    finally:
+        app.persistence = prior
+        backend.close()
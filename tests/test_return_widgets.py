@@ -108,3 +108,27 @@ def test_table_return_annotation():
 
     assert isinstance(f._result_widget, widgets.Table)
     assert isinstance(f2._result_widget, widgets.Table)
+
+
+def test_register_table_type(monkeypatch):
+    import sys
+    import types
+
+    from magicgui.type_map import TypeMap, _type_map
+
+    class Frame: ...
+
+    # don't keep the lookup of the fake type (and `Frame`) in the global cache
+    monkeypatch.setattr(
+        _type_map, "_TABLE_TYPE_CACHE", _type_map._TABLE_TYPE_CACHE.copy()
+    )
+    type_map = TypeMap()
+    type_map.register_table_type("fake_tables.Frame")
+    assert type_map.match_return_type(Frame) is None  # module not imported
+
+    module = types.ModuleType("fake_tables")
+    module.Frame = Frame
+    monkeypatch.setitem(sys.modules, "fake_tables", module)
+    assert type_map.match_return_type(Frame) == (widgets.Table, {})
+    assert TypeMap().match_return_type(Frame) is None
+    assert "fake_tables.Frame" not in TypeMap.global_instance()._table_types
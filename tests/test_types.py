@@ -248,3 +248,28 @@ def test_multiple_type_maps():
     assert isinstance(fgui0[1], widgets.LineEdit)
     assert isinstance(fgui1[0], widgets.Slider)
     assert isinstance(fgui1[1], widgets.LineEdit)
+
+
+def test_resolve_single_type_cached(monkeypatch):
+    from magicgui import _type_resolution as tr
+
+    calls = Mock(wraps=tr._resolve_single_type)
+    monkeypatch.setattr(tr, "_resolve_single_type", calls)
+    monkeypatch.setattr(tr, "_RESOLVED", tr.OrderedDict())
+    monkeypatch.setattr(tr, "_RESOLVED_MAXSIZE", 2)
+
+    assert tr.resolve_single_type(int) is int
+    calls.assert_not_called()  # classes are returned as they are
+
+    assert tr.resolve_single_type("Optional[int]") == Optional[int]
+    assert tr.resolve_single_type("Optional[int]") == Optional[int]
+    assert calls.call_count == 1
+
+    class Local: ...
+
+    assert tr.resolve_single_type(Optional[Local]) == Optional[Local]
+    assert (Optional[Local], True) not in tr._RESOLVED
+
+    tr.resolve_single_type("list[int]")
+    tr.resolve_single_type("dict[str, int]")
+    assert len(tr._RESOLVED) == 2
@@ -2,6 +2,9 @@ import datetime
 import importlib
 import importlib.util
 import inspect
+import threading
+import time
+from concurrent.futures import Executor, Future
 from enum import Enum
 from pathlib import Path
 from typing import Annotated, Optional
@@ -64,6 +67,8 @@ WIDGETS_TO_TEST = [
         "show_file_dialog",
         "request_values",
         "create_widget",
+        "LazyChoices",
+        "CachedChoices",
     )
 ]
 
@@ -186,6 +191,27 @@ def test_custom_widget_fails():
     assert "Missing methods: {'_mgui_set_tooltip'}" in str(err)
 
 
+def test_protocol_check_cached():
+    """Protocol conformance is checked once per (widget, backend) class pair."""
+    from magicgui.widgets.bases._widget import _CHECKED_BACKENDS
+
+    widgets.Label()
+    with patch.object(
+        widgets.protocols, "assert_protocol", wraps=widgets.protocols.assert_protocol
+    ) as mock:
+        widgets.Label()
+        widgets.Label()
+        mock.assert_not_called()
+        _CHECKED_BACKENDS.clear()
+        widgets.Label()
+        mock.assert_called_once()
+
+    # failures are not cached
+    for _ in range(2):
+        with pytest.raises(TypeError, match="does not implement"):
+            widgets.create_widget(1, widget_type=MyBadWidget)  # type: ignore
+
+
 def test_extra_kwargs_error():
     """Test that unrecognized kwargs gives a FutureWarning."""
     with pytest.raises(TypeError) as wrn:
@@ -272,6 +298,27 @@ def test_tooltip():
     assert label.tooltip == "My Tooltip"
 
 
+def test_render():
+    np = pytest.importorskip("numpy")
+    label = widgets.Label(value="hi")
+    label.native.setStyleSheet("background: rgb(255, 0, 128);")
+    rendered = label.render()
+    assert rendered.dtype == np.uint8
+    assert rendered.shape == (label.native.height(), label.native.width(), 4)
+    assert tuple(rendered[0, 0]) == (255, 0, 128, 255)
+
+    out = np.zeros_like(rendered)
+    assert label.render(out=out) is out
+    np.testing.assert_array_equal(out, rendered)
+    with pytest.raises(ValueError, match="shape"):
+        label.render(out=np.zeros((1, 1, 4), dtype=np.uint8))
+
+    button = widgets.PushButton(text="ok")
+    batch = widgets.render_widgets([label, button])
+    assert [b.shape for b in batch] == [rendered.shape, button.render().shape]
+    assert widgets.render_widgets([label], out=[out])[0] is out
+
+
 def test_widget_resolves_forward_ref():
     """The annotation on a widget should always be a resolved type."""
 
@@ -812,6 +859,142 @@ def test_select_set_value():
     assert sel.value == [1, 4, 8]
 
 
+def test_combobox_choice_lookup():
+    """Choice and value lookups stay correct as the choices change."""
+    combo = widgets.ComboBox(choices=[("a", 1), ("b", [2]), ("c", 3), ("d", True)])
+    combo.value = 3
+    assert combo.current_choice == "c"
+    combo.value = [2]
+    assert combo.current_choice == "b"
+    # the first equal item wins (True == 1)
+    combo.value = True
+    assert combo.current_choice == "a"
+    assert combo.get_choice("c") == 3
+
+    combo.choices = [("c", 30), ("e", 4), ("a", 1)]
+    assert combo.current_choice == "a"
+    assert combo.get_choice("c") == 30
+    combo.value = 4
+    assert combo.current_choice == "e"
+    combo.del_choice("e")
+    assert combo.choices == (1, 30)
+
+    # changes made to the native widget are picked up too
+    if use_app().backend_name == "qt":
+        combo.native.addItem("f", 5)
+        combo.value = 5
+        assert combo.current_choice == "f"
+    combo.close()
+
+
+def test_select_set_choices():
+    sel = widgets.Select(choices=[("a", 1), ("b", [2]), ("c", 3)], value=[[2], 3])
+    assert sel.value == [[2], 3]
+    sel.choices = [("c", 30), ("d", 4), ("b", [2])]
+    assert sel.choices == ([2], 30, 4)
+    assert sel.value == [[2], 30]
+    sel.value = [4, 30]
+    assert sel.value == [30, 4]
+
+
+def test_cached_choices():
+    """Widgets sharing a CachedChoices evaluate it once per change."""
+    get_choices = MagicMock(return_value=["a", "b"])
+    choices = widgets.CachedChoices(get_choices)
+    combos = [widgets.ComboBox(choices=choices) for _ in range(3)]
+    # (keep the container: deleting it deletes the native child widgets)
+    container = Container(widgets=combos)
+    container.reset_choices()
+    get_choices.assert_called_once()
+    assert combos[2].choices == ("a", "b")
+
+    app = use_app()
+    get_choices.return_value = ["c"]
+    app.invalidate_choices(choices)
+    for combo in combos:
+        combo.reset_choices()
+    assert get_choices.call_count == 2
+    assert all(combo.choices == ("c",) for combo in combos)
+
+    # a version key invalidates the cached result when it changes
+    version = [0]
+    choices.version = lambda: version[0]
+    combos[0].reset_choices()
+    combos[1].reset_choices()
+    assert get_choices.call_count == 3
+    version[0] += 1
+    combos[0].reset_choices()
+    assert get_choices.call_count == 4
+    app.invalidate_choices()
+    assert not app._choices_cache
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def test_lazy_choices():
+    """LazyChoices are cached, paged and filtered."""
+    provider = MagicMock(return_value=["apple", "banana", "blueberry", "cherry"])
+    choices = widgets.LazyChoices(
+        provider, ttl=None, page_size=2, executor=_InlineExecutor()
+    )
+    combo = widgets.ComboBox(choices=choices)
+    assert combo.choices == ("apple", "banana")
+    combo.reset_choices()
+    combo2 = widgets.ComboBox(choices=choices)
+    assert combo2.choices == ("apple", "banana")
+    provider.assert_called_once()
+
+    choices.show_more(combo)
+    assert combo.choices == ("apple", "banana", "blueberry", "cherry")
+    assert combo2.choices == ("apple", "banana")
+    choices.filter(combo, "B")
+    assert combo.choices == ("apple", "banana", "blueberry")  # keeps current choice
+    combo.value = "blueberry"
+    choices.filter(combo, "ch")
+    assert combo.choices == ("blueberry", "cherry")
+
+    choices.ttl = 0
+    provider.return_value = ["date"]
+    combo2.reset_choices()
+    assert provider.call_count == 2
+    assert combo2.choices == ("date",)
+    assert combo.choices == ()  # nothing starts with "ch" anymore
+
+
+def test_lazy_choices_async():
+    async def provider():
+        return [("one", 1), ("two", 2)]
+
+    choices = widgets.LazyChoices(provider, executor=_InlineExecutor())
+    assert widgets.ComboBox(choices=choices).choices == (1, 2)
+
+
+@pytest.mark.skipif(use_app().backend_name != "qt", reason="only on qt")
+def test_lazy_choices_background():
+    """The provider does not block the widget, results arrive in the main thread."""
+    release = threading.Event()
+
+    def provider():
+        release.wait(5)
+        return ["a", "b"]
+
+    choices = widgets.LazyChoices(provider, placeholder=["loading..."])
+    combo = widgets.ComboBox(choices=choices)
+    assert combo.choices == ("loading...",)
+    assert choices.is_loading
+    release.set()
+    app = use_app()
+    deadline = time.monotonic() + 5
+    while choices.is_loading and time.monotonic() < deadline:
+        app.process_events()
+    assert combo.choices == ("a", "b")
+
+
 def test_slider_readeout():
     """Test that the slider readout spinbox visibility works."""
     # FIXME: ugly direct backend access.
@@ -923,6 +1106,76 @@ def test_list_edit():
     mock.assert_called_with([2, 1])
 
 
+def test_list_edit_reuses_children():
+    """Removed child widgets are reused when appending values."""
+    list_edit = widgets.ListEdit(value=[1, 2, 3])
+    last = list_edit[2]
+    mock = MagicMock()
+    list_edit.changed.connect(mock)
+
+    del list_edit[2]
+    assert list_edit.value == [1, 2]
+    list_edit.btn_plus.changed()
+    assert list_edit[2] is last
+    assert list_edit[2].value_widget.name == "value_2"
+    assert list_edit.value == [1, 2, 2]
+    mock.assert_called_with([1, 2, 2])
+    assert mock.call_count == 2
+
+    # reused children still emit and remove themselves
+    last.value = 5
+    mock.assert_called_with([1, 2, 5])
+    last.btn_minus.changed()
+    assert list_edit.value == [1, 2]
+
+    list_edit.value = [4, 5, 6]
+    assert list_edit[2] is last
+    assert list_edit.value == [4, 5, 6]
+
+    # without a value to copy, new rows start from the default value
+    list_edit.value = []
+    list_edit.btn_plus.changed()
+    assert list_edit.value == [0]
+
+
+def test_list_edit_set_value_diffs():
+    """Setting a value reuses the existing children and emits once."""
+    list_edit = widgets.ListEdit(value=[1, 2, 3])
+    children = list(list_edit[:-1])
+    mock = MagicMock()
+    list_edit.changed.connect(mock)
+
+    list_edit.value = [4, 5]
+    assert list_edit[:-1] == children[:2]
+    mock.assert_called_once_with([4, 5])
+
+    mock.reset_mock()
+    list_edit.value = list(range(10))
+    assert list_edit[:2] == children[:2]
+    assert list_edit.value == list(range(10))
+    mock.assert_called_once_with(list(range(10)))
+
+    # the list value is only computed once, for the single emission
+    with patch.object(
+        widgets.ListEdit,
+        "get_value",
+        autospec=True,
+        side_effect=widgets.ListEdit.get_value,
+    ) as get_value:
+        list_edit.value = list(range(10, 20))
+        list_edit.data[:5] = [1, 2, 3, 4, 5]
+    assert get_value.call_count == 2
+    list_edit.value = list(range(10))
+
+    # slice assignment may change the length, like a list
+    mock.reset_mock()
+    list_edit.data[2:] = [7, 8]
+    assert list_edit.value == [0, 1, 7, 8]
+    mock.assert_called_once_with([0, 1, 7, 8])
+    with pytest.raises(ValueError):
+        list_edit.data[::2] = [1]
+
+
 def test_list_edit_only_values():
     @magicgui
     def f1(x=[2, 4, 6]):  # noqa: B006